@@ -51,12 +51,16 @@ class AlertsSpec(BaseModel):
 class ClockGuard(BaseModel):
     max_offset_ms: int = 1000
 
+class IndicatorSpec(BaseModel):
+    float32: bool = False   # 스냅샷 OHLCV를 float32로(메모리 대역폭 절반, 주문 계층은 Decimal 유지)
+
 class RootConfig(BaseModel):
     version: int
     project: str
     trading: TradingSpec
     alerts: AlertsSpec = AlertsSpec()
     clock_guard: ClockGuard = ClockGuard()
+    indicators: IndicatorSpec = IndicatorSpec()
     class Config: extra = "forbid"
 
 def load_config(base_path: str, overlays: Optional[List[str]] = None) -> RootConfig:
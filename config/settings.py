@@ -28,6 +28,12 @@ BINANCE_BASE_URL = {
     "testnet": "https://testnet.binance.vision"
 }
 
+# Binance 시장 데이터 WebSocket 주소(결합 스트림 /stream?streams=...)
+BINANCE_WS_URL = {
+    "mainnet": "wss://stream.binance.com:9443",
+    "testnet": "wss://stream.testnet.binance.vision"
+}
+
 # 설정된 서버에 따라 api key를 반환하는 코드
 def get_api_config():
     env = BINANCE_ENV
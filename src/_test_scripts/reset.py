@@ -95,6 +95,9 @@ def clear_registry_file(path: str = "runtime/orders_state.json") -> Dict[str, An
         with open(tmp, "w", encoding="utf-8") as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
         os.replace(tmp, path)
+        # 남은 저널이 있으면 재시작 시 replay되므로 함께 비움
+        if os.path.exists(path + ".jsonl"):
+            os.remove(path + ".jsonl")
         return {"ok": True, "path": path}
     except Exception as e:
         return {"ok": False, "path": path, "error": str(e)}
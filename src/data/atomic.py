@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+크래시 안전 JSON 스냅샷 쓰기 (OrderManager / OrderRegistry 공용)
+- tmp에 쓰고 fsync → os.replace → 디렉터리 fsync(rename 영속화)
+- 저널을 비우는 쪽은 반드시 이 함수가 반환한 뒤에 truncate (스냅샷이 디스크에 닿기 전 저널 유실 방지)
+
+사용:
+  sha, nbytes = atomic_write_json("data/orders_state.json", state)
+  atomic_write_json(path, state, check_prev=True, expected_prev_sha=sha)   # 그 사이 다른 쓰기면 StaleStateError
+"""
+
+from __future__ import annotations
+import os, hashlib
+from typing import Any, Optional, Tuple
+
+from src.data import jsonio
+
+class StaleStateError(RuntimeError):
+    """스냅샷 파일이 마지막 로드/저장 이후 다른 쓰기로 바뀜(optimistic concurrency 실패)"""
+
+def file_sha256(path: str) -> Optional[str]:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+def atomic_write_json(path: str, obj: Any, *, pretty: bool = False, paranoid: bool = False,
+                      check_prev: bool = False, expected_prev_sha: Optional[str] = None) -> Tuple[str, int]:
+    """
+    - fsync 없이 rename만 하면 크래시 시 0바이트/잘린 파일이 남을 수 있음
+    - 기본 compact JSON, pretty=True면 indent=2(디버그용, 바이트 약 2배)
+    - paranoid=True면 rename 전 tmp를 다시 읽어 해시 검증
+    - check_prev=True면 rename 직전 현재 파일 해시가 expected_prev_sha(None=파일 없음)와 다를 때
+      StaleStateError(rename 안 함, tmp 삭제)
+    반환: (sha256 hex, 바이트 수)
+    """
+    d = os.path.dirname(path)
+    if d:
+        os.makedirs(d, exist_ok=True)
+    data = jsonio.dumps(obj, pretty=pretty)   # orjson 있으면 C 직렬화(bytes 직접), 없으면 stdlib
+    sha = hashlib.sha256(data).hexdigest()
+    tmp = path + ".tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    if paranoid:
+        with open(tmp, "rb") as f:
+            if hashlib.sha256(f.read()).hexdigest() != sha:
+                raise IOError(f"snapshot read-back hash mismatch: {tmp}")
+    if check_prev:
+        cur = file_sha256(path)
+        if cur != expected_prev_sha:
+            os.remove(tmp)
+            raise StaleStateError(f"stale_precondition: {path} expected={expected_prev_sha} current={cur}")
+    os.replace(tmp, path)
+    if hasattr(os, "O_DIRECTORY"):       # POSIX만 — 디렉터리 엔트리(rename) 영속화
+        dfd = os.open(d or ".", os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dfd)
+        finally:
+            os.close(dfd)
+    return sha, len(data)
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+append-only JSONL 저널 (WAL 스타일)
+- 변경 1건 = 1줄 {"op": str, "ts": ms, "data": {...}} → 변경당 O(Δ) 쓰기
+- fsync는 묶어서 수행(fsync_every 건 또는 fsync_interval_s 경과 시)
+- 재시작 시 replay()로 스냅샷 위에 재적용, compaction 후 truncate()
+
+사용:
+  j = Journal("runtime/orders_state.json.jsonl")
+  j.append("entry", {...})
+  for rec in j.replay(): ...
+  j.truncate()          # 스냅샷 저장 직후
+"""
+
+from __future__ import annotations
+import os, time
+from typing import Any, Dict, Iterator, Optional
+
+from src.data import jsonio
+
+class Journal:
+    def __init__(self, path: str, *, fsync_every: int = 16, fsync_interval_s: float = 1.0):
+        self.path = path
+        self.fsync_every = max(1, int(fsync_every))
+        self.fsync_interval_s = float(fsync_interval_s)
+        self.count = 0                 # 마지막 truncate 이후 기록 수(compaction 판단용)
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._fh = None
+
+    def _open(self):
+        if self._fh is None:
+            d = os.path.dirname(self.path)
+            if d:
+                os.makedirs(d, exist_ok=True)
+            self._fh = open(self.path, "ab")
+        return self._fh
+
+    def append(self, op: str, data: Dict[str, Any]) -> int:
+        """레코드 1건 추가. 반환: truncate 이후 누적 기록 수"""
+        return self.extend([(op, data)])
+
+    def extend(self, records) -> int:
+        """(op, data) 여러 건을 write 1회로 추가. 반환: truncate 이후 누적 기록 수"""
+        records = list(records)
+        if not records:
+            return self.count
+        fh = self._open()
+        ts = int(time.time() * 1000)
+        fh.write(b"".join(jsonio.dumps({"op": op, "ts": ts, "data": data}) + b"\n" for op, data in records))
+        self.count += len(records)
+        self._unsynced += len(records)
+        now = time.monotonic()
+        if self._unsynced >= self.fsync_every or now - self._last_sync >= self.fsync_interval_s:
+            self.flush()
+        else:
+            fh.flush()
+        return self.count
+
+    def flush(self, *, fsync: bool = True):
+        if self._fh is None:
+            return
+        self._fh.flush()
+        if fsync and self._unsynced:
+            os.fsync(self._fh.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def replay(self) -> Iterator[Dict[str, Any]]:
+        """
+        저널 레코드를 순서대로 반환
+        - 크래시로 잘린 마지막 줄 등 파싱 불가 줄은 건너뜀
+        """
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            return
+        n = 0
+        with f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    rec = jsonio.loads(line)
+                except Exception:
+                    continue
+                if isinstance(rec, dict) and "op" in rec:
+                    n += 1
+                    yield rec
+        self.count = n
+
+    def truncate(self):
+        """스냅샷 저장 후 호출 — 저널 비우기"""
+        self.close()
+        with open(self.path, "wb"):
+            pass
+        self.count = 0
+
+    def close(self):
+        if self._fh is not None:
+            try:
+                self.flush()
+            finally:
+                self._fh.close()
+                self._fh = None
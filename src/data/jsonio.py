@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""
+JSON 직렬화 헬퍼
+- orjson이 설치돼 있으면 사용(인코딩 2~5배 빠름, bytes 직접 반환)
+- 없으면 stdlib json으로 폴백 (동일한 bytes 인터페이스 유지)
+
+사용:
+  data = dumps(obj)                # compact bytes
+  data = dumps(obj, pretty=True)   # indent=2 (디버그용)
+  obj  = loads(data)               # bytes | str | memoryview(mmap 등)
+"""
+
+from __future__ import annotations
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
+def dumps(obj: Any, *, pretty: bool = False) -> bytes:
+    if orjson is not None:
+        opt = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            opt |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=opt)
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def loads(data: bytes | str | memoryview) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):   # stdlib json은 버퍼 객체 미지원
+        data = data.tobytes()
+    return json.loads(data)
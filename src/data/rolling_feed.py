@@ -13,16 +13,21 @@
 
 JSON 경로:
   runtime/data/{SYMBOL}/{INTERVAL}.json
+
+프로세스 공용 인스턴스:
+  get_feed() → 같은 프로세스의 진입점(main/main_trade 등)이 마감창 메모리 캐시를 공유
 """
 
 from __future__ import annotations
-import os, json, time, pathlib
+import os, json, time, pathlib, threading
 from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import numpy as np
 import pandas as pd
 
 from src.exchange.market import get_ohlcv, get_price
 from src.strategy.base import Strategy  # 타입 힌트용
+from src.data.window_store import WindowStore, OHLCV_COLS
 
 # --------- interval → ms ---------
 _INTERVAL_MS = {
@@ -45,15 +50,27 @@ def interval_to_ms(interval: str) -> int:
         raise ValueError(f"unsupported interval: {interval}")
     return _INTERVAL_MS[interval]
 
+_INTERVAL_TD = {k: pd.Timedelta(milliseconds=v) for k, v in _INTERVAL_MS.items()}   # import 시 1회 생성
+def interval_to_timedelta(interval: str) -> pd.Timedelta:
+    if interval not in _INTERVAL_TD:
+        raise ValueError(f"unsupported interval: {interval}")
+    return _INTERVAL_TD[interval]
+
 # --------- 파일 저장(JSON “작은 DB”) ---------
 @dataclass
 class JsonStore:
     root: str = "runtime/data"
+    _paths: Dict[tuple, pathlib.Path] = field(default_factory=dict, repr=False)
 
     def path(self, symbol: str, interval: str) -> pathlib.Path:
-        d = pathlib.Path(self.root) / symbol
-        d.mkdir(parents=True, exist_ok=True)
-        return d / f"{interval}.json"
+        # 매 틱 load(롤오버 확인)마다 경로 조립/mkdir 하지 않도록 (symbol, interval)당 1회만
+        key = (symbol, interval)
+        p = self._paths.get(key)
+        if p is None:
+            d = pathlib.Path(self.root) / symbol
+            d.mkdir(parents=True, exist_ok=True)
+            p = self._paths[key] = d / f"{interval}.json"
+        return p
 
     def load(self, symbol: str, interval: str) -> Dict[str, Any] | None:
         p = self.path(symbol, interval)
@@ -86,7 +103,7 @@ def bars_records_to_df(rec: List[Dict[str, Any]]) -> pd.DataFrame:
     df = pd.DataFrame(rec)
     df["open_time"] = pd.to_datetime(df["open_time"], utc=True)
     for c in ["open","high","low","close","volume"]:
-        df[c] = pd.to_numeric(df[c], errors="coerce")
+        df[c] = pd.to_numeric(df[c], errors="coerce").astype("float64", copy=False)
     df = df.dropna().sort_values("open_time").reset_index(drop=True)
     df["open_time"] = df["open_time"].dt.tz_convert(None)  # tz-naive UTC로 통일
     return df
@@ -96,10 +113,12 @@ def _normalize_ohlcv(df: pd.DataFrame) -> pd.DataFrame:
     out = df[cols].copy()
     out["open_time"] = pd.to_datetime(out["open_time"], utc=True, errors="coerce").dt.tz_convert(None)
     for c in ["open","high","low","close","volume"]:
-        out[c] = pd.to_numeric(out[c], errors="coerce")
+        out[c] = pd.to_numeric(out[c], errors="coerce").astype("float64", copy=False)  # 지표 계층은 float64 전제
     out = out.dropna(subset=cols).sort_values("open_time").reset_index(drop=True)
     return out
 
+SNAP_COLS = ("open_time", "open", "high", "low", "close", "volume")   # snapshot_frame 컬럼 순서(위치 고정)
+
 # --------- 핵심 매니저 ---------
 class RollingFeed:
     """
@@ -112,10 +131,58 @@ class RollingFeed:
       1) warm_build_or_update(symbol, interval, lookback, strategies)
       2) snapshot_with_price(symbol, interval, live_price, strategy) → 마지막 행이 '현재가 기반'
       3) 루프 중 rollover_if_needed(...)로 캐시 자동 갱신
+
+    메모리 캐시:
+      - _closed[(symbol, interval)]: 정규화 끝난 마감창 DF (매 틱 JSON 재파싱 방지)
+      - _win[interval]: 심볼 공용 SoA 링버퍼(WindowStore) — 1바 전진 롤오버는 push 1회
+      - _snap[(symbol, interval)]: 길이 N+1 스냅샷 DF(앞 N행=마감창, 마지막 1행=실시간 틱용)
+      - 모두 warm_build_or_update(롤오버 포함) 시에만 교체
     """
 
-    def __init__(self, store: JsonStore | None = None):
+    def __init__(self, store: JsonStore | None = None, *, float32: bool = False):
         self.store = store or JsonStore()
+        self.price_dtype = np.float32 if float32 else np.float64   # snapshot_frame 가격/거래량 dtype
+        self._closed: Dict[tuple, pd.DataFrame] = {}
+        self._snap: Dict[tuple, pd.DataFrame] = {}
+        self._win: Dict[str, WindowStore] = {}
+        self._lock = threading.Lock()   # _win 생성만 보호(버퍼 접근은 WindowStore 자체 락)
+
+    def _store(self, interval: str, window: int) -> WindowStore:
+        ws = self._win.get(interval)
+        if ws is None:
+            with self._lock:
+                ws = self._win.get(interval)
+                if ws is None:
+                    ws = self._win[interval] = WindowStore(max(window, 1), dtype=self.price_dtype)
+        return ws
+
+    def reserve(self, symbols: List[str], interval: str, window: int) -> None:
+        """부팅 시 loop_plan 전 심볼의 링버퍼 슬롯/창 길이 선할당(tick 스레드 중 재할당 방지)"""
+        self._store(interval, window).reserve(symbols, window)
+
+    def _set_closed(self, symbol: str, interval: str, closed: pd.DataFrame) -> None:
+        key = (symbol, interval)
+        self._closed[key] = closed
+        self._snap.pop(key, None)  # 스냅샷 DF는 다음 요청 시 재구성
+
+        n = len(closed)
+        ws = self._store(interval, n)
+        if n:
+            ot_s = closed["open_time"]
+            if ot_s.dt.tz is not None:
+                ot_s = ot_s.dt.tz_convert(None)
+            ot = ot_s.dt.as_unit("ms").to_numpy().astype(np.int64)
+            rows = closed[list(OHLCV_COLS)].to_numpy(dtype=self.price_dtype)
+        else:
+            ot, rows = np.empty(0, dtype=np.int64), np.empty((0, len(OHLCV_COLS)), dtype=self.price_dtype)
+        if symbol in ws and n >= 2:
+            prev_ot, prev_cols = ws.view(symbol)
+            # 이전 창을 1바 밀어낸 것과 같으면(정정 없음) 새 마감 1행만 push
+            if len(prev_ot) == n and np.array_equal(prev_ot[1:], ot[:-1]) \
+                    and np.array_equal(prev_cols[:, 1:], rows[:-1].T):
+                ws.push(symbol, int(ot[-1]), rows[-1])
+                return
+        ws.load(symbol, ot, rows)
 
     # 1) 초기 빌드/업데이트 (마감 캔들만, 전략들 선계산)
     def warm_build_or_update(
@@ -177,14 +244,68 @@ class RollingFeed:
             "indicators_closed": indicators_blob
         }
         self.store.save(symbol, interval, data)
+        self._set_closed(symbol, interval, closed)
         return data
 
     # 2) 캐시에서 “마감 창” 불러오기 (전략 독립적)
     def get_closed_window(self, symbol: str, interval: str) -> pd.DataFrame:
+        """
+        메모리 캐시 우선, 없으면 JSON에서 복원 후 캐시.
+        주의: 반환 DF는 캐시 공유본이므로 수정하려면 copy() 후 사용.
+        """
+        cached = self._closed.get((symbol, interval))
+        if cached is not None:
+            return cached
         js = self.store.load(symbol, interval)
         if not js:
             return pd.DataFrame(columns=["open_time","open","high","low","close","volume"])
-        return bars_records_to_df(js.get("bars_closed", []))
+        closed = bars_records_to_df(js.get("bars_closed", []))
+        self._set_closed(symbol, interval, closed)
+        return closed
+
+    def snapshot_frame(self, symbol: str, interval: str) -> pd.DataFrame:
+        """
+        역할: 실시간 스냅샷용 DF(길이 N+1, 컬럼 순서 = SNAP_COLS) 반환
+        - [:N] 은 마감창 값으로 롤오버 시 1회만 구성(OHLCV는 price_dtype, open_time은 datetime64[ms])
+        - [N] 은 synthetic 행 템플릿: open_time=마지막 마감+interval, open=마지막 종가, volume=0
+          (바 안에서는 불변) → 호출자는 매 틱 high/low/close만 iat로 덮어씀
+        - 반환 DF는 캐시 공유본 → 보관하려면 호출자가 copy()
+        """
+        key = (symbol, interval)
+        snap = self._snap.get(key)
+        if snap is not None:
+            return snap
+        if symbol not in self._win.get(interval, ()):
+            self.get_closed_window(symbol, interval)   # 메모리 캐시가 없으면 JSON에서 적재
+        ws = self._win.get(interval)
+        if ws is None or symbol not in ws:
+            return pd.DataFrame(columns=list(SNAP_COLS))
+        ot, win = ws.view(symbol)   # 링버퍼 연속 뷰(open_time ms, (5, n))
+        n = len(ot)
+        cols = {"open_time": np.empty(n + 1, dtype="datetime64[ms]")}
+        cols["open_time"][:n] = ot.view("datetime64[ms]")
+        for j, c in enumerate(OHLCV_COLS):
+            arr = np.empty(n + 1, dtype=self.price_dtype)
+            arr[:n] = win[j]
+            cols[c] = arr
+        if n:
+            last_close = cols["close"][n - 1]
+            for c in ("open", "high", "low", "close"):
+                cols[c][n] = last_close
+            cols["volume"][n] = 0.0
+        snap = pd.DataFrame(cols)
+        if n:
+            snap.iat[n, 0] = snap.iat[n - 1, 0] + interval_to_timedelta(interval)
+        self._snap[key] = snap
+        return snap
+
+    def last_closed_ms(self, symbol: str, interval: str) -> Optional[int]:
+        """메모리 마감창 마지막 바의 open_time(epoch ms), 없으면 None — WS 마감 신호 소화 확인용"""
+        ws = self._win.get(interval)
+        if ws is None or symbol not in ws:
+            return None
+        ot, _ = ws.view(symbol)
+        return int(ot[-1])
 
     # 3) 현재가 1틱을 붙여 특정 전략의 지표 즉시 계산
     def snapshot_with_price(
@@ -200,29 +321,22 @@ class RollingFeed:
           - 캐시된 마감 창에 “현재 틱” 1행을 붙여 strategy.compute_indicators(df) 계산
           - 반환 DF의 마지막 행이 현재가 기반 지표값
         """
-        closed = self.get_closed_window(symbol, interval)
-        if len(closed) == 0:
+        df_rt = self.snapshot_frame(symbol, interval)
+        n = len(df_rt) - 1
+        if n <= 0:
             raise RuntimeError("closed window is empty; call warm_build_or_update first")
 
         # 현재가 조회(없으면 REST)
         px = float(live_price) if live_price is not None else float(get_price(symbol))
 
-        # synthetic 행 생성:
-        #  - open_time: 마지막 마감 open_time + interval
-        #  - close: 현재가 px
-        #  - open/high/low: 보수적으로 마지막 close를 기준으로 px 반영
-        interval_ms = interval_to_ms(interval)
-        last_close = float(closed.iloc[-1]["close"])
-        syn = {
-            "open_time": pd.to_datetime(closed.iloc[-1]["open_time"]) + pd.Timedelta(milliseconds=interval_ms),
-            "open": last_close,
-            "high": max(last_close, px),
-            "low": min(last_close, px),
-            "close": px,
-            "volume": 0.0,
-        }
-        df_rt = pd.concat([closed, pd.DataFrame([syn])], ignore_index=True)
-        df_rt = _normalize_ohlcv(df_rt)
+        # synthetic 행: 템플릿(open_time=마지막 마감+interval, open=마지막 close, volume=0)은
+        # snapshot_frame에서 이미 타입이 정해진 채 구성됨 → 현재가 반영(high/low/close)만 기록.
+        # 마감창은 이미 정규화돼 있으므로 concat/to_datetime/to_numeric 재정규화 없음
+        df_rt = df_rt.copy()   # 캐시 공유본 보호(지표 컬럼이 추가됨)
+        last_close = float(df_rt["close"].iat[n - 1])
+        df_rt.iat[n, SNAP_COLS.index("high")] = max(last_close, px)
+        df_rt.iat[n, SNAP_COLS.index("low")] = min(last_close, px)
+        df_rt.iat[n, SNAP_COLS.index("close")] = px
 
         # 전략 지표 즉시 계산
         out = strategy.compute_indicators(df_rt)
@@ -281,3 +395,15 @@ class RollingFeed:
             self.warm_build_or_update(symbol, interval, lookback=lookback, strategies=strategies)
             return True
         return False
+
+# --------- 프로세스 공용 feed ---------
+_FEEDS: Dict[bool, RollingFeed] = {}   # float32 여부 → 인스턴스
+_FEEDS_LOCK = threading.Lock()
+
+def get_feed(*, float32: bool = False) -> RollingFeed:
+    """프로세스 내 공용 RollingFeed(진입점마다 warm/REST를 반복하지 않도록 1개만 생성)"""
+    feed = _FEEDS.get(float32)
+    if feed is None:
+        with _FEEDS_LOCK:
+            feed = _FEEDS.setdefault(float32, RollingFeed(float32=float32))
+    return feed
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+섹션별 key/value SQLite 저장소 (WAL 모드)
+- 섹션 1개 = 테이블 1개 (k TEXT PRIMARY KEY, v BLOB(JSON)) + 최상위 스칼라(version/saved_at 등)는 meta 테이블
+- write(): 변경 행만 트랜잭션 1회로 upsert/delete → 변경당 O(Δ), 내구성은 SQLite WAL이 담당
+- WAL: 다중 프로세스 동시 읽기 + 단일 writer(잠금 대기는 busy_timeout)
+
+사용:
+  st = SqliteStore("data/orders_state.db", ("entries", "ocolists"))
+  state = st.load()                         # 비어 있으면 None
+  st.write([("entries", {"k": cid, "v": {...}}), ("entries", {"k": old, "v": None})])   # v=None → 삭제
+  st.replace_all(state)                     # 전체 교체(초기화/마이그레이션)
+"""
+
+from __future__ import annotations
+import os, sqlite3, threading
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from src.data import jsonio
+
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+class SqliteStore:
+    def __init__(self, path: str, sections: Tuple[str, ...], *, synchronous: str = "NORMAL"):
+        d = os.path.dirname(path)
+        if d:
+            os.makedirs(d, exist_ok=True)
+        self.path = path
+        self.sections = tuple(sections)
+        self._lock = threading.Lock()
+        # isolation_level=None: 자동 트랜잭션 없음 → BEGIN/COMMIT 직접 관리
+        self._db = sqlite3.connect(path, isolation_level=None, check_same_thread=False, timeout=5.0)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(f"PRAGMA synchronous={synchronous}")
+        for sec in self.sections:
+            self._db.execute(f'CREATE TABLE IF NOT EXISTS "{sec}" (k TEXT PRIMARY KEY, v BLOB NOT NULL)')
+        self._db.execute("CREATE TABLE IF NOT EXISTS meta (k TEXT PRIMARY KEY, v BLOB NOT NULL)")
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """{meta 키..., 섹션: {k: v}} — 아무 행도 없으면 None(최초 생성/마이그레이션 판단용)"""
+        with self._lock:
+            out: Dict[str, Any] = {k: jsonio.loads(v) for k, v in self._db.execute("SELECT k, v FROM meta")}
+            empty = not out
+            for sec in self.sections:
+                rows = {k: jsonio.loads(v) for k, v in self._db.execute(f'SELECT k, v FROM "{sec}"')}
+                empty = empty and not rows
+                out[sec] = rows
+        return None if empty else out
+
+    def write(self, records: Iterable[Tuple[str, Dict[str, Any]]], meta: Optional[Dict[str, Any]] = None) -> int:
+        """(섹션, {"k", "v"}) 레코드를 트랜잭션 1회로 반영(v=None이면 삭제). 반환: 반영 건수"""
+        n = 0
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                for sec, d in records:
+                    if d.get("v") is None:
+                        self._db.execute(f'DELETE FROM "{sec}" WHERE k = ?', (d["k"],))
+                    else:
+                        self._db.execute(f'INSERT OR REPLACE INTO "{sec}" (k, v) VALUES (?, ?)',
+                                         (d["k"], jsonio.dumps(d["v"])))
+                    n += 1
+                if meta:
+                    self._db.executemany("INSERT OR REPLACE INTO meta (k, v) VALUES (?, ?)",
+                                         [(k, jsonio.dumps(v)) for k, v in meta.items()])
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        return n
+
+    def replace_all(self, state: Dict[str, Any]) -> None:
+        """전체 상태로 모든 테이블 교체(트랜잭션 1회)"""
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                self._db.execute("DELETE FROM meta")
+                self._db.executemany("INSERT INTO meta (k, v) VALUES (?, ?)",
+                                     [(k, jsonio.dumps(v)) for k, v in state.items() if k not in self.sections])
+                for sec in self.sections:
+                    self._db.execute(f'DELETE FROM "{sec}"')
+                    self._db.executemany(f'INSERT INTO "{sec}" (k, v) VALUES (?, ?)',
+                                         [(k, jsonio.dumps(v)) for k, v in (state.get(sec) or {}).items()])
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+
+    def close(self):
+        with self._lock:
+            self._db.close()
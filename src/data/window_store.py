@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+심볼 공용 SoA 링버퍼(마감 캔들 창)
+- ohlcv[slot, col, 2*win] : 컬럼(open/high/low/close/volume)별로 연속 → 컬럼 단위 벡터 연산에 유리
+- open_time[slot, 2*win]  : epoch ms(int64)
+- 값을 물리 위치 p와 p+win 두 곳에 써서(미러링) 최근 count개가 항상 '연속 뷰'로 나옴
+  → 롤오버 1바 전진은 push() O(1), 복사/np.roll 없음
+
+사용:
+  ws = WindowStore(300)
+  ws.load("BTCUSDT", ot_ms, ohlcv)      # 최초/불연속 시 일괄 적재 (ohlcv: shape (n, 5))
+  ws.push("BTCUSDT", ot_ms, row5)       # 마감 1바 추가
+  ot, cols = ws.view("BTCUSDT")         # ot: (n,), cols: (5, n) — 버퍼 뷰(수정 금지)
+  ws.reserve(["BTCUSDT", "ETHUSDT"])    # 부팅 시 슬롯 선할당(루프 중 _grow 재할당 방지)
+
+스레드:
+  - 심볼별 tick 스레드가 동시에 load/push/view 하므로 슬롯 배정·버퍼 재할당·읽기는 _lock 하에서만
+  - view()가 돌려준 뷰는 _grow 이후에도 옛 버퍼를 가리키므로 값 자체는 일관됨(최신이 아닐 뿐)
+"""
+
+from __future__ import annotations
+import threading
+from typing import Dict, Iterable, Tuple
+import numpy as np
+
+OHLCV_COLS = ("open", "high", "low", "close", "volume")   # ohlcv 두 번째 축 순서
+
+class WindowStore:
+    def __init__(self, window: int, *, dtype=np.float64, capacity: int = 8):
+        self.window = max(1, int(window))
+        self.dtype = np.dtype(dtype)
+        self._slots: Dict[str, int] = {}
+        self._lock = threading.RLock()
+        self._alloc(max(1, capacity), self.window)
+
+    def _alloc(self, n_slots: int, window: int):
+        w2 = 2 * window
+        self.ohlcv = np.full((n_slots, len(OHLCV_COLS), w2), np.nan, dtype=self.dtype)
+        self.open_time = np.zeros((n_slots, w2), dtype=np.int64)
+        self.head = np.zeros(n_slots, dtype=np.int64)     # 다음에 쓸 논리 위치(누적)
+        self.count = np.zeros(n_slots, dtype=np.int64)    # 유효 행 수(<= limit)
+        self.limit = np.zeros(n_slots, dtype=np.int64)    # 심볼별 창 길이(load 시 길이, <= window)
+        self.window = window
+
+    def _grow(self, n_slots: int, window: int):
+        """슬롯/창 확장 — 기존 데이터는 연속 뷰로 옮겨 재적재"""
+        old = [(s, *self.view(s), int(self.limit[self._slots[s]])) for s in self._slots]
+        self._alloc(n_slots, window)
+        for s, ot, cols, lim in old:
+            i = self._slots[s]
+            self._write_bulk(i, ot, cols.T)
+            self.limit[i] = max(lim, len(ot))
+
+    def _slot(self, symbol: str) -> int:
+        i = self._slots.get(symbol)
+        if i is None:
+            i = len(self._slots)
+            if i >= self.ohlcv.shape[0]:
+                self._grow(2 * self.ohlcv.shape[0], self.window)
+            self._slots[symbol] = i
+        return i
+
+    def reserve(self, symbols: Iterable[str], window: int = 0) -> None:
+        """심볼 슬롯(+창 길이) 선할당 — 루프 중에는 슬롯 배정/버퍼 확장이 일어나지 않게"""
+        with self._lock:
+            syms = [s for s in dict.fromkeys(symbols) if s not in self._slots]
+            need = len(self._slots) + len(syms)
+            window = max(self.window, int(window))
+            if need > self.ohlcv.shape[0] or window > self.window:
+                self._grow(max(need, self.ohlcv.shape[0]), window)
+            for s in syms:
+                self._slot(s)
+
+    def _write_bulk(self, i: int, ot: np.ndarray, rows: np.ndarray):
+        n = min(len(ot), self.window)
+        ot, rows = ot[-n:], rows[-n:]
+        w = self.window
+        # 논리 위치 0..n-1 = 물리 0..n-1, 미러는 +w
+        self.open_time[i, :n] = ot
+        self.open_time[i, w:w + n] = ot
+        self.ohlcv[i, :, :n] = rows.T
+        self.ohlcv[i, :, w:w + n] = rows.T
+        self.head[i] = n
+        self.count[i] = n
+        self.limit[i] = n
+
+    # --------------- 쓰기 ----------------
+
+    def load(self, symbol: str, open_time_ms: np.ndarray, ohlcv: np.ndarray) -> None:
+        """마감창 일괄 적재 — 이 길이가 심볼의 창 길이(limit)가 됨(window 초과 시 버퍼 확장)"""
+        ot = np.asarray(open_time_ms, dtype=np.int64)
+        rows = np.asarray(ohlcv, dtype=self.dtype).reshape(len(ot), len(OHLCV_COLS))
+        with self._lock:
+            if len(ot) > self.window:
+                self._grow(self.ohlcv.shape[0], len(ot))
+            self._write_bulk(self._slot(symbol), ot, rows)
+
+    def push(self, symbol: str, open_time_ms: int, row) -> None:
+        """마감 1바 추가 — O(1), 가장 오래된 바는 창 밖으로 밀려남"""
+        with self._lock:
+            i = self._slot(symbol)
+            w = self.window
+            p = int(self.head[i] % w)
+            self.open_time[i, p] = self.open_time[i, p + w] = open_time_ms
+            self.ohlcv[i, :, p] = self.ohlcv[i, :, p + w] = row
+            self.head[i] += 1
+            self.count[i] = min(self.count[i] + 1, self.limit[i])
+
+    # --------------- 읽기 ----------------
+
+    def __contains__(self, symbol: str) -> bool:
+        """적재된(유효 행이 있는) 심볼만 True — reserve()만 된 빈 슬롯은 제외"""
+        i = self._slots.get(symbol)
+        return i is not None and self.count[i] > 0
+
+    def view(self, symbol: str) -> Tuple[np.ndarray, np.ndarray]:
+        """(open_time (n,), ohlcv (5, n)) 연속 뷰 — 시간순, 다음 push/load 전까지만 유효"""
+        with self._lock:
+            i = self._slots[symbol]
+            n = int(self.count[i])
+            start = int((self.head[i] - n) % self.window)
+            return self.open_time[i, start:start + n], self.ohlcv[i, :, start:start + n]
@@ -1,5 +1,5 @@
 # src/exchange/__init__.py
-from .core import ping, server_time, sync_time
-from .market import get_price, get_exchange_info, get_ohlcv
+from .core import SESSION, ping, server_time, sync_time, BinanceAPIError
+from .market import get_price, get_prices, get_exchange_info, get_ohlcv
 from .account import get_account, get_open_orders, get_order
 from .orders import place_test_order, place_order, cancel_order, cancel_open_orders
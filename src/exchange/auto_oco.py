@@ -25,11 +25,12 @@ from typing import Optional, Dict, Any, Tuple
 
 from src.exchange.registry import OrderRegistry
 from src.exchange.orders import get_order, get_order_safe
-from src.exchange.market import get_symbol_info, get_price
-from src.exchange.filters import extract_filters, normalize_price, to_api_str
+from src.exchange.market import get_price
+from src.exchange.filters import normalize_price, to_api_str
 from src.order_executor import (
     market_buy_by_quote,  # 시장가 매수(quote 기반)
-    oco_sell_tp_sl        # OCO 부착(SELL TP/SL)
+    oco_sell_tp_sl,       # OCO 부착(SELL TP/SL)
+    get_syminfo,          # 심볼 정보/필터 캐시
 )
 
 # -------------------------------
@@ -166,10 +167,8 @@ def market_buy_then_attach_oco(
     if not quote_usdt and not buy_qty:
         return {"ok": False, "error": "quote_usdt 또는 buy_qty 중 하나는 필요"}
 
-    sx = get_symbol_info(symbol)
-    ff = extract_filters(sx)
-    tick = ff.get("tickSize")
-    step = ff.get("stepQty")
+    si = get_syminfo(symbol)
+    ff, tick, step = si.filters, si.tick, si.step
 
     # --------------------------
     # 1) 시장가 매수 실행
@@ -238,6 +237,7 @@ def market_buy_then_attach_oco(
         # TIMEOUT/NEW/PARTIALLY_FILLED이라도 exec_qty가 있으면 그 수량으로 진행
         if exec_qty_dec <= 0:
             return {"ok": False, "entry": ent, "oco": None, "error": "entry fill timeout", "lastError": w.get("lastError")}
+    # 엔트리 체결은 OCO 전송(네트워크) 전에 즉시 기록 — OCO 단계에서 크래시해도 엔트리는 남음
     resp = ent.get("resp") or {}
     if not dry_run and resp:
         REG.record_entry_from_resp(resp)
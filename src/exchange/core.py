@@ -4,6 +4,8 @@ from urllib.parse import urlencode
 from typing import Dict, Any, Optional, Tuple
 
 from config.settings import get_api_config
+from src.exchange.ratelimit import RAW_LIMITER
+from src.data import jsonio  # 응답 파싱(orjson 있으면 사용)
 
 _cfg = get_api_config()
 BASE_URL = _cfg["BASE_URL"]
@@ -16,6 +18,22 @@ MAX_RETRY_ON_1021 = 1  # -1021 감지시 재동기화 후 재시도 횟수
 
 _TIME_OFFSET_MS = 0  # 서버시간 - 로컬시간 (요청 timestamp 보정에 사용)
 
+# 공용 세션(프로세스 단일): keep-alive로 TCP/TLS 연결 재사용(요청마다 핸드셰이크 없음), 심볼 동시 틱(REST 병렬) 대비 풀 확장
+# - 주문/재시도/OCO/시간동기화 모두 이 세션 경유 → 재시도 대기 중에도 연결이 풀에 남아 있음
+SESSION = requests.Session()
+SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+class BinanceAPIError(RuntimeError):
+    """
+    HTTP 오류 응답 — status(HTTP)/code(Binance 오류코드)/msg 보존
+    - 메시지 형식은 기존과 동일("HTTP error {status} code={code} msg={msg}")
+    """
+    def __init__(self, status: int, code: Optional[int], msg: str):
+        super().__init__(f"HTTP error {status} code={code} msg={msg}")
+        self.status = status
+        self.code = code
+        self.msg = msg
+
 # -------------------- 내부 유틸 --------------------
 def headers(signed: bool=False) -> Dict[str,str]:
     return {"X-MBX-APIKEY": API_KEY} if signed else {}
@@ -31,11 +49,12 @@ def sign(params: Dict[str, Any]) -> str:
 def _raw_request(method: str, path: str, params: Optional[Dict[str,Any]]=None,
                  signed: bool=False, timeout: int=10):
     params = params or {}
+    RAW_LIMITER.acquire()  # 서명 timestamp 전에 대기(recvWindow 소모 방지)
     if signed:
         params.update({"timestamp": now_ms(), "recvWindow": RECV_WINDOW})
         params["signature"] = sign(params)
     url = f"{BASE_URL}{path}"
-    return requests.request(method, url, headers=headers(signed), params=params, timeout=timeout)
+    return SESSION.request(method, url, headers=headers(signed), params=params, timeout=timeout)
 
 def request(method: str, path: str, params: Optional[Dict[str,Any]]=None,
             signed: bool=False, timeout: int=10):
@@ -46,10 +65,11 @@ def request(method: str, path: str, params: Optional[Dict[str,Any]]=None,
     for attempt in range(MAX_RETRY_ON_1021 + 1):
         r = _raw_request(method, path, params.copy(), signed=signed, timeout=timeout)
         if r.ok:
-            return r.json() if r.text else {}
+            # bytes 그대로 파싱(r.text 디코딩/stdlib json 생략)
+            return jsonio.loads(r.content) if r.content else {}
         # 오류 파싱
         try:
-            j = r.json()
+            j = jsonio.loads(r.content)
             code = j.get("code")
             msg = j.get("msg", "")
         except Exception:
@@ -65,7 +85,7 @@ def request(method: str, path: str, params: Optional[Dict[str,Any]]=None,
         try:
             r.raise_for_status()
         except requests.HTTPError as e:
-            raise RuntimeError(f"HTTP error {r.status_code} code={code} msg={msg}") from e
+            raise BinanceAPIError(r.status_code, code, msg) from e
 
 # -------------------- 시간 동기화 --------------------
 def server_time() -> int:
@@ -78,7 +98,7 @@ def _measure_offset_once() -> Tuple[int, int]:
       offset_ms = srv_time - midpoint_local_time
     """
     t0 = int(time.time()*1000)
-    r = requests.get(f"{BASE_URL}/api/v3/time", timeout=5)
+    r = SESSION.get(f"{BASE_URL}/api/v3/time", timeout=5)   # 부팅 시 공용 풀 연결 예열 겸용
     t1 = int(time.time()*1000)
     r.raise_for_status()
     srv = int(r.json()["serverTime"])
@@ -1,6 +1,7 @@
 # src/exchange/filters.py
 from __future__ import annotations
-from typing import Dict, Any, Tuple
+import functools
+from typing import Callable, Dict, Any, Tuple
 from decimal import Decimal, ROUND_DOWN, InvalidOperation
 
 def _to_dec(x) -> Decimal:
@@ -98,6 +99,16 @@ def normalize_price(raw_price, f: Dict[str, Any]) -> Decimal:
         p = f["maxPrice"]
     return p
 
+def ceil_steps_for_notional(min_notional: Decimal, price: Decimal, step: Decimal) -> int:
+    """
+    역할: price에서 qty*price >= min_notional이 되는 최소 step 개수(ceil)를 정수 나눗셈 1회로 계산
+    - Decimal은 유한 소수 → as_integer_ratio로 정확한 분수, 나눗셈/반올림 Decimal 연산 없음
+    """
+    mn, md = min_notional.as_integer_ratio()
+    pn, pd_ = price.as_integer_ratio()
+    sn, sd = step.as_integer_ratio()
+    return -(-(mn * pd_ * sd) // (md * pn * sn))
+
 def ensure_min_notional(price, qty, f: Dict[str, Any]) -> Tuple[Decimal, Decimal, bool]:
     """
     역할: MIN_NOTIONAL 제약(가격*수량) 충족 여부 보장
@@ -113,7 +124,7 @@ def ensure_min_notional(price, qty, f: Dict[str, Any]) -> Tuple[Decimal, Decimal
       - order_executor.limit_buy / market_buy_by_quote
       - 결과는 그대로 exchange.orders.place_* 로 전달
     구현:
-      - stepQty 격자에 맞춰 qty를 가능한 최소로 상향 조정해 minNotional 충족 시도
+      - stepQty 격자에 맞춰 qty를 가능한 최소로 상향 조정해 minNotional 충족 시도(정수 ceil 1회)
     """
     p = _to_dec(price); q = _to_dec(qty)
     if "minNotional" not in f:
@@ -121,13 +132,8 @@ def ensure_min_notional(price, qty, f: Dict[str, Any]) -> Tuple[Decimal, Decimal
     notional = p * q
     if notional >= f["minNotional"]:
         return p, q, True
-    if "stepQty" in f and f["stepQty"] > 0:
-        needed = (f["minNotional"] / p)
-        steps = (needed / f["stepQty"]).to_integral_value(rounding=ROUND_DOWN)
-        q2 = (steps * f["stepQty"]).normalize()
-        if (q2 * p) < f["minNotional"]:
-            q2 = (q2 + f["stepQty"]).normalize()
-        q2 = normalize_qty(q2, f)
+    if "stepQty" in f and f["stepQty"] > 0 and p > 0:
+        q2 = normalize_qty(f["stepQty"] * ceil_steps_for_notional(f["minNotional"], p, f["stepQty"]), f)
         if q2 > 0 and (q2 * p) >= f["minNotional"]:
             return p, q2, True
     return p, q, False
@@ -152,3 +158,21 @@ def to_api_str(x: Decimal, step: Decimal | None = None) -> str:
     if '.' in s:
         s = s.rstrip('0').rstrip('.')
     return s if s else '0'
+
+@functools.lru_cache(maxsize=256)
+def api_formatter(step: Decimal | None) -> Callable[[Decimal], str]:
+    """
+    역할: step이 고정된 to_api_str — 심볼 필터 캐시 시 1회 생성해 주문 경로에서 재사용
+    - 결과 문자열은 to_api_str(x, step)과 동일(step 판정/분기 없이 quantize → 포맷만)
+    """
+    if step is None or step == 0:
+        return to_api_str
+    def fmt(x: Decimal) -> str:
+        try:
+            s = format(x.quantize(step, rounding=ROUND_DOWN), 'f')
+        except (InvalidOperation, AttributeError):
+            return to_api_str(x, step)
+        if '.' in s:
+            s = s.rstrip('0').rstrip('.')
+        return s if s else '0'
+    return fmt
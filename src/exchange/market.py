@@ -1,11 +1,23 @@
 # src/exchange/market.py
+import json
 import pandas as pd
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from .core import request
 
 def get_price(symbol: str) -> float:
     return float(request("GET", "/api/v3/ticker/price", {"symbol": symbol})["price"])
 
+def get_prices(symbols: List[str]) -> Dict[str, float]:
+    """
+    역할: 여러 심볼 현재가를 요청 1회로 조회(/ticker/price?symbols=[...])
+    output: {symbol: price}
+    """
+    if not symbols:
+        return {}
+    symbols_param = json.dumps(list(symbols), separators=(",", ":"))
+    data = request("GET", "/api/v3/ticker/price", {"symbols": symbols_param})
+    return {d["symbol"]: float(d["price"]) for d in data}
+
 def get_exchange_info(symbol: Optional[str]=None) -> Dict[str, Any]:
     params = {"symbol": symbol} if symbol else None
     return request("GET", "/api/v3/exchangeInfo", params)
@@ -37,3 +49,14 @@ def get_symbol_info(symbol: str) -> Dict[str, Any]:
     if not arr:
         raise ValueError(f"Symbol not found or no symbols returned: {symbol}")
     return arr[0]
+
+def get_symbols_info(symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    역할: 여러 심볼의 exchangeInfo 엔트리를 요청 1회로 조회(/exchangeInfo?symbols=[...])
+    output: {symbol: symbol_info}
+    """
+    if not symbols:
+        return {}
+    symbols_param = json.dumps(list(symbols), separators=(",", ":"))
+    data = request("GET", "/api/v3/exchangeInfo", {"symbols": symbols_param})
+    return {d["symbol"]: d for d in data.get("symbols") or []}
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Optional, Dict, Any
 from src.exchange.core import request  # 서명/타임스탬프/recvWindow 처리
 from src.exchange.core import ENV      # mainnet 보호 가드에 사용
+from src.exchange.ratelimit import ORDER_LIMITER  # 주문 생성 빈도 제한(418 차단 방지)
 
 def place_test_order(symbol: str, side: str, type_: str="MARKET",
                      quantity: float=None, quote_order_qty: float=None, **extra):
@@ -29,6 +30,7 @@ def place_order(symbol: str, side: str, type_: str="MARKET",
         if price is None or timeInForce is None or quantity is None:
             raise ValueError("LIMIT: price, timeInForce, quantity 필요")
         params.update({"price": str(price), "timeInForce": timeInForce, "quantity": str(quantity)})
+    ORDER_LIMITER.acquire()
     return request("POST", "/api/v3/order", params, signed=True)
 
 def cancel_order(symbol: str, orderId: int=None, clientOrderId: str=None):
@@ -88,6 +90,7 @@ def place_oco_order(
     if belowStopPrice:     params["belowStopPrice"]     = belowStopPrice
     if belowTimeInForce:   params["belowTimeInForce"]   = belowTimeInForce
 
+    ORDER_LIMITER.acquire()
     return request("POST", "/api/v3/orderList/oco", params, signed=True)
 
 def cancel_order_list(*, orderListId: int | None = None, listClientOrderId: str | None = None,
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+클라이언트측 토큰 버킷 레이트리미터 — 서버 429/418(IP 차단) 전에 호출자를 대기시킴
+- rate: 초당 토큰 보충량, burst: 버킷 용량(순간 최대 연속 호출 수)
+- 스레드 안전(주문 병렬 조회/WS 스레드 등에서 공유)
+
+기본 인스턴스:
+  ORDER_LIMITER : 주문 생성(place_order/place_oco_order) — Spot ORDERS 한도(10초당)보다 보수적으로
+  RAW_LIMITER   : 모든 REST 요청(core._raw_request)
+"""
+
+from __future__ import annotations
+import time, threading
+
+class RateLimiter:
+    def __init__(self, rate: float, burst: int):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.tokens = float(burst)
+        self.ts = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.ts) * self.rate)
+        self.ts = now
+
+    def acquire(self, n: float = 1.0) -> float:
+        """토큰 n개를 얻을 때까지 대기. 반환: 총 대기 시간(s)"""
+        waited = 0.0
+        while True:
+            with self.lock:
+                self._refill(time.monotonic())
+                if self.tokens >= n:
+                    self.tokens -= n
+                    return waited
+                wait = (n - self.tokens) / self.rate
+            time.sleep(wait)          # 락 밖에서 대기(다른 스레드 보충/획득 허용)
+            waited += wait
+
+ORDER_LIMITER = RateLimiter(rate=8.0, burst=10)
+RAW_LIMITER = RateLimiter(rate=18.0, burst=20)
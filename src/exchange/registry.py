@@ -9,7 +9,11 @@
 
 설계:
   - group_id: 엔트리 주문의 clientOrderId를 그룹 키로 사용 (엔트리↔OCO 연동)
-  - 파일 포맷: JSON(단일 파일), 원자적 저장 (tmp → replace)
+  - 파일 포맷: JSON 스냅샷(단일 파일, 원자적 저장 tmp fsync → replace → 디렉터리 fsync, src.data.atomic) + append-only 저널(<path>.jsonl)
+    * 변경 시에는 저널에 변경분 1줄만 추가(O(Δ)), 스냅샷 전체 재작성은 compaction 때만
+    * compaction: compact_every 건 또는 compact_interval_s 경과 시 스냅샷 저장 후 저널 비움
+    * 시작 시 스냅샷 로드 → 저널 replay → 1회 compaction
+    * orjson 사용(없으면 stdlib 폴백), 기본 compact / pretty=True면 indent=2(디버그)
   - 외부 의존:
       - src.exchange.orders.get_order / get_order_list (상태 조회)
   - 사용 흐름:
@@ -18,20 +22,27 @@
       3) 부착 전에 can_attach_oco(symbol, group_id)로 중복 방지
       4) 주기적으로 sync_active(...) 실행해 상태 최신화
       5) needs_oco(symbol, group_id)로 재부착 필요 여부 판단
+      * 네트워크 대기 없는 연속 변경(sync_active의 조회 결과 반영 등)은 with registry.batch(): 로 묶으면 종료 시 1회만 기록
 """
 
 from __future__ import annotations
-import os, json, time, threading
+import os, time, threading
+from contextlib import contextmanager
 from dataclasses import dataclass, asdict, field
 from typing import Dict, Any, Optional, List
 
+from src.data import jsonio
+from src.data.atomic import atomic_write_json
+from src.data.journal import Journal
 from src.exchange.orders import get_order, get_order_list, get_open_order_lists
 
 # -------------------------
 # 데이터 모델 (직렬화 친화)
+# - slots=True: 인스턴스 __dict__ 제거(메모리 절감, 필드 접근 가속) — Python 3.10+
+# - OrderLeg는 생성 후 변경하지 않으므로 frozen, Entry/OCO는 상태 갱신이 있어 mutable 유지
 # -------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OrderLeg:
     type: str = ""               # LIMIT_MAKER or STOP_LOSS_LIMIT 등
     orderId: int = 0
@@ -41,7 +52,7 @@ class OrderLeg:
     stopPrice: str = ""
     timeInForce: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class EntryOrder:
     symbol: str
     side: str                    # BUY/SELL
@@ -55,7 +66,7 @@ class EntryOrder:
     ts: int = 0                  # transactTime
     group_id: str = ""           # 기본: clientOrderId
 
-@dataclass
+@dataclass(slots=True)
 class OCOList:
     symbol: str
     orderListId: int
@@ -72,11 +83,23 @@ class OCOList:
 
 class OrderRegistry:
     """
-    in-memory + JSON file persistence
+    in-memory + JSON snapshot + JSONL journal persistence
+    - pretty=True: 사람이 읽기 쉬운 indent=2 저장(디버그용, 저장 바이트 약 2배)
+    - compact_every / compact_interval_s: 저널 → 스냅샷 compaction 주기
     """
-    def __init__(self, path: str = "runtime/orders_state.json"):
+    def __init__(self, path: str = "runtime/orders_state.json", *, pretty: bool = False,
+                 compact_every: int = 500, compact_interval_s: float = 600.0):
         self.path = path
-        self._lock = threading.Lock()
+        self.pretty = pretty
+        self.compact_every = compact_every
+        self.compact_interval_s = compact_interval_s
+        self._lock = threading.RLock()   # link_entry_status → record_entry_from_resp 재진입
+        self._journal_path = path + ".jsonl"
+        self._journal = Journal(self._journal_path)
+        self._last_compact = time.monotonic()
+        # batch() 상태는 스레드별(depth: 중첩 깊이, pending: 보류 레코드, dirty: 보류된 저장 여부)
+        # → 다른 스레드의 기록이 남의 batch에 섞이거나 억제되지 않음
+        self._tls = threading.local()
         self.version = 1
         self.entries: Dict[str, EntryOrder] = {}         # key = clientOrderId
         self.ocolists: Dict[str, OCOList] = {}           # key = str(orderListId)
@@ -90,34 +113,110 @@ class OrderRegistry:
         if d and not os.path.exists(d):
             os.makedirs(d, exist_ok=True)
 
+    @staticmethod
+    def _oco_from_dict(ol: Dict[str, Any]) -> OCOList:
+        ol = dict(ol)
+        ol["legs"] = [OrderLeg(**lg) for lg in ol.get("legs", [])]
+        return OCOList(**ol)
+
     def _load(self):
+        data = None
         try:
-            with open(self.path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(self.path, "rb") as f:
+                data = jsonio.loads(f.read())
         except FileNotFoundError:
             self._ensure_dir()
-            self._save()  # 초기 파일 생성
-            return
         except Exception:
-            # 손상되었으면 백업 떠두고 초기화
+            # 손상되었으면 백업 떠두고 초기화(저널은 그대로 replay)
             try:
                 os.replace(self.path, self.path + ".corrupt")
             except Exception:
                 pass
-            self._save()
-            return
 
-        self.version = data.get("version", 1)
-        for cid, od in data.get("entries", {}).items():
-            self.entries[cid] = EntryOrder(**od)
-        for k, ol in data.get("ocolists", {}).items():
-            legs = [OrderLeg(**lg) for lg in ol.get("legs", [])]
-            ol["legs"] = legs
-            self.ocolists[k] = OCOList(**ol)
-        self.active_by_symbol = data.get("active_by_symbol", {})
+        if data:
+            self.version = data.get("version", 1)
+            for cid, od in data.get("entries", {}).items():
+                self.entries[cid] = EntryOrder(**od)
+            for k, ol in data.get("ocolists", {}).items():
+                self.ocolists[k] = self._oco_from_dict(ol)
+            self.active_by_symbol = data.get("active_by_symbol", {})
+
+        n = self._replay_journal()
+        if data is None or n:
+            self._save()  # 초기 파일 생성 / 저널 반영분 compaction
+
+    def _replay_journal(self) -> int:
+        """저널 레코드를 순서대로 재적용(레코드는 항목 단위 upsert라 멱등)"""
+        n = 0
+        for rec in self._journal.replay():
+            op, d = rec.get("op"), rec.get("data") or {}
+            try:
+                if op == "entry":
+                    self.entries[d["clientOrderId"]] = EntryOrder(**d)
+                elif op == "oco":
+                    self.ocolists[str(d["orderListId"])] = self._oco_from_dict(d)
+                elif op == "active":
+                    d = dict(d)
+                    self.active_by_symbol[d.pop("symbol")] = d
+                else:
+                    continue
+            except Exception:
+                continue
+            n += 1
+        return n
+
+    def _commit(self, *records):
+        """
+        변경분 저널 기록: records = (op, data) 튜플들
+        - compact_every 건 또는 compact_interval_s 경과 시 스냅샷으로 compaction
+        """
+        with self._lock:
+            if self._batch_depth():
+                self._tls.pending.extend(records)
+                self._tls.dirty = True
+                return
+            cnt = self._journal.extend(records)
+            if cnt >= self.compact_every or time.monotonic() - self._last_compact >= self.compact_interval_s:
+                self._save()
+
+    def _active_rec(self, symbol: str):
+        return ("active", {"symbol": symbol, **self.active_by_symbol[symbol]})
+
+    def _batch_depth(self) -> int:
+        return getattr(self._tls, "depth", 0)
+
+    @contextmanager
+    def batch(self):
+        """
+        현재 스레드의 중간 기록을 보류하고 블록 종료 시 1회만 기록(중첩 가능, 예외 시에도 flush)
+        - 보류는 스레드별: 다른 스레드의 기록은 즉시 저널에 남음
+        - 네트워크 대기 없이 연속되는 로컬 기록만 묶을 것(보류 중 크래시 시 유실)
+          with reg.batch():
+              reg.record_entry_from_resp(...)
+              reg.record_oco_from_resp(...)
+        """
+        tls = self._tls
+        depth = self._batch_depth()
+        if depth == 0:
+            tls.pending, tls.dirty = [], False
+        tls.depth = depth + 1
+        try:
+            yield self
+        finally:
+            tls.depth -= 1
+            if tls.depth == 0 and tls.dirty:
+                recs, tls.pending, tls.dirty = tls.pending, [], False
+                with self._lock:
+                    if recs:
+                        self._commit(*recs)
+                    else:
+                        self._save()
 
     def _save(self):
-        self._ensure_dir()
+        """스냅샷 전체 저장(= compaction) 후 저널 비움"""
+        if self._batch_depth():
+            self._tls.dirty = True
+            return
         data = {
             "version": self.version,
             "entries": {k: asdict(v) for k, v in self.entries.items()},
@@ -125,10 +224,10 @@ class OrderRegistry:
             "active_by_symbol": self.active_by_symbol,
             "saved_at": int(time.time() * 1000),
         }
-        tmp = self.path + ".tmp"
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, separators=(",", ":"), indent=2)
-        os.replace(tmp, self.path)
+        # tmp fsync → rename → 디렉터리 fsync가 끝난 뒤에만 저널 비움(크래시 시 스냅샷/저널 중 하나는 온전)
+        atomic_write_json(self.path, data, pretty=self.pretty)
+        self._journal.truncate()
+        self._last_compact = time.monotonic()
 
     # --------------- 기록/조회 API ----------------
 
@@ -151,7 +250,7 @@ class OrderRegistry:
         )
         with self._lock:
             self.entries[eo.clientOrderId] = eo
-        self._save()
+            self._commit(("entry", asdict(eo)))
         return eo
 
     def record_oco_from_resp(self, resp: Dict[str, Any], *, group_id: str) -> OCOList:
@@ -186,7 +285,7 @@ class OrderRegistry:
             if str(ol.orderListId) not in ab["active_oco_ids"]:
                 ab["active_oco_ids"].append(str(ol.orderListId))
             ab["updated"] = int(time.time() * 1000)
-        self._save()
+            self._commit(("oco", asdict(ol)), self._active_rec(symbol))
         return ol
 
     def can_attach_oco(self, symbol: str, *, group_id: str) -> bool:
@@ -231,6 +330,10 @@ class OrderRegistry:
             r = get_order(symbol, origClientOrderId=clientOrderId)
         except Exception:
             return None
+        return self._apply_entry_status(clientOrderId, r)
+
+    def _apply_entry_status(self, clientOrderId: str, r: Dict[str, Any]) -> EntryOrder:
+        """조회 끝난 주문 응답을 Entry에 반영(로컬 기록만)"""
         with self._lock:
             eo = self.entries.get(clientOrderId)
             if not eo:
@@ -242,7 +345,7 @@ class OrderRegistry:
                 eo.price = r.get("price", eo.price)
                 eo.ts = int(r.get("transactTime", eo.ts))
                 self.entries[clientOrderId] = eo
-            self._save()
+                self._commit(("entry", asdict(eo)))
             return eo
 
     def link_oco_status(self, *, orderListId: int) -> OCOList | None:
@@ -254,7 +357,10 @@ class OrderRegistry:
             r = get_order_list(orderListId=orderListId)
         except Exception:
             return None
+        return self._apply_oco_status(orderListId, r)
 
+    def _apply_oco_status(self, orderListId: int, r: Dict[str, Any]) -> OCOList:
+        """조회 끝난 주문 리스트 응답을 OCO/active set에 반영(로컬 기록만)"""
         # GET에는 orderReports가 거의 없음 → 기존 legs 유지
         new_listStatusType = r.get("listStatusType", "")
         new_listOrderStatus = r.get("listOrderStatus", "")
@@ -292,7 +398,7 @@ class OrderRegistry:
                 if str(orderListId) not in ab["active_oco_ids"]:
                     ab["active_oco_ids"].append(str(orderListId))
             ab["updated"] = int(time.time() * 1000)
-            self._save()
+            self._commit(("oco", asdict(oc)), self._active_rec(oc.symbol))
             return oc
         
     def import_open_oco_minimal(self):
@@ -306,6 +412,7 @@ class OrderRegistry:
             return 0
         items = r if isinstance(r, list) else r.get("orderLists", [])
         cnt = 0
+        recs = []
         with self._lock:
             for it in items:
                 oid = str(it["orderListId"])
@@ -326,8 +433,10 @@ class OrderRegistry:
                 if oid not in ab["active_oco_ids"]:
                     ab["active_oco_ids"].append(oid)
                 ab["updated"] = int(time.time()*1000)
+                recs += [("oco", asdict(oc)), self._active_rec(oc.symbol)]
                 cnt += 1
-            self._save()
+            if recs:
+                self._commit(*recs)
         return cnt
 
     # --------------- 폴링 동기화 ----------------
@@ -343,25 +452,43 @@ class OrderRegistry:
                 active_ids.extend(v.get("active_oco_ids", []))
             entry_cids = list(self.entries.keys())
 
-        # OCO 리스트 상태 갱신
+        # REST 조회는 batch 밖에서 먼저 전부 끝내고(보류 중 네트워크 대기 없음), 반영만 짧은 batch 1회로 기록
+        oco_resps = []
         for oid in active_ids:
             try:
-                self.link_oco_status(orderListId=int(oid))
+                oco_resps.append((int(oid), get_order_list(orderListId=int(oid))))
             except Exception:
                 pass
-
-        # 엔트리 상태 갱신
+        entry_resps = []
         for cid in entry_cids:
             eo = self.entries.get(cid)
             if not eo:
                 continue
             try:
-                self.link_entry_status(eo.symbol, clientOrderId=cid)
+                entry_resps.append((cid, get_order(eo.symbol, origClientOrderId=cid)))
             except Exception:
                 pass
 
+        with self.batch():
+            for oid, r in oco_resps:
+                try:
+                    self._apply_oco_status(oid, r)
+                except Exception:
+                    pass
+            for cid, r in entry_resps:
+                try:
+                    self._apply_entry_status(cid, r)
+                except Exception:
+                    pass
+
         return {"entries": len(entry_cids), "ocolists": len(active_ids)}
 
+    def close(self):
+        """종료 시 호출 권장: 저널을 스냅샷으로 compaction"""
+        with self._lock:
+            self._save()
+            self._journal.close()
+
     # --------------- 요약/디버그 ----------------
 
     def summary(self) -> Dict[str, Any]:
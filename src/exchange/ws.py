@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+Binance 시장 데이터 WebSocket(결합 스트림) — REST 폴링 대체
+- 스트림: {sym}@aggTrade (실시간 체결가), {sym}@kline_{interval} (바 마감 x==True 감지)
+  * kline 스트림은 2초 주기라 현재가는 aggTrade로 받음
+- 백그라운드 데몬 스레드에서 수신, 메인 루프는 price()/closed_pending()/wait()로 조회
+- websocket-client가 없거나 연결이 끊기면 connected=False → 호출자는 REST 경로로 폴백
+
+사용:
+  ms = MarketStream(["BTCUSDT"], "1m"); ms.start()
+  ms.wait(1.0)                 # 새 이벤트 또는 타임아웃까지 대기
+  px = ms.price("BTCUSDT")     # 신선하지 않으면 None
+  if ms.closed_pending("BTCUSDT"): ... rollover ... ms.clear_closed("BTCUSDT", last_closed_open_ms)
+"""
+
+from __future__ import annotations
+import time, threading
+from typing import Dict, List, Optional
+
+from config.settings import BINANCE_ENV, BINANCE_WS_URL
+from src.data import jsonio
+
+try:
+    import websocket  # websocket-client
+except ImportError:  # pragma: no cover - 선택 의존성
+    websocket = None
+
+class MarketStream:
+    """
+    - stale_s: 마지막 체결 수신 후 이 시간이 지나면 price()는 None(REST 폴백 유도)
+    - 바 마감 신호는 마감된 바의 open_time(ms)으로 보관 → 피드 마감창이 그 바를 반영했다고
+      clear_closed()로 확인될 때까지 closed_pending() 유지(REST 캔들 반영이 늦어도 롤오버 재확인 계속)
+    """
+    def __init__(self, symbols: List[str], interval: str, *, url: Optional[str] = None,
+                 stale_s: float = 5.0):
+        self.symbols = [s.upper() for s in symbols]
+        self.interval = interval
+        streams = "/".join(f"{s.lower()}@aggTrade/{s.lower()}@kline_{interval}" for s in self.symbols)
+        self.url = url or f"{BINANCE_WS_URL[BINANCE_ENV]}/stream?streams={streams}"
+        self.stale_s = stale_s
+        self._px: Dict[str, tuple] = {}          # symbol -> (price, monotonic ts)
+        self._closed: Dict[str, int] = {}        # symbol -> 마감된 바 open_time(ms), 0 = 시점 모름(재연결)
+        self._closed_lock = threading.Lock()
+        self._event = threading.Event()
+        self._app = None
+        self._thread: Optional[threading.Thread] = None
+        self.connected = False
+
+    # --------------- 수명 관리 ----------------
+
+    def start(self) -> bool:
+        """수신 스레드 시작. websocket-client 미설치면 False(REST 폴링 유지)"""
+        if websocket is None or self._thread is not None:
+            return self._thread is not None
+        self._app = websocket.WebSocketApp(
+            self.url,
+            on_open=self._on_open,
+            on_message=self._on_message,
+            on_error=self._on_error,
+            on_close=self._on_close,
+        )
+        # reconnect: 끊기면 N초 후 자동 재연결
+        self._thread = threading.Thread(
+            target=self._app.run_forever, kwargs={"ping_interval": 20, "reconnect": 5},
+            name="market-stream", daemon=True,
+        )
+        self._thread.start()
+        return True
+
+    def stop(self):
+        if self._app is not None:
+            self._app.close()
+        self.connected = False
+
+    # --------------- 콜백 ----------------
+
+    def _on_open(self, _ws):
+        self.connected = True
+        # (재)연결 중 놓친 마감이 있을 수 있으므로 전 심볼 롤오버 1회 재확인
+        with self._closed_lock:
+            for s in self.symbols:
+                self._closed.setdefault(s, 0)
+        self._event.set()
+
+    def _on_close(self, _ws, *_):
+        self.connected = False
+        self._event.set()
+
+    def _on_error(self, _ws, err):
+        print(f"[ws] error: {err}")
+
+    def _on_message(self, _ws, msg):
+        try:
+            d = jsonio.loads(msg).get("data") or {}
+        except Exception:
+            return
+        ev = d.get("e")
+        now = time.monotonic()
+        if ev == "aggTrade":
+            self._px[d["s"]] = (float(d["p"]), now)
+        elif ev == "kline":
+            k = d.get("k") or {}
+            if k.get("x"):
+                with self._closed_lock:
+                    self._closed[d["s"]] = max(int(k.get("t") or 0), self._closed.get(d["s"], 0))
+        else:
+            return
+        self._event.set()
+
+    # --------------- 조회 API ----------------
+
+    def wait(self, timeout: float) -> bool:
+        """새 이벤트(체결/마감/연결변화)까지 최대 timeout초 대기. 반환: 이벤트 발생 여부"""
+        got = self._event.wait(timeout)
+        self._event.clear()
+        return got
+
+    def price(self, symbol: str) -> Optional[float]:
+        v = self._px.get(symbol)
+        if v is None or not self.connected or time.monotonic() - v[1] > self.stale_s:
+            return None
+        return v[0]
+
+    def closed_pending(self, symbol: str) -> bool:
+        """마감 신호가 있고 아직 피드 마감창에 반영되지 않았으면 True"""
+        return symbol in self._closed
+
+    def clear_closed(self, symbol: str, last_closed_ms: Optional[int]) -> bool:
+        """
+        피드의 마지막 마감 바 open_time(ms)이 신호된 마감 바 이상일 때만 해제
+        반환: 해제 여부(False면 다음 틱에 롤오버 재확인)
+        """
+        if last_closed_ms is None:
+            return False
+        with self._closed_lock:
+            ot = self._closed.get(symbol)
+            if ot is None or last_closed_ms < ot:
+                return False
+            del self._closed[symbol]
+        return True
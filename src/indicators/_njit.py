@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+"""
+numba 선택 의존성 래퍼
+- numba가 있으면 @njit(cache=True)로 JIT 컴파일(첫 호출 시 컴파일, 이후 디스크 캐시)
+- 없으면 원 함수를 그대로 반환 → 호출자는 HAVE_NUMBA로 pandas 경로를 고를 것
+  (순수 파이썬 루프는 pandas 벡터 연산보다 느리므로 폴백으로 쓰지 않음)
+- fastmath는 NaN 비교를 가정 밖으로 밀어내므로(워밍업 NaN 처리) 쓰지 않음
+"""
+
+from __future__ import annotations
+
+try:
+    from numba import njit as _numba_njit
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - 선택 의존성
+    _numba_njit = None
+    HAVE_NUMBA = False
+
+def njit(fn=None, **kw):
+    """@njit / @njit(...) 둘 다 지원. numba 없으면 no-op."""
+    def wrap(f):
+        if not HAVE_NUMBA:
+            return f
+        return _numba_njit(cache=True, **kw)(f)
+    return wrap(fn) if fn is not None else wrap
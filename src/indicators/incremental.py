@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+증분(O(1)) 지표 상태 — 실시간 틱에서 '마지막 1행'만 다시 계산할 때 사용
+
+개념:
+  - 상태는 항상 '마지막 마감 캔들'까지 반영된 값
+  - peek(x): 진행중 캔들의 종가가 x일 때의 지표값(상태는 그대로)
+  - seed는 최초/불연속 시 1회, 1바씩 전진하는 롤오버는 push(마감 종가)로 O(1) 전진
+
+ta.py의 정의와 동일한 수식:
+  - EMA: ewm(adjust=False) → y = a*x + (1-a)*y_prev
+  - RSI(Wilder): avg = (avg_prev*(n-1) + v)/n, avg_loss==0 이면 NaN
+  - 볼린저: 최근 period개 종가의 평균/표준편차(ddof=0)
+"""
+
+from __future__ import annotations
+import math
+from collections import deque
+from typing import Optional
+import numpy as np
+import pandas as pd
+
+class EmaState:
+    def __init__(self, period: int, prev: float):
+        self.alpha = 2.0 / (period + 1)
+        self.prev = float(prev)
+
+    def peek(self, x: float) -> float:
+        return self.alpha * x + (1.0 - self.alpha) * self.prev
+
+    def push(self, x: float) -> None:
+        """x로 캔들이 마감됨 → 상태 확정"""
+        self.prev = self.peek(x)
+
+    @staticmethod
+    def cross_price(a: "EmaState", b: "EmaState") -> Optional[float]:
+        """a.peek(x) == b.peek(x)가 되는 x(두 EMA 차이는 x에 대해 선형). 기울기 같으면 None"""
+        da = a.alpha - b.alpha
+        if da == 0:
+            return None
+        return ((1.0 - b.alpha) * b.prev - (1.0 - a.alpha) * a.prev) / da
+
+class WilderRsiState:
+    def __init__(self, period: int, avg_gain: float, avg_loss: float, last_close: float):
+        self.period = period
+        self.avg_gain = float(avg_gain)
+        self.avg_loss = float(avg_loss)
+        self.last_close = float(last_close)
+
+    @classmethod
+    def from_closes(cls, closes: np.ndarray, period: int) -> "WilderRsiState":
+        """마감 종가 배열로 Wilder 평균 상태를 만든다(O(N), 롤오버 시 1회)."""
+        delta = pd.Series(closes, dtype="float64").diff()
+        a = 1.0 / period
+        ag = delta.clip(lower=0).ewm(alpha=a, adjust=False).mean().iat[-1]
+        al = (-delta.clip(upper=0)).ewm(alpha=a, adjust=False).mean().iat[-1]
+        return cls(period, ag, al, closes[-1])
+
+    def _next(self, x: float) -> tuple[float, float]:
+        d = x - self.last_close
+        n = self.period
+        return (self.avg_gain * (n - 1) + max(d, 0.0)) / n, (self.avg_loss * (n - 1) + max(-d, 0.0)) / n
+
+    def peek(self, x: float) -> float:
+        ag, al = self._next(x)
+        if al == 0 or math.isnan(al) or math.isnan(ag):
+            return float("nan")
+        return 100.0 - 100.0 / (1.0 + ag / al)
+
+    def push(self, x: float) -> None:
+        """x로 캔들이 마감됨 → 상태 확정"""
+        self.avg_gain, self.avg_loss = self._next(x)
+        self.last_close = float(x)
+
+    def price_for(self, rsi: float) -> Optional[float]:
+        """peek(x) == rsi가 되는 x(peek는 x에 대해 단조 증가). 해가 없으면 None"""
+        if not 0.0 < rsi < 100.0:
+            return None
+        q = rsi / (100.0 - rsi)          # 목표 avg_gain/avg_loss 비
+        m = self.period - 1
+        d_up = m * (q * self.avg_loss - self.avg_gain) if q > 0 else -1.0   # x >= last 구간
+        if d_up >= 0:
+            return self.last_close + d_up
+        d_dn = m * (self.avg_loss - self.avg_gain / q)                      # x < last 구간
+        if d_dn < 0:
+            return self.last_close + d_dn
+        return None
+
+class RollingStatsState:
+    """
+    최근 (period-1)개 마감 종가의 합/제곱합을 유지 → 새 종가 1개를 더해 평균/표준편차 계산.
+    - 큰 가격대(1e4~1e5)에서 제곱합 상쇄오차를 줄이기 위해 shift(창 평균)를 빼고 누적
+    - push(x): 마감 1바 전진 O(1) (빠지는 종가를 빼고 새 종가를 더함), RESEED_EVERY회마다 재시드로 누적오차 제거
+    """
+    RESEED_EVERY = 256
+
+    def __init__(self, period: int, closed_tail: np.ndarray):
+        tail = np.asarray(closed_tail, dtype=np.float64)[-(period - 1):] if period > 1 else np.empty(0)
+        self.period = period
+        self.tail = deque(tail.tolist(), maxlen=max(period - 1, 0))
+        self._seed(tail)
+
+    def _seed(self, tail: np.ndarray):
+        self.shift = float(tail.mean()) if len(tail) else 0.0
+        dev = tail - self.shift
+        self.s = float(dev.sum())
+        self.ss = float((dev * dev).sum())
+        self._pushes = 0
+
+    def push(self, x: float) -> None:
+        """x로 캔들이 마감됨 → 창 전진"""
+        if self.tail.maxlen == 0:
+            return
+        d = float(x) - self.shift
+        if len(self.tail) == self.tail.maxlen:
+            o = self.tail[0] - self.shift
+            self.s -= o
+            self.ss -= o * o
+        self.tail.append(float(x))
+        self.s += d
+        self.ss += d * d
+        self._pushes += 1
+        if self._pushes >= self.RESEED_EVERY:
+            self._seed(np.fromiter(self.tail, dtype=np.float64, count=len(self.tail)))
+
+    def peek(self, x: float) -> tuple[float, float]:
+        d = x - self.shift
+        m = (self.s + d) / self.period
+        var = (self.ss + d * d) / self.period - m * m
+        return self.shift + m, math.sqrt(max(var, 0.0))
+
+    def band_cross_prices(self, k: float) -> list[float]:
+        """
+        x == mean(x) ± k*std(x)가 되는 x들(상/하단선 돌파 경계).
+        (x - mean)^2 = k^2 var 를 d = x - shift에 대한 2차식으로 풀이
+        """
+        p, s, ss = float(self.period), self.s, self.ss
+        a = 1.0 - 1.0 / p
+        A = a * a - k * k * (1.0 / p - 1.0 / (p * p))
+        B = -2.0 * a * s / p + 2.0 * k * k * s / (p * p)
+        C = s * s / (p * p) - k * k * (ss / p - s * s / (p * p))
+        if abs(A) < 1e-12:
+            return [self.shift - C / B] if B else []
+        disc = B * B - 4.0 * A * C
+        if disc < 0:
+            return []
+        r = math.sqrt(disc)
+        return [self.shift + (-B - r) / (2.0 * A), self.shift + (-B + r) / (2.0 * A)]
@@ -1,27 +1,58 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
+import functools
+import numpy as np
 import pandas as pd
 from typing import List, Tuple, Optional, Dict, Any
 
 _BASE_OHLCV = {"open_time","open","high","low","close","volume"}
 
+@functools.lru_cache(maxsize=32)
+def _indicator_cols_for(columns: Tuple[str, ...]) -> Tuple[str, ...]:
+    return tuple(c for c in columns if c not in _BASE_OHLCV)
+
 def _infer_indicator_cols(df: pd.DataFrame) -> List[str]:
-    """DF에서 지표 컬럼만 골라냄(= 전체 - 기본 OHLCV)."""
-    return [c for c in df.columns if c not in _BASE_OHLCV]
+    """DF에서 지표 컬럼만 골라냄(= 전체 - 기본 OHLCV). 컬럼 스키마는 틱마다 같으므로 캐시."""
+    return list(_indicator_cols_for(tuple(df.columns)))
 
-def _find_first_uncomputed_idx(df: pd.DataFrame, indicator_cols: List[str]) -> int:
+def _find_first_uncomputed_idx(df: pd.DataFrame, indicator_cols: List[str], *, skip_leading: bool = False) -> int:
     """
-    지표가 계산되지 않은 '가장 이른 행'의 인덱스를 찾음.
+    지표가 계산되지 않은 '가장 이른 행'의 위치(0-based)를 찾음.
     - 규칙: indicator_cols 중 어느 하나라도 NaN이면 '미계산'으로 간주
+    - skip_leading=True: 맨 앞 워밍업 NaN 구간은 '미계산'으로 보지 않음(첫 유효행 이후부터 탐색)
     - 없으면 len(df) 반환(= 재계산 불필요)
     """
     if not indicator_cols or df.empty:
         return len(df)
-    mask_valid = df[indicator_cols].notna().all(axis=1)
+    mask_valid = df[indicator_cols].notna().to_numpy().all(axis=1)
+    off = 0
+    if skip_leading and mask_valid.any():
+        off = int(np.argmax(mask_valid))
+        mask_valid = mask_valid[off:]
     if mask_valid.all():
         return len(df)
     # 첫 번째로 유효하지 않은(=NaN 포함) 위치
-    return int((~mask_valid).idxmax())
+    return off + int(np.argmin(mask_valid))
+
+def _overlap_by_open_time(df_prev: pd.DataFrame, df_new: pd.DataFrame) -> Tuple[int, int, int]:
+    """
+    df_prev의 '마감' 행(마지막 진행중 행 제외)이 df_new의 어디에 겹치는지 open_time 이진탐색으로 찾음.
+    반환: (prev 시작 위치, new 시작 위치, 겹치는 행 수) / 겹침 없음·경계 불일치면 (0, 0, 0)
+    - 두 DF 모두 open_time 오름차순 연속 캔들 전제
+    - df_prev는 leading NaN 절단/롤오버로 앞쪽이 어긋날 수 있어 위치가 아닌 시간으로 정렬
+    """
+    m = len(df_prev) - 1
+    if m <= 0 or df_new.empty:
+        return 0, 0, 0
+    ot_prev, ot_new = df_prev["open_time"], df_new["open_time"]
+    if ot_prev.iat[0] >= ot_new.iat[0]:
+        po, no = 0, int(ot_new.searchsorted(ot_prev.iat[0]))
+    else:
+        po, no = int(ot_prev.searchsorted(ot_new.iat[0])), 0
+    k = min(m - po, len(df_new) - no)
+    if k <= 0 or ot_prev.iat[po] != ot_new.iat[no] or ot_prev.iat[po + k - 1] != ot_new.iat[no + k - 1]:
+        return 0, 0, 0
+    return po, no, k
 
 def _stitch_indicators(
     df_base: pd.DataFrame,
@@ -44,6 +75,39 @@ def _stitch_indicators(
     out.loc[start_idx:end_idx-1, indicator_cols] = src.values
     return out
 
+def _only_last_row_changed(df_with_ind: pd.DataFrame, df_new_base: pd.DataFrame) -> bool:
+    """
+    '마감창은 그대로, 진행중 캔들(마지막 행)만 바뀜' 여부.
+    - 두 DF의 마지막 두 행 open_time이 같고
+    - 겹치는 마감 구간의 OHLCV가 완전히 같으면 True
+    (df_with_ind는 leading NaN 절단으로 더 짧을 수 있으므로 꼬리 기준으로 비교)
+    """
+    n = min(len(df_with_ind), len(df_new_base))
+    if n < 2:
+        return False
+    ot_a = df_with_ind["open_time"].to_numpy()
+    ot_b = df_new_base["open_time"].to_numpy()
+    if ot_a[-1] != ot_b[-1] or ot_a[-2] != ot_b[-2]:
+        return False
+    for c in ("open", "high", "low", "close", "volume"):
+        if not np.array_equal(df_with_ind[c].to_numpy()[-n:-1], df_new_base[c].to_numpy()[-n:-1]):
+            return False
+    return True
+
+def _update_tail_rows(strategy, merged: pd.DataFrame, indicator_cols: List[str]) -> bool:
+    """merged 마지막 두 행의 지표를 strategy.update_last로 채움(제자리). 지표 컬럼을 다 못 채우면 False"""
+    need = set(indicator_cols)
+    for end in (len(merged) - 1, len(merged)):
+        view = merged.iloc[:end]
+        row = {c: view[c].iat[-1] for c in ("open", "high", "low", "close", "volume")}
+        upd = strategy.update_last(view, row)
+        if upd is None or not need.issubset(upd):
+            return False
+        i = end - 1
+        for c in indicator_cols:
+            merged.iat[i, merged.columns.get_loc(c)] = upd[c]
+    return True
+
 # src/indicators/partial_utils.py
 
 def partial_recompute_indicators(
@@ -53,27 +117,54 @@ def partial_recompute_indicators(
     *,
     safety_buffer: Optional[int] = None
 ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    # fast-path: 마지막 행만 바뀐 경우 strategy.update_last(선택 구현)로 O(1) 갱신(df_with_ind 제자리 수정)
+    if _only_last_row_changed(df_with_ind, df_new_base):
+        row = {c: df_new_base[c].iat[-1] for c in ("open", "high", "low", "close", "volume")}
+        upd = strategy.update_last(df_with_ind, row) if hasattr(strategy, "update_last") else None
+        if upd is not None:
+            last = len(df_with_ind) - 1
+            for c, v in {**row, **upd}.items():
+                df_with_ind.iat[last, df_with_ind.columns.get_loc(c)] = v
+            return df_with_ind, {
+                "recompute_start": last,
+                "slice_rows": 0,
+                "indicator_cols": list(upd.keys()),
+                "incremental": True,
+            }
+
     # 0) 행 정렬을 맞춘 'merged' 생성: df_new_base(OHLCV) 기준으로 시작
     merged = df_new_base.copy()
 
     # 이전 DF의 지표 컬럼 목록
-    prev_ind_cols = [c for c in df_with_ind.columns if c not in _BASE_OHLCV]
+    prev_ind_cols = _infer_indicator_cols(df_with_ind)
 
-    # 새 DF에 지표 컬럼이 없다면 만들고(NaN), "겹치는 행 길이"만큼 값 복사
+    # 새 DF에 지표 컬럼이 없다면 만들고(NaN), open_time이 겹치는 마감 구간만 값 복사
     for c in prev_ind_cols:
         if c not in merged.columns:
-            merged[c] = pd.NA
-    # ★ 겹치는 구간 길이 계산
-    n = min(len(df_with_ind), len(merged))
-    if n > 0 and prev_ind_cols:
-        # 이전 DF의 지표값을 merged 앞쪽 n행에 복사
-        merged.loc[:n-1, prev_ind_cols] = df_with_ind.loc[:n-1, prev_ind_cols].values
+            merged[c] = np.nan
+    po, no, k = _overlap_by_open_time(df_with_ind, merged)
+    if k > 0 and prev_ind_cols:
+        col_idx = [merged.columns.get_loc(c) for c in prev_ind_cols]
+        merged.iloc[no:no + k, col_idx] = df_with_ind[prev_ind_cols].to_numpy()[po:po + k]
 
     # 1) 이번에도 지표 컬럼은 "현재 merged에 존재하는 지표 컬럼"으로 판단
-    indicator_cols = [c for c in merged.columns if c not in _BASE_OHLCV]
-
-    # 2) 가장 이른 미계산 인덱스 탐지 (겹치는 구간은 값이 복사되어 있으므로 보통 n 근처부터 시작)
-    start = _find_first_uncomputed_idx(merged, indicator_cols)
+    indicator_cols = _infer_indicator_cols(merged)
+
+    # 2) 가장 이른 미계산 위치 탐지: 겹침 구간 앞/leading NaN(워밍업 문맥)은 제외 → 보통 no+k(롤오버된 행)부터
+    start = no + _find_first_uncomputed_idx(merged.iloc[no:], indicator_cols, skip_leading=k > 0)
+
+    # 2-1) 1바 롤오버(새 마감 행 + 새 진행 행만 미계산) → update_last 2회로 O(1)
+    #      (a) merged[:-1] 기준: 직전 상태로 방금 마감된 행 값 확정
+    #      (b) merged 기준: 상태가 1바 전진(push)한 뒤 진행 행 값
+    if not safety_buffer and k > 0 and start == len(merged) - 2 and hasattr(strategy, "update_last"):
+        done = _update_tail_rows(strategy, merged, indicator_cols)
+        if done:
+            return merged.reset_index(drop=True), {
+                "recompute_start": start,
+                "slice_rows": 0,
+                "indicator_cols": indicator_cols,
+                "incremental": True,
+            }
 
     # 3) 안전 버퍼
     if safety_buffer:
@@ -87,9 +178,10 @@ def partial_recompute_indicators(
             "indicator_cols": indicator_cols,
         }
 
-    # 5) 부분 슬라이스 재계산
-    df_slice = merged.iloc[start:].copy()
-    df_slice_ind = strategy.compute_indicators(df_slice)
+    # 5) 재계산 후 start 이후만 사용
+    #    EMA/Wilder RSI는 재귀형이라 슬라이스 시작점에서 시드하면 값이 달라짐(RSI 수십 bp 오차)
+    #    → 창 전체로 계산(롤오버 때만 오는 경로, 300행 기준 ~1ms)하고 stitch는 start 이후만
+    df_slice_ind = strategy.compute_indicators(merged.copy()).iloc[start:]
 
     # 6) 재계산 결과를 덮어쓰기
     out = _stitch_indicators(merged, df_slice_ind, indicator_cols, start_idx=start)
@@ -100,4 +192,3 @@ def partial_recompute_indicators(
         "indicator_cols": indicator_cols,
     }
     return out.reset_index(drop=True), meta
-
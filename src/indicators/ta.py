@@ -1,84 +1,179 @@
 import pandas as pd
 import numpy as np
 from .utils import ensure_ohlcv, to_float
+from ._njit import njit, HAVE_NUMBA
+
+# 공통: copy=False면 입력 df에 지표 컬럼을 제자리로 추가(전체 OHLCV 복사 생략, 여러 지표 연쇄 시 사용)
+
+# 워밍업(NaN) 처리:
+#  - ewm/rolling에 min_periods를 주면 pandas가 창별 유효개수 카운트 패스를 한 번 더 돈다.
+#  - 입력 OHLCV는 NaN이 없다는 전제(RollingFeed가 보장)에서, 워밍업 길이를 직접 NaN으로 채워 동일 결과를 낸다.
+def _seed_nan(s: pd.Series, n: int) -> pd.Series:
+    if n > 0:
+        s.iloc[:n] = np.nan
+    return s
+
+# 재귀형 평균(EMA/Wilder) 커널:
+#  - numba가 있으면 ndarray 루프를 JIT(소형 창에서 pandas ewm 호출 오버헤드 제거)
+#  - 없으면 pandas ewm(adjust=False) 그대로 사용
+#  - 입력은 leading NaN만 있다는 전제(diff 첫 행 등). 첫 유효값으로 시드 → ewm(adjust=False)와 동일
+@njit
+def _ewm_loop(x: np.ndarray, alpha: float) -> np.ndarray:
+    out = np.empty_like(x)
+    prev = np.nan
+    for i in range(x.shape[0]):
+        v = x[i]
+        if np.isnan(v):
+            out[i] = prev
+        elif np.isnan(prev):
+            prev = v
+            out[i] = v
+        else:
+            prev = alpha * v + (1.0 - alpha) * prev
+            out[i] = prev
+    return out
+
+@njit
+def _rsi_loop(c: np.ndarray, period: int) -> np.ndarray:
+    """Wilder RSI 1패스(diff → gain/loss → 두 평균 → RSI를 한 루프에서). _ewm_loop와 같은 시드/NaN 규칙"""
+    n = c.shape[0]
+    out = np.full(n, np.nan)
+    a = 1.0 / period
+    ag = np.nan
+    al = np.nan
+    for i in range(1, n):
+        d = c[i] - c[i - 1]
+        if not np.isnan(d):
+            g = d if d > 0.0 else 0.0
+            l = -d if d < 0.0 else 0.0
+            if np.isnan(ag):
+                ag = g
+                al = l
+            else:
+                ag = a * g + (1.0 - a) * ag
+                al = a * l + (1.0 - a) * al
+        if i >= period and al != 0.0 and not np.isnan(al):
+            out[i] = 100.0 - 100.0 / (1.0 + ag / al)
+    return out
+
+def _ewm_np(x: np.ndarray, alpha: float) -> np.ndarray:
+    if HAVE_NUMBA:
+        return _ewm_loop(x, alpha)
+    return pd.Series(x).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+
+def _ewm(s: pd.Series, alpha: float) -> pd.Series:
+    return pd.Series(_ewm_np(s.to_numpy(dtype=np.float64), alpha), index=s.index)
 
 # === 이동평균 ===
-def add_sma(df: pd.DataFrame, period: int, col_out: str = None) -> pd.DataFrame:
+def add_sma(df: pd.DataFrame, period: int, col_out: str = None, *, copy: bool = True) -> pd.DataFrame:
     ensure_ohlcv(df); to_float(df, ["close"])
-    out = df.copy()
+    out = df.copy() if copy else df
     col_out = col_out or f"sma_{period}"
-    out[col_out] = out["close"].rolling(period, min_periods=period).mean()
+    out[col_out] = out["close"].rolling(period).mean()
     return out
 
-def add_ema(df: pd.DataFrame, period: int, col_out: str = None) -> pd.DataFrame:
+def add_ema(df: pd.DataFrame, period: int, col_out: str = None, *, copy: bool = True) -> pd.DataFrame:
     ensure_ohlcv(df); to_float(df, ["close"])
-    out = df.copy()
+    out = df.copy() if copy else df
     col_out = col_out or f"ema_{period}"
-    out[col_out] = out["close"].ewm(span=period, adjust=False, min_periods=period).mean()
+    out[col_out] = _seed_nan(_ewm(out["close"], 2.0 / (period + 1)), period - 1)
     return out
 
 # === RSI (Wilder) ===
-def add_rsi(df: pd.DataFrame, period: int = 14, col_out: str = None) -> pd.DataFrame:
+def add_rsi(df: pd.DataFrame, period: int = 14, col_out: str = None, *, copy: bool = True) -> pd.DataFrame:
     ensure_ohlcv(df); to_float(df, ["close"])
-    out = df.copy()
-    delta = out["close"].diff()
-
-    gain = delta.clip(lower=0)
-    loss = -delta.clip(upper=0)
+    out = df.copy() if copy else df
+    # ndarray로 계산(중간 Series 생성 없음). diff 첫 행 NaN → maximum이 NaN 전파(clip과 동일)
+    c = out["close"].to_numpy(dtype=np.float64)
+    col_out = col_out or f"rsi_{period}"
+    if HAVE_NUMBA:
+        out[col_out] = _rsi_loop(c, period)
+        return out
+    delta = np.empty_like(c)
+    delta[:1] = np.nan
+    np.subtract(c[1:], c[:-1], out=delta[1:])
 
-    avg_gain = gain.ewm(alpha=1/period, adjust=False, min_periods=period).mean()
-    avg_loss = loss.ewm(alpha=1/period, adjust=False, min_periods=period).mean()
+    avg_gain = _ewm_np(np.maximum(delta, 0.0), 1/period)
+    avg_loss = _ewm_np(np.maximum(-delta, 0.0), 1/period)
 
-    rs = avg_gain / (avg_loss.replace(0, np.nan))
-    rsi = 100 - (100 / (1 + rs))
-    col_out = col_out or f"rsi_{period}"
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = avg_gain / np.where(avg_loss == 0, np.nan, avg_loss)
+        rsi = 100 - (100 / (1 + rs))
+    rsi[:period] = np.nan  # diff()로 첫 행이 비므로 period행까지 워밍업
     out[col_out] = rsi
     return out
 
 # === MACD ===
 def add_macd(df: pd.DataFrame, fast=12, slow=26, signal=9,
-             col_macd="macd", col_signal="macd_signal", col_hist="macd_hist") -> pd.DataFrame:
+             col_macd="macd", col_signal="macd_signal", col_hist="macd_hist", *, copy: bool = True) -> pd.DataFrame:
     ensure_ohlcv(df); to_float(df, ["close"])
-    out = df.copy()
-    ema_fast = out["close"].ewm(span=fast, adjust=False, min_periods=fast).mean()
-    ema_slow = out["close"].ewm(span=slow, adjust=False, min_periods=slow).mean()
-    macd = ema_fast - ema_slow
-    macd_signal = macd.ewm(span=signal, adjust=False, min_periods=signal).mean()
+    out = df.copy() if copy else df
+    ema_fast = _ewm(out["close"], 2.0 / (fast + 1))
+    ema_slow = _ewm(out["close"], 2.0 / (slow + 1))
+    warm = max(fast, slow) - 1
+    macd = _seed_nan(ema_fast - ema_slow, warm)
+    # signal은 유효 macd부터 시작(leading NaN은 ewm이 건너뜀)
+    macd_signal = _seed_nan(_ewm(macd, 2.0 / (signal + 1)), warm + signal - 1)
     out[col_macd] = macd
     out[col_signal] = macd_signal
     out[col_hist] = macd - macd_signal
     return out
 
 # === Bollinger Bands ===
+def _rolling_mean_std(c: np.ndarray, period: int):
+    """
+    창 평균/표준편차(ddof=0)를 누적합 1패스로 계산 — 앞 period-1개는 NaN
+    - 큰 가격대(1e4~1e5)에서 제곱합 상쇄오차를 줄이기 위해 전체 평균을 빼고 누적
+    """
+    n = c.shape[0]
+    mean = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+    if period < 1 or n < period:
+        return mean, std
+    shift = c.mean()
+    d = c - shift
+    cs = np.empty(n + 1); cs[0] = 0.0; np.cumsum(d, out=cs[1:])
+    cs2 = np.empty(n + 1); cs2[0] = 0.0; np.cumsum(d * d, out=cs2[1:])
+    m = (cs[period:] - cs[:-period]) / period
+    var = (cs2[period:] - cs2[:-period]) / period - m * m
+    mean[period - 1:] = m + shift
+    std[period - 1:] = np.sqrt(np.maximum(var, 0.0))
+    return mean, std
+
 def add_bbands(df: pd.DataFrame, period=20, k=2.0,
-               col_mid="bb_mid", col_up="bb_up", col_dn="bb_dn") -> pd.DataFrame:
+               col_mid="bb_mid", col_up="bb_up", col_dn="bb_dn", *, copy: bool = True) -> pd.DataFrame:
     ensure_ohlcv(df); to_float(df, ["close"])
-    out = df.copy()
-    ma = out["close"].rolling(period, min_periods=period).mean()
-    std = out["close"].rolling(period, min_periods=period).std(ddof=0)
+    out = df.copy() if copy else df
+    c = out["close"].to_numpy(dtype=np.float64)
+    if np.isnan(c).any():
+        # NaN이 끼면 누적합이 이후 전 구간을 오염 → pandas rolling(창별 NaN 처리)로
+        ma = out["close"].rolling(period).mean().to_numpy()
+        std = out["close"].rolling(period).std(ddof=0).to_numpy()
+    else:
+        ma, std = _rolling_mean_std(c, period)
     out[col_mid] = ma
     out[col_up]  = ma + k * std
     out[col_dn]  = ma - k * std
     return out
 
 # === ATR (Average True Range) ===
-def add_atr(df: pd.DataFrame, period=14, col_out="atr") -> pd.DataFrame:
+def add_atr(df: pd.DataFrame, period=14, col_out="atr", *, copy: bool = True) -> pd.DataFrame:
     ensure_ohlcv(df); to_float(df, ["high","low","close"])
-    out = df.copy()
+    out = df.copy() if copy else df
     prev_close = out["close"].shift(1)
     tr = pd.concat([
         (out["high"] - out["low"]).abs(),
         (out["high"] - prev_close).abs(),
         (out["low"] - prev_close).abs()
     ], axis=1).max(axis=1)
-    atr = tr.ewm(alpha=1/period, adjust=False, min_periods=period).mean()
+    atr = _seed_nan(_ewm(tr, 1/period), period - 1)
     out[col_out] = atr
     return out
 
 # === VWAP ===
-def add_vwap(df: pd.DataFrame, col_out="vwap") -> pd.DataFrame:
+def add_vwap(df: pd.DataFrame, col_out="vwap", *, copy: bool = True) -> pd.DataFrame:
     ensure_ohlcv(df); to_float(df, ["high","low","close","volume"])
-    out = df.copy()
+    out = df.copy() if copy else df
     tp = (out["high"] + out["low"] + out["close"]) / 3.0
     cum_v = out["volume"].cumsum()
     cum_vp = (tp * out["volume"]).cumsum()
@@ -96,23 +191,28 @@ def add_indicators(df: pd.DataFrame, spec: dict) -> pd.DataFrame:
       "bbands": {"period":20,"k":2.0}
     }
     """
-    out = df.copy()
+    out = df.copy()   # 복사는 여기서 1회, 이후 지표는 out에 제자리 추가
     if "sma" in spec:
         for p in spec["sma"]:
-            out = add_sma(out, p)
+            out = add_sma(out, p, copy=False)
     if "ema" in spec:
         for p in spec["ema"]:
-            out = add_ema(out, p)
+            out = add_ema(out, p, copy=False)
     if "rsi" in spec:
         params = spec["rsi"] if isinstance(spec["rsi"], dict) else {"period": int(spec["rsi"])}
-        out = add_rsi(out, **params)
+        out = add_rsi(out, **params, copy=False)
     if "macd" in spec:
-        out = add_macd(out, **spec["macd"])
+        out = add_macd(out, **spec["macd"], copy=False)
     if "bbands" in spec:
-        out = add_bbands(out, **spec["bbands"])
+        out = add_bbands(out, **spec["bbands"], copy=False)
     if "atr" in spec:
         params = spec["atr"] if isinstance(spec["atr"], dict) else {"period": int(spec["atr"])}
-        out = add_atr(out, **params)
+        out = add_atr(out, **params, copy=False)
     if "vwap" in spec:
-        out = add_vwap(out)
+        out = add_vwap(out, copy=False)
     return out
+
+# JIT 예열: import 시 1회 호출로 컴파일(또는 디스크 캐시 로드) → 첫 틱 지연 제거
+if HAVE_NUMBA:
+    _ewm_loop(np.zeros(2), 0.5)
+    _rsi_loop(np.zeros(3), 1)
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 REQUIRED_COLS = ["open", "high", "low", "close", "volume"]
@@ -8,9 +9,13 @@ def ensure_ohlcv(df: pd.DataFrame):
         raise ValueError(f"OHLCV 컬럼 누락: {missing}")
 
 def to_float(df: pd.DataFrame, cols):
+    """
+    OHLCV는 상류(RollingFeed/get_ohlcv)에서 이미 float64로 저장됨 → 핫패스에서는 dtype 확인만.
+    float이 아닌 컬럼(외부 입력 등)만 float64로 변환.
+    """
     for c in cols:
-        if c in df.columns and not pd.api.types.is_float_dtype(df[c].dtype):
-            df[c] = df[c].astype(float)
+        if c in df.columns and df[c].dtype.kind != "f":
+            df[c] = df[c].to_numpy(dtype=np.float64)
 
 def max_window(*windows):
     """필요 최소 히스토리 산출에 사용."""
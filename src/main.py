@@ -1,7 +1,7 @@
 """
 메인 실행(부분 재계산 적용판):
 - RollingFeed로 심볼/인터벌별 '마감창'을 캐시(warm_build)
-- 매 틱:
+- 매 틱(심볼 간 동시 처리, tick_all):
     (1) 롤오버 감지/갱신
     (2) 마감창 + 현재가 1틱 스냅샷(OHLCV만)
     (3) 부분 재계산: 지표가 비어있는 가장 이른 행부터 끝까지 compute_indicators만 호출
@@ -9,17 +9,33 @@
 - 초기 1회만 지표 NaN의 leading 구간을 잘라내어 워밍업 문제 제거
 """
 
-import time
-from typing import Dict
+import asyncio
+from typing import Dict, Optional
 import pandas as pd
 
 from config.config_loader import load_config
-from src.exchange import get_price
+from src.exchange import get_price, get_prices
 from src.strategy_manager import StrategyRunner
-from src.indicators.partial_utils import partial_recompute_indicators
-from src.data.rolling_feed import RollingFeed, interval_to_ms
-
-_BASE_OHLCV = {"open_time", "open", "high", "low", "close", "volume"}
+from src.indicators.partial_utils import partial_recompute_indicators, _infer_indicator_cols
+from src.data.rolling_feed import RollingFeed, SNAP_COLS, get_feed
+from src.strategy.base import Strategy
+from src.exchange.ws import MarketStream
+import src.strategy.registry as _reg
+
+# registry 디스패치는 import 시 1회만 결정(_strategy_for에서 hasattr 스캔 제거)
+def _first_attr(mod, *names):
+    for n in names:
+        v = getattr(mod, n, None)
+        if v is not None:
+            return v
+    return None
+
+POLL_S = 1.0        # WS 이벤트가 없을 때 최대 대기(= 기존 1초 폴링 주기)
+MIN_TICK_S = 0.1    # 이벤트 기반 틱 사이 최소 간격
+
+_registry_create = _first_attr(_reg, "create_strategy", "create", "make", "instantiate")
+_registry_get = _first_attr(_reg, "get", "get_strategy", "get_class")
+_registry_table = _first_attr(_reg, "REGISTRY", "registry", "STRATEGIES", "STRATEGY_REGISTRY")
 
 # -----------------------
 # 유틸: 지표 NaN 초기 정리
@@ -32,20 +48,35 @@ def _drop_indicator_nans(df: pd.DataFrame, *, mode: str = "leading") -> pd.DataF
     """
     if df.empty:
         return df
-    indicator_cols = [c for c in df.columns if c not in _BASE_OHLCV]
+    indicator_cols = _infer_indicator_cols(df)
     if not indicator_cols:
         return df.reset_index(drop=True)
     if mode == "any":
         return df.dropna(subset=indicator_cols).reset_index(drop=True)
-    mask = df[indicator_cols].notna().all(axis=1)
-    if not mask.any():
-        return df.iloc[0:0].reset_index(drop=True)
-    first_valid_idx = int(mask.idxmax())
-    return df.loc[first_valid_idx:].reset_index(drop=True)
+    # 컬럼별 첫 유효 위치(1열씩 argmax) 중 최댓값 — N×K 불리언 프레임 생성 없음
+    first_valid_idx = 0
+    for c in indicator_cols:
+        valid = ~pd.isna(df[c].to_numpy())
+        i = int(valid.argmax())
+        if not valid[i]:
+            return df.iloc[0:0].reset_index(drop=True)
+        first_valid_idx = max(first_valid_idx, i)
+    return df.iloc[first_valid_idx:].reset_index(drop=True)
+
+def _trim_tail(df: pd.DataFrame, keep: int) -> pd.DataFrame:
+    """
+    캐시 DF를 최근 keep행으로 제한(가동 시간과 무관하게 틱당 메모리/CPU를 O(lookback)으로 고정).
+    - 이미 keep 이하이면 그대로 반환(증분 fast-path의 제자리 갱신 유지)
+    """
+    if len(df) <= keep:
+        return df
+    return df.iloc[-keep:].reset_index(drop=True)
 
 # -------------------------------
 # 유틸: 현재가 1틱 스냅샷 생성(OHLCV)
 # -------------------------------
+_OPEN, _HIGH, _LOW, _CLOSE = (SNAP_COLS.index(c) for c in ("open", "high", "low", "close"))
+
 def build_snapshot_from_feed(
     feed: RollingFeed,
     symbol: str,
@@ -55,34 +86,25 @@ def build_snapshot_from_feed(
 ) -> pd.DataFrame:
     """
     역할:
-      - feed.get_closed_window()로 캐시된 '마감창' DF를 불러온 뒤,
-        현재가 1틱을 맨 뒤에 붙여 실시간 스냅샷을 만든다.
+      - feed.snapshot_frame()로 캐시된 '마감창 + 1행' DF를 불러와
+        마지막 행만 현재가 1틱으로 덮어써 실시간 스냅샷을 만든다(틱당 스칼라 쓰기 3회).
       - 지표 계산은 외부에서(partial_recompute_indicators) 수행.
+      - 반환 DF는 feed 캐시 공유본이므로 다음 틱에 내용이 바뀜.
+        보관하려면 호출자가 copy() 할 것.
     """
-    closed = feed.get_closed_window(symbol, interval)
-    if closed.empty:
+    df = feed.snapshot_frame(symbol, interval)
+    n = len(df) - 1
+    if n <= 0:
         raise RuntimeError(f"[snapshot] closed window empty: {symbol} {interval} (warm_build 먼저)")
 
     px = float(live_price) if live_price is not None else float(get_price(symbol))
 
-    interval_ms = interval_to_ms(interval)
-    last_close = float(closed.iloc[-1]["close"])
-    syn = {
-        "open_time": pd.to_datetime(closed.iloc[-1]["open_time"]) + pd.Timedelta(milliseconds=interval_ms),
-        "open": last_close,
-        "high": max(last_close, px),
-        "low": min(last_close, px),
-        "close": px,
-        "volume": 0.0,
-    }
-    df_rt = pd.concat([closed, pd.DataFrame([syn])], ignore_index=True)
-
-    # 컬럼 정규화
-    df_rt["open_time"] = pd.to_datetime(df_rt["open_time"], utc=True).dt.tz_convert(None)
-    for c in ["open", "high", "low", "close", "volume"]:
-        df_rt[c] = pd.to_numeric(df_rt[c], errors="coerce")
-    df_rt = df_rt.dropna(subset=["open_time","open","high","low","close","volume"]).reset_index(drop=True)
-    return df_rt
+    # 마감창([:N])과 synthetic 행의 open_time/open/volume은 롤오버 때만 채워짐 → 여기서는 high/low/close만 기록
+    last_close = df.iat[n, _OPEN]
+    df.iat[n, _HIGH] = max(last_close, px)
+    df.iat[n, _LOW] = min(last_close, px)
+    df.iat[n, _CLOSE] = px
+    return df
 
 # ------------------------------
 # 전략 인스턴스 가져오기 헬퍼
@@ -93,9 +115,8 @@ def _strategy_for(runner: StrategyRunner, symbol: str):
     - spec.strategy 가 이미 인스턴스면 그대로 반환
     - 문자열이면 registry를 통해 인스턴스화 (spec.params 주입)
     - runner.strategy_map 이 있으면 거기서도 검색
+    - 리플렉션 비용이 있으므로 루프에서 매 틱 호출하지 말고 init 시 1회 캐시할 것
     """
-    from src.strategy.base import Strategy  # isinstance 체크용
-
     # 0) runner.targets 에서 심볼 스펙 찾기
     spec = None
     if hasattr(runner, "targets"):
@@ -126,22 +147,17 @@ def _strategy_for(runner: StrategyRunner, symbol: str):
 
     if name:
         try:
-            import src.strategy.registry as reg
             # 선호: 생성 헬퍼가 있는 경우
-            for factory in ("create", "make", "instantiate"):
-                if hasattr(reg, factory):
-                    return getattr(reg, factory)(name, **params)
+            if _registry_create is not None:
+                return _registry_create(name, **params)
             # 클래스 조회 후 뉴
-            for getter in ("get", "get_strategy", "get_class"):
-                if hasattr(reg, getter):
-                    cls = getattr(reg, getter)(name)
-                    return cls(**params)
+            if _registry_get is not None:
+                return _registry_get(name)(**params)
             # 딕셔너리 레지스트리 케이스
-            for table in ("REGISTRY", "registry", "STRATEGIES", "STRATEGY_REGISTRY"):
-                if hasattr(reg, table):
-                    cls = getattr(reg, table).get(name)
-                    if cls is not None:
-                        return cls(**params)
+            if _registry_table is not None:
+                cls = _registry_table.get(name)
+                if cls is not None:
+                    return cls(**params)
         except Exception as e:
             raise RuntimeError(f"strategy registry resolve failed for '{name}': {e}")
 
@@ -165,18 +181,27 @@ def init_with_rolling_feed_and_full_compute(
     *,
     lookback_min: int = 300,
     nan_mode: str = "leading",
-) -> tuple[Dict[str, pd.DataFrame], RollingFeed]:
+    float32: bool = False,
+) -> tuple[Dict[str, pd.DataFrame], RollingFeed, Dict[str, Strategy]]:
     """
-    메인 루프 '직전' 1회만 호출:
-      1) 각 심볼/인터벌에 대해 RollingFeed.warm_build_or_update 실행(전략 미지정)
+    메인 루프 '직전' 1회만 호출(main/main_trade 공용):
+      1) 각 심볼/인터벌에 대해 공용 RollingFeed(get_feed).warm_build_or_update 실행(전략 미지정)
       2) feed의 '마감창' + 현재가 1틱 스냅샷(OHLCV) 생성
       3) '전체 지표 계산'으로 df_cache[symbol] 채움
       4) 지표 NaN의 leading 구간 절단
-    반환: (df_cache, feed)
+    반환: (df_cache, feed, strategy_map)
+      - strategy_map: 심볼 → 전략 인스턴스(루프에서 _strategy_for 재호출 방지용 캐시)
     """
-    feed = RollingFeed()
+    feed = get_feed(float32=float32)
     interval = runner.interval
     df_cache: Dict[str, pd.DataFrame] = {}
+    strategy_map: Dict[str, Strategy] = {}
+
+    # 링버퍼 슬롯은 부팅 시 전 심볼 선할당 — tick 스레드 동시 실행 중 _grow(재할당)가 없도록
+    feed.reserve(
+        [spec.symbol for spec in runner.targets], interval,
+        max((max(runner.required_history(spec.symbol), lookback_min) for spec in runner.targets), default=lookback_min),
+    )
 
     for spec in runner.targets:
         symbol = spec.symbol
@@ -196,67 +221,194 @@ def init_with_rolling_feed_and_full_compute(
 
         # (3) 전체 지표 1회 계산 → 캐시에 저장
         strat = _strategy_for(runner, symbol)
+        strategy_map[symbol] = strat
         df_full = strat.compute_indicators(df_base.copy())
 
-        # (4) 초기 NaN 정리
-        df_full = _drop_indicator_nans(df_full, mode=nan_mode)
+        # (4) 초기 NaN 정리 + 길이 상한(lookback + 진행중 1행)
+        df_full = _trim_tail(_drop_indicator_nans(df_full, mode=nan_mode), lookback + 1)
 
         df_cache[symbol] = df_full
-        print(f"[INIT/FULL] {symbol}: rows={len(df_full)} (nan_mode={nan_mode})")
+        # 부팅 신호는 이미 계산된 df_full로 1회만 판단(첫 틱에서 전체 재계산 없음 → 이후 틱은 부분 재계산)
+        print(f"[INIT/FULL] {symbol}: rows={len(df_full)} (nan_mode={nan_mode}) signal={strat.generate_signal(df_full) or 'WAIT'}")
+
+    return df_cache, feed, strategy_map
+
+def build_loop_plan(
+    runner: StrategyRunner,
+    strategy_map: Dict[str, Strategy],
+    *,
+    lookback_min: int = 300,
+) -> list[tuple[str, int, Strategy]]:
+    """루프 불변값 (symbol, lookback, strat) 목록 — 부팅 시 1회만 계산"""
+    return [
+        (spec.symbol, max(runner.required_history(spec.symbol), lookback_min), strategy_map[spec.symbol])
+        for spec in runner.targets
+    ]
+
+# ------------------------------------------
+# 1틱 처리(심볼 단위) + 심볼 간 동시 실행
+# ------------------------------------------
+# (심볼, 전략명, 인터벌) → (lo, hi, signal): 같은 바 안에서 현재가가 (lo, hi) 안이면 재계산 없이 signal 재사용
+_BANDS: Dict[tuple, tuple] = {}
+
+def _signal_band(strat: Strategy, df: pd.DataFrame, px: float) -> Optional[tuple[float, float]]:
+    """전략 경계가격 중 px를 감싸는 가장 가까운 두 값(없으면 ±inf). 전략 미지원 시 None"""
+    pts = strat.signal_breakpoints(df)
+    if pts is None:
+        return None
+    lo = max((p for p in pts if p < px), default=float("-inf"))
+    hi = min((p for p in pts if p > px), default=float("inf"))
+    return lo, hi
+
+def tick_symbol(
+    feed: RollingFeed,
+    df_prev: pd.DataFrame,
+    symbol: str,
+    interval: str,
+    lookback: int,
+    strat: Strategy,
+    *,
+    live_price: float | None = None,
+    check_rollover: bool = True,
+) -> tuple[pd.DataFrame, Optional[str], bool]:
+    """
+    역할: 심볼 1개의 1틱 처리 — 롤오버 → 스냅샷(현재가) → 부분 재계산 → 신호
+    반환: (갱신된 지표 DF, signal, 롤오버 여부)
+    - live_price: WS 현재가(None이면 REST get_price)
+    - check_rollover=False: WS가 바 마감을 알려주지 않은 틱은 REST 롤오버 확인 생략
+    - 바 안에서 현재가가 신호 경계 구간(_BANDS) 안이면 재계산/신호 판단 생략
+      (df_prev 마지막 행의 high/low/close만 현재가로 갱신해 반환 — 지표 컬럼은 직전 계산값)
+    - 심볼별로 feed 캐시 키/전략 인스턴스가 분리돼 있어 심볼 간 병렬 호출 안전
+    """
+    # (1) 롤오버 감지/갱신 (전략 dict 비워서 데이터 창만 관리)
+    rolled = False
+    if check_rollover:
+        rolled = feed.rollover_if_needed(symbol, interval, lookback=lookback, strategies={})
+
+    # (1-1) 조기 종료: 같은 바 + 경계 미돌파 → 신호 불변(가격 컬럼만 현재가 반영)
+    band_key = (symbol, strat.name(), interval)
+    band = None if rolled else _BANDS.get(band_key)
+    if band is not None:
+        if live_price is None:
+            live_price = float(get_price(symbol))
+        lo, hi, sig = band
+        if lo < live_price < hi:
+            n = len(df_prev) - 1
+            o = df_prev.iat[n, _OPEN]
+            df_prev.iat[n, _HIGH] = max(o, live_price)
+            df_prev.iat[n, _LOW] = min(o, live_price)
+            df_prev.iat[n, _CLOSE] = live_price
+            return df_prev, sig, rolled
+
+    # (2) 스냅샷(OHLCV만)
+    df_base = build_snapshot_from_feed(feed, symbol, interval, live_price=live_price)
+
+    # (3) 부분 재계산: 캐시된 지표 DF를 기반으로 '필요한 뒤쪽만' 갱신
+    df_new, meta = partial_recompute_indicators(
+        strat,
+        df_with_ind=df_prev,      # 직전까지 지표 포함 DF
+        df_new_base=df_base,      # 이번 틱 OHLCV 스냅샷
+        safety_buffer=None        # 1바 롤오버는 update_last 2회(O(1)), 그 외 재계산은 창 전체라 버퍼 불필요
+    )
+    # 캐시 길이 상한: 스냅샷(마감창 lookback + 진행중 1행) 이상은 보관하지 않음
+    df_new = _trim_tail(df_new, lookback + 1)
+    # 디버깅/관찰용:
+    # print(f"[{symbol}] partial meta: {meta}")
+
+    # (4) 신호 판단(전략 표준 인터페이스) + 다음 틱용 경계 구간 갱신
+    signal = strat.generate_signal(df_new)
+    lohi = _signal_band(strat, df_new, float(df_new["close"].iat[-1]))
+    if lohi is None:
+        _BANDS.pop(band_key, None)
+    else:
+        _BANDS[band_key] = (*lohi, signal)
+    return df_new, signal, rolled
 
-    return df_cache, feed
+async def tick_all(
+    feed: RollingFeed,
+    df_cache: Dict[str, pd.DataFrame],
+    loop_plan: list,
+    interval: str,
+    *,
+    stream: MarketStream | None = None,
+) -> Dict[str, Optional[str]]:
+    """
+    역할: loop_plan의 모든 심볼을 동시에 1틱 처리(대부분 REST 대기 → 스레드로 겹침)
+    - 1회 스캔 시간이 O(심볼 수 × RTT) → O(RTT)
+    - stream(연결 시): 현재가는 WS 값, 롤오버 REST 확인은 바 마감 신호가 온 심볼만
+    - WS 가격이 없는 심볼은 get_prices로 묶어 REST 1회 조회(실패 시 심볼별 get_price)
+    - df_cache는 여기서 갱신, 반환: {symbol: signal}
+    - loop_plan 원소는 앞 3개가 (symbol, lookback, strat)
+    """
+    items = [(p[0], p[1], p[2]) for p in loop_plan]
+    live = stream is not None and stream.connected
+
+    px_map = {s: stream.price(s) for s, _, _ in items} if live else {}
+    missing = [s for s, _, _ in items if px_map.get(s) is None]
+    if missing:
+        try:
+            px_map.update(await asyncio.to_thread(get_prices, missing))
+        except Exception as e:
+            print(f"[prices] batch fetch failed: {e}")
+
+    def _kw(symbol):
+        kw = {"live_price": px_map.get(symbol)}
+        if live:
+            kw["check_rollover"] = stream.closed_pending(symbol)
+        return kw
+
+    results = await asyncio.gather(*(
+        asyncio.to_thread(tick_symbol, feed, df_cache[symbol], symbol, interval, lookback, strat, **_kw(symbol))
+        for symbol, lookback, strat in items
+    ), return_exceptions=True)
+    signals: Dict[str, Optional[str]] = {}
+    for (symbol, _, _), res in zip(items, results):
+        if isinstance(res, BaseException):
+            print(f"[{symbol}] tick error: {res}")
+            signals[symbol] = None
+            continue
+        df_cache[symbol], signals[symbol], _ = res
+        # 마감 신호는 마감창이 그 바를 실제로 담았을 때만 해제(REST 반영 지연 시 다음 틱에 재확인)
+        if stream is not None and stream.closed_pending(symbol):
+            stream.clear_closed(symbol, feed.last_closed_ms(symbol, interval))
+    return signals
 
 # -----------
 # 메인 루프
 # -----------
-def main():
+async def _main_async():
     CFG = load_config("config/base.yaml")
     runner = StrategyRunner(CFG)
     interval = runner.interval
 
     # (A) RollingFeed 초기화 + 전체 1회 계산으로 캐시 채우기
-    df_cache, feed = init_with_rolling_feed_and_full_compute(
+    df_cache, feed, strategy_map = init_with_rolling_feed_and_full_compute(
         runner,
         lookback_min=300,
         nan_mode="leading",
+        float32=CFG.indicators.float32,
     )
 
-    # (B) 루프: 부분 재계산 + 신호 판단
+    # 루프 불변값(심볼/lookback/전략)은 1회만 계산
+    loop_plan = build_loop_plan(runner, strategy_map, lookback_min=300)
+
+    # WS 시세(체결가/바 마감) — 미연결 시 tick_all이 REST 폴링으로 폴백
+    stream = MarketStream([p[0] for p in loop_plan], interval)
+    stream.start()
+
+    # (B) 루프: 이벤트(체결/마감) 또는 최대 1초마다 심볼 동시 처리 후 출력
     while True:
-        for spec in runner.targets:
-            symbol = spec.symbol
-            need = runner.required_history(symbol)
-            lookback = max(need, 300)
-
-            # (1) 롤오버 감지/갱신 (전략 dict 비워서 데이터 창만 관리)
-            feed.rollover_if_needed(
-                symbol, interval,
-                lookback=lookback,
-                strategies={}
-            )
-
-            # (2) 스냅샷(OHLCV만)
-            df_base = build_snapshot_from_feed(feed, symbol, interval, live_price=None)
-
-            # (3) 부분 재계산: 캐시된 지표 DF(df_cache[symbol])를 기반으로 '필요한 뒤쪽만' 갱신
-            strat = _strategy_for(runner, symbol)
-            df_cache[symbol], meta = partial_recompute_indicators(
-                strat,
-                df_with_ind=df_cache[symbol],  # 직전까지 지표 포함 DF
-                df_new_base=df_base,           # 이번 틱 OHLCV 스냅샷
-                safety_buffer=2                # 필요시 조정/해제 가능
-            )
-            # 디버깅/관찰용:
-            # print(f"[{symbol}] partial meta: {meta}")
-
-            # (4) 신호 판단(전략 표준 인터페이스)
-            signal = strat.generate_signal(df_cache[symbol])
-
-            price = float(df_cache[symbol].iloc[-1]["close"])
-            print(f"[{symbol}] {signal or 'WAIT'} @ {price}")
-
-        time.sleep(1)  # 1초 단위 판단(원하면 조절)
+        await asyncio.to_thread(stream.wait, POLL_S)
+        signals = await tick_all(feed, df_cache, loop_plan, interval, stream=stream)
+        for symbol, _, _ in loop_plan:
+            price = float(df_cache[symbol]["close"].iat[-1])
+            print(f"[{symbol}] {signals.get(symbol) or 'WAIT'} @ {price}")
+
+        await asyncio.sleep(MIN_TICK_S)  # 체결 폭주 시 스로틀
+
+def main():
+    asyncio.run(_main_async())
 
 if __name__ == "__main__":
     # 실행코드: python -m src.main
-    main()
\ No newline at end of file
+    main()
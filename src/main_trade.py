@@ -1,21 +1,22 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
-import time
+import time, asyncio
 from typing import Dict, Optional
-import pandas as pd
 
 from config.config_loader import load_config
 from src.strategy_manager import StrategyRunner
-from src.data.rolling_feed import RollingFeed
-from src.indicators.partial_utils import partial_recompute_indicators
 from src.notifier.slack_notifier import notify
 from src.trade.order_manager import OrderManager, load_state, save_state  # 네가 만든 JSON state
 from src.trade.signal_router import SignalRouter, DEFAULTS
-from src.main import build_snapshot_from_feed, _drop_indicator_nans, _strategy_for  # 재사용
+from src.exchange.ws import MarketStream
+from src.order_executor import reconcile_wal, prime_syminfo
+from src.main import (  # 재사용
+    init_with_rolling_feed_and_full_compute, build_loop_plan, tick_all, POLL_S, MIN_TICK_S,
+)
 
 COOLDOWN_S = 10  # 심볼당 신호 실행 쿨다운
 
-def main():
+async def _main_async():
     CFG = load_config("config/base.yaml")
     runner = StrategyRunner(CFG)
     interval = runner.interval
@@ -24,76 +25,89 @@ def main():
     om = OrderManager(state_path="data/orders_state.json")
     router = SignalRouter(om, dry_run=True, allow_mainnet=False)  # 실제 돌릴 땐 dry_run=False
 
-    # 초기 캐시
-    feed = RollingFeed()
-    df_cache: Dict[str, pd.DataFrame] = {}
-    last_signal: Dict[str, Optional[str]] = {}
-    last_exec_ts: Dict[str, float] = {}
-
-    # 부팅: warm + 전체 1회 계산
-    for spec in runner.targets:
-        symbol = spec.symbol
-        need = runner.required_history(symbol)
-        lookback = max(need, 300)
-
-        feed.warm_build_or_update(symbol, interval, lookback=lookback, strategies={}, fetch_limit_per_call=1000)
-        df_base = build_snapshot_from_feed(feed, symbol, interval)
-        strat = _strategy_for(runner, symbol)
-
-        df_full = strat.compute_indicators(df_base.copy())
-        df_full = _drop_indicator_nans(df_full, mode="leading")
-
-        df_cache[symbol] = df_full
-        last_signal[symbol] = None
-        last_exec_ts[symbol] = 0.0
-
-        print(f"[INIT/FULL] {symbol}: rows={len(df_full)}")
-
-    # 루프
-    while True:
-        for spec in runner.targets:
-            symbol = spec.symbol
-            need = runner.required_history(symbol)
-            lookback = max(need, 300)
+    # 직전 실행에서 결과 미확정으로 남은 주문(크래시/응답 유실) 확인 — 새 id로 중복 전송하지 않도록
+    # 접수가 확인된 주문은 상태에 기록(WAL에서는 지워지므로 여기서 놓치면 추적 불가)
+    def _record_found(kind, resp):
+        if kind == "oco":
+            om.record_oco_attached(resp)
+        else:
+            om.record_entry(resp)
+    wal = reconcile_wal(on_found=_record_found)
+    if wal["found"]:
+        om.persist(force=True)
+    if any(wal.values()):
+        msg = (f"[wal] found={len(wal['found'])} missing={len(wal['missing'])} "
+               f"unknown={len(wal['unknown'])}")
+        print(msg); notify(msg)
+
+    # 부팅: 공용 feed warm + 전체 1회 계산(main.py와 동일 경로)
+    df_cache, feed, strategy_map = init_with_rolling_feed_and_full_compute(
+        runner,
+        lookback_min=300,
+        nan_mode="leading",
+        float32=CFG.indicators.float32,
+    )
+    # (symbol, lookback, strat, strat_name) — 루프 불변값은 부팅 시 1회만 계산
+    loop_plan = [p + (p[2].name(),) for p in build_loop_plan(runner, strategy_map, lookback_min=300)]
+    last_signal: Dict[str, Optional[str]] = {p[0]: None for p in loop_plan}
+    # 심볼별 BUY 파라미터 고정(전략별 오버라이드는 여기서 지정) — 신호마다 머지/캐스팅 없음
+    for p in loop_plan:
+        router.register_strategy(
+            p[0],
+            buy_quote_usdt=DEFAULTS["buy_quote_usdt"],
+            tp_pct=DEFAULTS["tp_pct"],
+            sl_pct=DEFAULTS["sl_pct"],
+            tif=DEFAULTS["tif"],
+            auto_adjust=DEFAULTS["auto_adjust"],
+        )
+    last_exec_ts: Dict[str, float] = {p[0]: 0.0 for p in loop_plan}
+
+    # 주문 경로 심볼 필터 캐시 예열(exchangeInfo 1회) — 실패해도 주문 시 개별 조회로 폴백
+    try:
+        prime_syminfo([p[0] for p in loop_plan])
+    except Exception as e:
+        print(f"[warn] prime_syminfo failed: {e}")
+
+    # WS 시세(체결가/바 마감) — 미연결 시 tick_all이 REST 폴링으로 폴백
+    stream = MarketStream([p[0] for p in loop_plan], interval)
+    stream.start()
+
+    # 루프: 데이터/지표/신호는 심볼 동시 처리, 주문은 순차(OrderManager 상태 보호)
+    try:
+        while True:
+            await asyncio.to_thread(stream.wait, POLL_S)
+            signals = await tick_all(feed, df_cache, loop_plan, interval, stream=stream)
+
+            for symbol, lookback, strat, strat_name in loop_plan:
+                signal = signals.get(symbol)
+                price = float(df_cache[symbol]["close"].iat[-1])
+                print(f"[{symbol}] {signal or 'WAIT'} @ {price}")
+
+                # 디바운스 & 쿨다운
+                now = time.time()
+                if signal and signal != last_signal[symbol] and (now - last_exec_ts[symbol] >= COOLDOWN_S):
+                    # 주문 실행(워커 스레드 — 재시도 대기 중에도 이벤트 루프/WS 대기는 계속 동작)
+                    res = await asyncio.to_thread(
+                        router.handle_signal,
+                        symbol=symbol,
+                        signal=signal,
+                        meta={"from": strat_name},
+                        # BUY 파라미터는 부팅 시 register_strategy로 고정(여기서 넘기면 그 호출은 DEFAULTS 기준 머지 경로)
+                    )
+                    last_signal[symbol] = signal
+                    last_exec_ts[symbol] = now
+
+                    # 상태 저장(활성 OCO 갱신 등은 너의 OrderManager.sync_*에 따라 별도 주기 동기)
+                    om.persist()
+
+            om.persist()   # 디바운스로 밀린 변경분을 루프마다 합쳐 기록(변경 없으면 사실상 no-op)
+            await asyncio.sleep(MIN_TICK_S)
+    finally:
+        om.close()   # 저널 → 스냅샷 compaction
+        stream.stop()
 
-            # 롤오버
-            feed.rollover_if_needed(symbol, interval, lookback=lookback, strategies={})
-
-            # 스냅샷(OHLCV)
-            df_base = build_snapshot_from_feed(feed, symbol, interval)
-
-            # 부분 재계산
-            strat = _strategy_for(runner, symbol)
-            df_cache[symbol], meta = partial_recompute_indicators(
-                strat, df_with_ind=df_cache[symbol], df_new_base=df_base, safety_buffer=2
-            )
-            # 신호
-            signal = strat.generate_signal(df_cache[symbol])
-            price = float(df_cache[symbol].iloc[-1]["close"])
-            print(f"[{symbol}] {signal or 'WAIT'} @ {price}")
-
-            # 디바운스 & 쿨다운
-            now = time.time()
-            if signal and signal != last_signal[symbol] and (now - last_exec_ts[symbol] >= COOLDOWN_S):
-                # 주문 실행
-                res = router.handle_signal(
-                    symbol=symbol,
-                    signal=signal,
-                    meta={"from": strat.name()},
-                    # 전략별 파라미터 오버라이드 가능:
-                    buy_quote_usdt=DEFAULTS["buy_quote_usdt"],
-                    tp_pct=DEFAULTS["tp_pct"],
-                    sl_pct=DEFAULTS["sl_pct"],
-                    tif=DEFAULTS["tif"],
-                    auto_adjust=DEFAULTS["auto_adjust"],
-                )
-                last_signal[symbol] = signal
-                last_exec_ts[symbol] = now
-
-                # 상태 저장(활성 OCO 갱신 등은 너의 OrderManager.sync_*에 따라 별도 주기 동기)
-                om.persist()
-
-        time.sleep(1)
+def main():
+    asyncio.run(_main_async())
 
 if __name__ == "__main__":
     # 실행: python -m src.main_trade
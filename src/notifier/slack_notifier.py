@@ -1,35 +1,143 @@
 # -*- coding: utf-8 -*-
+"""
+Slack 알림
+- notify()는 큐에 넣고 즉시 반환(매매 루프를 네트워크 지연으로 막지 않음)
+- 백그라운드 데몬 스레드가 BATCH_WINDOW_S 동안 모인 메시지를 채널별로 합쳐 1회 전송
+- httpx.Client로 slack.com 연결 재사용(h2 설치 시 HTTP/2), httpx가 없으면 urllib3 PoolManager
+  → 매 호출 TLS 핸드셰이크 제거
+- JSON 인코딩/디코딩은 jsonio(orjson 있으면 사용)
+- 종료 시 flush()로 남은 메시지 전송(atexit 등록)
+"""
 from __future__ import annotations
-import os, json, time, urllib.request
+import os, time, queue, threading, atexit
+import urllib3
+
+from src.data import jsonio
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - 선택 의존성
+    httpx = None
+try:
+    import h2  # noqa: F401  (httpx http2=True 요구사항)
+    _HAVE_H2 = True
+except ImportError:  # pragma: no cover - 선택 의존성
+    _HAVE_H2 = False
 
 SLACK_TOKEN = os.getenv("SLACK_API_KEY")  # settings.get_api_config()로도 가능하면 그쪽을 사용
 DEFAULT_CHANNEL = os.getenv("SLACK_CHANNEL", "#trading-bot")
+POST_URL = "https://slack.com/api/chat.postMessage"
+
+BATCH_WINDOW_S = 0.1     # 첫 메시지 이후 추가 메시지를 모으는 시간
+BATCH_MAX = 20           # 1회 배치 최대 메시지 수
+QUEUE_MAX = 1000
+
+if httpx is not None:
+    _HTTP = httpx.Client(http2=_HAVE_H2, timeout=httpx.Timeout(10.0, connect=5.0))
+else:
+    _HTTP = urllib3.PoolManager(num_pools=2, maxsize=2, retries=False,
+                                timeout=urllib3.Timeout(connect=5.0, read=10.0))
+_Q: "queue.Queue[tuple]" = queue.Queue(maxsize=QUEUE_MAX)
+_worker: threading.Thread | None = None
+_worker_lock = threading.Lock()
 
 def _post_json(url: str, data: dict, token: str):
-    req = urllib.request.Request(url, data=json.dumps(data).encode("utf-8"))
-    req.add_header("Content-Type", "application/json; charset=utf-8")
+    headers = {"Content-Type": "application/json; charset=utf-8"}
     if token:
-        req.add_header("Authorization", f"Bearer {token}")
-    with urllib.request.urlopen(req, timeout=10) as r:
-        return json.loads(r.read().decode("utf-8"))
+        headers["Authorization"] = f"Bearer {token}"
+    body = jsonio.dumps(data)
+    if httpx is not None:
+        return jsonio.loads(_HTTP.post(url, content=body, headers=headers).content)
+    return jsonio.loads(_HTTP.request("POST", url, body=body, headers=headers).data)
+
+def _send(ch: str, text: str, blocks: list | None) -> dict:
+    payload = {"channel": ch, "text": text}
+    if blocks:
+        payload["blocks"] = blocks
+    try:
+        return _post_json(POST_URL, payload, SLACK_TOKEN)
+    except Exception as e:
+        return {"ok": False, "error": str(e), "text": text, "channel": ch}
+
+def _drain_batch(first: tuple) -> list:
+    """first 이후 BATCH_WINDOW_S 동안 최대 BATCH_MAX개까지 추가 수집"""
+    batch = [first]
+    deadline = time.monotonic() + BATCH_WINDOW_S
+    while len(batch) < BATCH_MAX:
+        left = deadline - time.monotonic()
+        if left <= 0:
+            break
+        try:
+            batch.append(_Q.get(timeout=left))
+        except queue.Empty:
+            break
+    return batch
 
-def notify(text: str, *, channel: str | None = None, blocks: list | None = None) -> dict:
+def _worker_loop():
+    while True:
+        batch = _drain_batch(_Q.get())
+        try:
+            # 연속된 같은 채널 text-only 메시지는 줄바꿈으로 합쳐 1회 전송, blocks 메시지는 개별 전송(순서 유지)
+            run_ch, run = None, []
+            for ch, text, blocks in batch:
+                if run and (blocks or ch != run_ch):
+                    _send(run_ch, "\n".join(run), None)
+                    run = []
+                if blocks:
+                    _send(ch, text, blocks)
+                else:
+                    run_ch = ch
+                    run.append(text)
+            if run:
+                _send(run_ch, "\n".join(run), None)
+        finally:
+            for _ in batch:
+                _Q.task_done()
+
+def _ensure_worker():
+    global _worker
+    if _worker is not None and _worker.is_alive():
+        return
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_worker_loop, name="slack-notifier", daemon=True)
+            _worker.start()
+
+def flush(timeout: float | None = 10.0) -> bool:
+    """
+    역할: 큐에 남은 메시지 전송 완료까지 대기(종료 직전 호출)
+    output: 시간 내 모두 처리되면 True
+    """
+    if _worker is None:
+        return True
+    end = None if timeout is None else time.monotonic() + timeout
+    while _Q.unfinished_tasks:
+        if end is not None and time.monotonic() >= end:
+            return False
+        time.sleep(0.05)
+    return True
+
+atexit.register(flush)
+
+def notify(text: str, *, channel: str | None = None, blocks: list | None = None, sync: bool = False) -> dict:
     """
     역할: Slack 채널에 메시지 전송
     input: text(필수), channel(없으면 DEFAULT_CHANNEL), blocks(선택)
-    output: Slack API 응답(dict)
+           sync=True면 큐를 거치지 않고 즉시 전송(응답이 필요할 때)
+    output: 큐 적재 시 {"ok": True, "queued": True, ...} / sync면 Slack API 응답(dict)
     """
     ch = channel or DEFAULT_CHANNEL
     if not SLACK_TOKEN:
         return {"ok": False, "error": "SLACK_TOKEN_MISSING", "text": text, "channel": ch}
 
-    payload = {"channel": ch, "text": text}
-    if blocks:
-        payload["blocks"] = blocks
+    if sync:
+        return _send(ch, text, blocks)
+    _ensure_worker()
     try:
-        return _post_json("https://slack.com/api/chat.postMessage", payload, SLACK_TOKEN)
-    except Exception as e:
-        return {"ok": False, "error": str(e), "text": text, "channel": ch}
+        _Q.put_nowait((ch, text, blocks))
+    except queue.Full:
+        return {"ok": False, "error": "SLACK_QUEUE_FULL", "text": text, "channel": ch}
+    return {"ok": True, "queued": True, "channel": ch}
 
 def fmt_order_msg(
     *, title: str, symbol: str, side: str, price: str | float | None, qty: str | float | None,
@@ -25,22 +25,27 @@
 
 외부 연결
 ---------
-- src.exchange.market: get_price, get_symbol_info
+- src.exchange.market: get_price, get_symbol_info, get_symbols_info (심볼별 필터/자산은 _syminfo로 캐시)
 - src.exchange.filters: extract_filters, normalize_*, ensure_min_notional, to_api_str
-- src.exchange.orders: place_test_order, place_order, place_oco_order
-- src.exchange.account: get_balances_map, get_symbol_assets
+- src.exchange.orders: place_test_order, place_order, place_oco_order, get_order, get_order_list(전송 결과 확인)
+- src.exchange.account: get_balances_map
 """
 
 from __future__ import annotations
-import time, uuid
-from typing import Dict, Any
-from decimal import Decimal, ROUND_UP
-
-from src.exchange.account import get_balances_map, get_symbol_assets
-from src.exchange.market import get_price, get_symbol_info
-from src.exchange.orders import place_test_order, place_order, place_oco_order
+import functools, random, re, secrets, threading, time, itertools
+from typing import Callable, Dict, Any, NamedTuple, TypedDict
+from decimal import Decimal, Context, ROUND_DOWN, localcontext
+from concurrent.futures import ThreadPoolExecutor
+import requests
+
+from src.exchange.core import BinanceAPIError
+from src.data.journal import Journal
+from src.exchange.account import get_balances_map
+from src.exchange.market import get_price, get_symbol_info, get_symbols_info
+from src.exchange.orders import place_test_order, place_order, place_oco_order, get_order, get_order_list
 from src.exchange.filters import (
-    extract_filters, normalize_qty, normalize_price, ensure_min_notional, to_api_str
+    extract_filters, normalize_qty, normalize_price, ensure_min_notional, ceil_steps_for_notional,
+    to_api_str, api_formatter,
 )
 
 # =========================
@@ -49,16 +54,184 @@ from src.exchange.filters import (
 
 # 재시도 대상(경험칙 + Binance 문서 기반)
 RETRYABLE_HTTP = {429, 418, 500, 502, 503, 504}  # 레이트리밋/캡차/서버오류
-RETRYABLE_CODE = {-1021, -1003}  # 서버시간오류/레이트리밋 등 (core.request 1차 방어 이후)
+# 서버시간오류/레이트리밋(core.request 1차 방어 이후) + 서버측 일시 오류
+# -1000 UNKNOWN, -1001 DISCONNECTED, -1003 TOO_MANY_REQUESTS, -1006 UNEXPECTED_RESP,
+# -1007 TIMEOUT, -1015 TOO_MANY_ORDERS, -1021 INVALID_TIMESTAMP
+# 그 외 코드(-1013 필터, -1111 정밀도, -2010 잔고 등 결정적 거절)는 재시도 없이 즉시 실패
+RETRYABLE_CODE = {-1000, -1001, -1003, -1006, -1007, -1015, -1021}
+# 전송 결과 불명(접수됐을 수 있음) 코드 — 재전송 전 probe 대상
+AMBIGUOUS_CODE = {-1006, -1007}
+# 조회 결과 '주문 없음' 확정 코드(-2013 NO_SUCH_ORDER, -2011 UNKNOWN_ORDER) — 그 외 4xx는 미확정
+MISSING_CODE = {-2013, -2011}
 MAX_RETRY = 2                     # 최대 2회 재시도(총 3번 시도)
-BACKOFF_S = [0.5, 1.5]            # 지수 백오프 유사: 0.5s → 1.5s
+BACKOFF_BASE_S = 0.25             # 재시도 대기 상한: BASE * 2^i (0.25s → 0.5s → ...)
+BACKOFF_CAP_S = 8.0               # 대기 상한의 최댓값, 실제 대기는 [0, 상한) 균등 난수(full jitter)
+RETRY_BUDGET_S = 10.0             # 한 주문의 재시도 대기 합 상한(초과할 재시도는 하지 않음)
+# i번째 재시도 대기 상한(결정적 부분) — import 시 1회 계산
+BACKOFF_CAPS = tuple(min(BACKOFF_CAP_S, BACKOFF_BASE_S * (1 << i)) for i in range(MAX_RETRY + 1))
+# 타입 정보 없는 예외(외부 래퍼 등)용 메시지 매칭 — RETRYABLE_HTTP/RETRYABLE_CODE와 동일 집합
+_RETRY_RE = re.compile(r" (?:429|418|50[0234])\b|-10(?:00|01|03|06|07|15|21)\b")
+
+# 전송 직전 현재가 재조회: 직전 조회가 이 시간 이내면 재사용(REST 1회 절약)
+PRICE_REUSE_S = 0.25
+
+# 서킷 브레이커: 재시도 대상 실패(레이트리밋/서버오류/네트워크)가 연속 CB_MAX_FAILS회면
+# CB_OPEN_S 범위의 난수 시간 동안 전송 차단(동시 호출자들이 같은 박자로 재시도하지 않도록 지터)
+CB_MAX_FAILS = 3
+CB_OPEN_S = (5.0, 15.0)
+_CB: dict[str, Any] = {"fails": 0, "open_until": 0.0, "lock": threading.Lock()}
+
+# 전송 WAL: 실주문 POST 직전에 clientOrderId를 fsync 기록, 결과 확정 시 done 기록
+# → 크래시/응답 유실 후 재기동 시 reconcile_wal()이 미확정 id를 조회(새 id로 중복 전송 방지)
+WAL_PATH = "data/orders_wal.jsonl"
+_WAL: Journal | None = None
+_WAL_LOCK = threading.Lock()
+_WAL_OPEN: set[str] = set()      # 이번 프로세스에서 send 후 done 전인 cid
+_WAL_UNKNOWN: Dict[str, Dict[str, Any]] = {}   # reconcile에서 조회 실패한 send 기록(cid → 기록) — 비울 때 재기록
+WAL_COMPACT_AT = 256             # 진행 중 0건 + 기록 수 이상이면 파일 비움(_WAL_UNKNOWN만 다시 씀)
+
+# 잔고 스냅샷 캐시: 짧은 TTL 내 재사용, 주문 전송 후에는 즉시 무효화
+BAL_TTL_S = 1.5
+_BAL_CACHE: dict[str, Any] = {"t": 0.0, "m": {}}
+
+ZERO = Decimal("0")               # 잔고 기본값 등 반복 생성 방지용 상수
+
+# 주문 경로 Decimal 연산 컨텍스트: 가격 ≤ 1e8, tick/step ≥ 1e-8 → 유효숫자 17자리면 충분(기본 28자리)
+# ROUND_DOWN 절단은 이후 격자 내림(quantize)과 같은 방향 → 격자 위 결과 동일
+_DEC_CTX = Context(prec=18, rounding=ROUND_DOWN)
+
+def _dec_ctx(fn):
+    """fn 본문의 Decimal 연산(필터 정규화/notional 비교 포함)을 _DEC_CTX에서 수행"""
+    @functools.wraps(fn)
+    def run(*args, **kwargs):
+        with localcontext(_DEC_CTX):
+            return fn(*args, **kwargs)
+    return run
+
+# 심볼 필터(tickSize/stepQty/minNotional)/자산은 사실상 고정 → 프로세스 내 캐시(TTL 경과 시 재조회)
+FILTERS_TTL_S = 3600
+_SYM_CACHE: dict[str, tuple[float, tuple]] = {}
+_SYM_LOCK = threading.Lock()      # 캐시 미스 조회 직렬화(동시 주문이 같은 심볼을 중복 조회하지 않도록)
+_SYM_PLAN: set[str] = set()       # prime_syminfo로 등록된 거래 대상 심볼 — 만료 일괄 갱신 범위
+
+class OrderResult(TypedDict, total=False):
+    """
+    주문 함수 공용 반환 형태(dict 그대로, 타입 표기용)
+    - 숫자 필드는 모두 to_api_str 문자열
+    - 실패: ok=False + reason(사전검증) 또는 error(전송 실패)
+    """
+    ok: bool
+    resp: Dict[str, Any]
+    dry_run: bool
+    price: str
+    qty: str
+    quote: str
+    clientOrderId: str
+    listClientOrderId: str
+    aboveClientOrderId: str
+    belowClientOrderId: str
+    price_relation: str
+    payload: Dict[str, Any]
+    reason: str
+    error: str
+    code: int | None
+    detail: str
+    explain: str
+    hint: str
+    asset: str
+    required_qty: str
+    given_qty: str
+    base_free: str
+    required_quote: str
+    quote_free: str
+    prev: str
+    now: str
+
+class SymInfo(NamedTuple):
+    """심볼 캐시 항목 — 튜플 언패킹도 그대로 가능(info, filters, tick, step, base, quote)"""
+    info: Dict[str, Any]       # exchangeInfo 심볼 엔트리
+    filters: Dict[str, Any]    # extract_filters 결과 + fmt_price/fmt_qty 포맷터
+    tick: Any                  # tickSize
+    step: Any                  # stepQty
+    base: str                  # baseAsset
+    quote: str                 # quoteAsset
+
+def get_syminfo(symbol: str) -> SymInfo:
+    """
+    심볼 정보/필터 조회(공개 API) — TTL 캐시 적중 시 HTTP/파싱 없음
+    - info/filters dict는 캐시 공유본이므로 수정 금지
+    """
+    return _syminfo(symbol)
+
+def _syminfo(symbol: str) -> SymInfo:
+    """
+    역할: SymInfo(info, filters, tick, step, base, quote) 반환 — 캐시 적중 시 HTTP/파싱 없음
+    - 반환 dict는 캐시 공유본이므로 수정 금지
+    """
+    hit = _SYM_CACHE.get(symbol)
+    if hit is not None and time.monotonic() - hit[0] < FILTERS_TTL_S:
+        return hit[1]
+    with _SYM_LOCK:
+        now = time.monotonic()
+        hit = _SYM_CACHE.get(symbol)          # 대기 중 다른 스레드가 채웠으면 그대로 사용
+        if hit is not None and now - hit[0] < FILTERS_TTL_S:
+            return hit[1]
+        # TTL 만료는 예열된 심볼들이 거의 동시에 맞음 → 거래 대상(_SYM_PLAN) 만료분을 exchangeInfo 1회로 함께 갱신
+        stale = [s for s in _SYM_PLAN if s != symbol and s in _SYM_CACHE and now - _SYM_CACHE[s][0] >= FILTERS_TTL_S]
+        if not stale:
+            return _cache_syminfo(get_symbol_info(symbol))
+        try:
+            infos = get_symbols_info([symbol] + stale)
+        except Exception as e:
+            print(f"[warn] syminfo batch refresh failed, single fetch: {e}")
+            return _cache_syminfo(get_symbol_info(symbol))
+        for sx in infos.values():
+            _cache_syminfo(sx)
+        for s in stale:
+            if s not in infos:            # 상장폐지/거래중지 등 — 만료 정보로 주문하지 않도록 제거
+                _SYM_CACHE.pop(s, None)
+        if symbol not in infos:
+            return _cache_syminfo(get_symbol_info(symbol))   # 없으면 여기서 예외
+        return _SYM_CACHE[symbol][1]
+
+def _cache_syminfo(sx: Dict[str, Any]) -> SymInfo:
+    ff = extract_filters(sx)      # 심볼 엔트리 1회 파싱 → 필터/틱/스텝/자산을 한 튜플로 캐시
+    # tick/step 고정 문자열 포맷터(to_api_str와 동일 결과) — 주문마다 step 판정/분기 생략
+    ff["fmt_price"] = api_formatter(ff.get("tickSize"))
+    ff["fmt_qty"] = api_formatter(ff.get("stepQty"))
+    payload = SymInfo(sx, ff, ff.get("tickSize"), ff.get("stepQty"), sx["baseAsset"], sx["quoteAsset"])
+    _SYM_CACHE[sx["symbol"]] = (time.monotonic(), payload)
+    return payload
+
+def prime_syminfo(symbols: list[str]) -> int:
+    """
+    부팅 시 캐시 예열 — 미스/만료 심볼만 exchangeInfo 1회로 일괄 조회(첫 주문의 조회 RTT 제거)
+    - 넘긴 심볼은 _SYM_PLAN에 등록 → 이후 TTL 만료 시 _syminfo가 이 범위만 함께 갱신
+    반환: 새로 채운 심볼 수
+    """
+    _SYM_PLAN.update(symbols)
+    now = time.monotonic()
+    need = [s for s in symbols if s not in _SYM_CACHE or now - _SYM_CACHE[s][0] >= FILTERS_TTL_S]
+    if not need:
+        return 0
+    with _SYM_LOCK:
+        infos = get_symbols_info(need)
+        for sx in infos.values():
+            _cache_syminfo(sx)
+    return len(infos)
+
+# clientOrderId = 프로세스 nonce(기동 시 1회 난수) + 단조 카운터
+# - 주문마다 엔트로피 조회 없음(nonce는 import 시 1회), 프로세스 내 충돌 불가(count.__next__는 GIL 하에서 원자적)
+# - 재기동/다중 프로세스 간 충돌은 nonce로 회피
+_PROC_NONCE = secrets.token_hex(4)
+_CTR = itertools.count(1)
 
 def _new_client_id(prefix: str = "bot") -> str:
     """
     역할: 개별 주문(clientOrderId) 생성(아이템포턴시 보장)
     - 동일 clientOrderId로 재전송하면 서버가 중복주문을 dedup 가능
     """
-    return f"{prefix}-{uuid.uuid4().hex[:12]}"
+    return f"{prefix}-{_PROC_NONCE}{next(_CTR):x}"
 
 def _new_list_ids(prefix: str) -> dict[str, str]:
     """
@@ -67,32 +240,240 @@ def _new_list_ids(prefix: str) -> dict[str, str]:
     - aboveClientOrderId: 위 다리(above)의 주문 ID
     - belowClientOrderId: 아래 다리(below)의 주문 ID
     """
-    rid = uuid.uuid4().hex[:12]
+    rid = f"{_PROC_NONCE}{next(_CTR):x}"
     return {
         "listClientOrderId":  f"{prefix}-lst-{rid}",
         "aboveClientOrderId": f"{prefix}-a-{rid}",
         "belowClientOrderId": f"{prefix}-b-{rid}",
     }
 
-def _retry_oco(call):
+# 응답 기반 재시도 판단 훅(BinanceAPIError의 status/code로 판단)
+def _should_retry(resp: Dict[str, Any] | None, status: int | None) -> bool:
+    if status and status in RETRYABLE_HTTP: return True
+    if isinstance(resp, dict) and "code" in resp and resp["code"] in RETRYABLE_CODE: return True
+    return False
+
+# 네트워크 계층 오류(응답 자체를 못 받음) → 재시도 대상
+_NETWORK_ERRORS = (requests.ConnectionError, requests.Timeout, ConnectionError, TimeoutError)
+
+def _is_retryable(e: Exception) -> bool:
     """
-    역할: OCO 전송용 간단 재시도 래퍼
-    - 텍스트 매칭으로 429/5xx/-1021/-1003 추정 시 재시도
-    - place_oco_order는 실패시 예외를 던진다고 가정
+    재시도 분류
+    - BinanceAPIError: status/code로 판단(-2010 잔고부족, -1013 필터, -1111 정밀도, 서명 오류 등은 즉시 중단)
+    - 네트워크 오류: 재시도
+    - 그 외: 메시지가 재시도 대상 코드를 담고 있을 때만(타입 정보 없는 래퍼 예외)
+    """
+    if isinstance(e, BinanceAPIError):
+        return _should_retry({"code": e.code}, e.status)
+    if isinstance(e, _NETWORK_ERRORS):
+        return True
+    return _RETRY_RE.search(str(e)) is not None
+
+def _ambiguous(e: Exception) -> bool:
+    """응답 유실/서버 오류 — 주문이 실제로는 접수됐을 수 있는 실패(4xx 거절은 미접수 확정)"""
+    if isinstance(e, BinanceAPIError):
+        return (e.status is not None and e.status >= 500) or e.code in AMBIGUOUS_CODE
+    return isinstance(e, _NETWORK_ERRORS)
+
+def _probe_sent(probe):
+    """probe()로 clientOrderId 주문 존재 확인. 없거나 조회 실패면 None(-2013 등)"""
+    try:
+        found = probe()
+    except Exception:
+        return None
+    return found or None
+
+def _wal_append(op: str, rec: Dict[str, Any]):
+    global _WAL
+    with _WAL_LOCK:
+        if _WAL is None:
+            _WAL = Journal(WAL_PATH, fsync_every=1)   # 기록마다 fsync(전송 전 영속화 보장)
+        n = _WAL.append(op, rec)
+        if op == "send":
+            _WAL_OPEN.add(rec["cid"])
+        else:
+            _WAL_OPEN.discard(rec["cid"])
+            _WAL_UNKNOWN.pop(rec["cid"], None)
+            if not _WAL_OPEN and n >= WAL_COMPACT_AT:
+                _WAL.truncate()
+                if _WAL_UNKNOWN:
+                    _WAL.extend(("send", d) for d in _WAL_UNKNOWN.values())
+
+def reconcile_wal(on_found: Callable[[str, Dict[str, Any]], Any] | None = None) -> Dict[str, list]:
+    """
+    재기동 시 1회: done 없는 send 기록(결과 미확정)을 clientOrderId로 조회
+    - on_found(kind, resp): 접수 확인된 주문을 호출자 상태(OrderManager 등)에 기록(kind: "oco"/"order")
+    - '없음'은 MISSING_CODE만 확정, 그 외 오류는 unknown(WAL에 유지, 다음 재기동 때 재조회)
+    반환: {"found": [응답...], "missing": [cid...], "unknown": [cid...(조회 실패, WAL에 유지)]}
+    """
+    global _WAL
+    with _WAL_LOCK:
+        j = _WAL or Journal(WAL_PATH, fsync_every=1)
+        pending: Dict[str, Dict[str, Any]] = {}
+        for r in j.replay():
+            d = r.get("data") or {}
+            if r["op"] == "send":
+                pending[d.get("cid")] = d
+            elif r["op"] == "done":
+                pending.pop(d.get("cid"), None)
+        out: Dict[str, list] = {"found": [], "missing": [], "unknown": []}
+        keep = []
+        for cid, d in pending.items():
+            try:
+                if d.get("kind") == "oco":
+                    resp = get_order_list(listClientOrderId=cid)
+                else:
+                    resp = get_order(d["symbol"], origClientOrderId=cid)
+                out["found"].append(resp)
+            except BinanceAPIError as e:
+                if e.code in MISSING_CODE:
+                    out["missing"].append(cid)     # 접수 안 됨 확정
+                else:
+                    out["unknown"].append(cid); keep.append(d)
+            except Exception:
+                out["unknown"].append(cid); keep.append(d)
+            else:
+                if on_found is not None:
+                    try:
+                        on_found("oco" if d.get("kind") == "oco" else "order", resp)
+                    except Exception as e:
+                        print(f"[warn] reconcile_wal on_found failed cid={cid}: {e}")
+        j.truncate()
+        if keep:
+            j.extend(("send", d) for d in keep)
+            # 다음 재기동 때 다시 확인 — _WAL_OPEN(진행 중)과 분리해 compaction을 막지 않음
+            _WAL_UNKNOWN.update((d["cid"], d) for d in keep)
+        _WAL = j
+    return out
+
+def _backoff_s(i: int) -> float:
+    """i번째 재시도 대기: truncated exponential backoff + full jitter (재시도 파도 분산)"""
+    cap = BACKOFF_CAPS[i] if i < len(BACKOFF_CAPS) else min(BACKOFF_CAP_S, BACKOFF_BASE_S * (1 << i))  # max_retry 지정 시
+    return random.uniform(0.0, cap)
+
+class CircuitOpenError(RuntimeError):
+    """서킷 오픈 중 전송 차단(메시지: CIRCUIT_OPEN ...)"""
+
+def _cb_check():
+    left = _CB["open_until"] - time.monotonic()
+    if left > 0:
+        raise CircuitOpenError(f"CIRCUIT_OPEN retry_after={left:.1f}s")
+
+def _cb_record(failed: bool) -> bool:
+    """전송 결과 기록. 반환: 이번 실패로 서킷이 열렸는지"""
+    with _CB["lock"]:
+        if not failed:
+            _CB["fails"] = 0
+            return False
+        _CB["fails"] += 1
+        if _CB["fails"] < CB_MAX_FAILS:
+            return False
+        _CB["fails"] = 0
+        _CB["open_until"] = time.monotonic() + random.uniform(*CB_OPEN_S)
+        print(f"[warn] order circuit open for {_CB['open_until'] - time.monotonic():.1f}s")
+        return True
+
+def _retry_call(fn, *args, retry_if=_is_retryable, max_retry: int = MAX_RETRY, probe=None, wal=None, **kwargs):
+    """
+    역할: 주문 전송 공용 재시도 래퍼 — fn(*args, **kwargs)를 직접 호출(주문마다 클로저 생성 없음)
+    - retry_if(e)가 False면 대기 없이 즉시 중단(기본: _is_retryable 분류)
+    - probe: 결과 불명 실패(_ambiguous) 시 재전송 전에 clientOrderId로 조회하는 함수
+      → 이미 접수됐으면 그 상태를 성공으로 반환(중복 주문/불필요한 대기 방지)
+    - wal: {"kind","symbol","cid"} — 전송 전 WAL에 send 기록, 결과가 확정되면 done 기록(결과 불명이면 남김)
+    - 서킷 오픈 중이면 전송 없이 (False, CircuitOpenError), 재시도 대상 실패는 서킷 카운트에 반영
+    - 대기 합이 RETRY_BUDGET_S를 넘게 되는 재시도는 하지 않음
+    - place_* 는 실패시 예외를 던진다고 가정
     반환: (True, result) 또는 (False, last_exception)
     """
-    last_err = None
-    for i in range(MAX_RETRY + 1):
+    try:
+        _cb_check()
+    except CircuitOpenError as e:
+        return False, e
+    if wal is not None:
         try:
-            return True, call()
-        except Exception as e:
-            last_err = e
-            s = str(e)
-            # 간단한 휴리스틱 매칭(필요하면 core.request에서 status/코드 넘기도록 확장)
-            if i < MAX_RETRY and any(x in s for x in (" 429", " 500", " 502", " 503", " 504", "-1021", "-1003")):
-                time.sleep(BACKOFF_S[i]); continue
-            break
-    return False, last_err
+            _wal_append("send", wal)
+        except OSError as e:
+            return False, e          # 기록 못 하면 전송하지 않음(크래시 시 복구 불가)
+    ok, last_err = False, None
+    slept = 0.0
+    try:
+        for i in range(max_retry + 1):
+            try:
+                res = fn(*args, **kwargs)
+                _cb_record(False)
+                ok = True
+                return True, res
+            except Exception as e:
+                last_err = e
+                if probe is not None and _ambiguous(e):
+                    found = _probe_sent(probe)
+                    if found is not None:
+                        _cb_record(False)
+                        ok = True
+                        return True, found
+                if _is_retryable(e) and _cb_record(True):
+                    break
+                if i < max_retry and retry_if(e):
+                    d = _backoff_s(i)
+                    if slept + d <= RETRY_BUDGET_S:
+                        time.sleep(d); slept += d
+                        continue
+                break
+        return False, last_err
+    finally:
+        # 성공/타임아웃 모두 잔고가 바뀌었을 수 있음 → 다음 조회는 REST로
+        invalidate_balances()
+        if wal is not None and (ok or (last_err is not None and not _ambiguous(last_err))):
+            try:
+                _wal_append("done", {"cid": wal["cid"], "ok": ok})
+            except OSError as e:
+                # done 누락은 재기동 시 조회로 확정됨 → 주문 결과를 가리지 않음
+                print(f"[warn] wal done append failed cid={wal['cid']}: {e}")
+
+def _balances_cached() -> Dict[str, Decimal]:
+    """get_balances_map() 결과를 BAL_TTL_S 동안 재사용"""
+    now = time.monotonic()
+    if now - _BAL_CACHE["t"] < BAL_TTL_S:
+        return _BAL_CACHE["m"]
+    m = get_balances_map()
+    _BAL_CACHE.update(t=now, m=m)
+    return m
+
+def invalidate_balances():
+    """잔고 캐시 무효화(체결/외부 입출금 감지 시 호출)"""
+    _BAL_CACHE["t"] = 0.0
+
+def _order_target(symbol: str, dry_run: bool, cid: str, allow_mainnet: bool):
+    """
+    단일 주문 전송 대상: dry_run이면 (place_test_order, {}), 아니면 (place_order, 실주문 전용 kwargs)
+    - 실주문 kwargs의 probe/wal은 _retry_call이 소비(clientOrderId 접수 확인/전송 전 기록)
+    """
+    if dry_run:
+        return place_test_order, {}
+    return place_order, {"newClientOrderId": cid, "allow_mainnet": allow_mainnet,
+                         "probe": functools.partial(get_order, symbol, origClientOrderId=cid),
+                         "wal": {"kind": "order", "symbol": symbol, "cid": cid}}
+
+def _fresh_price(symbol: str, prev_ts: float, prev_px: Decimal, max_age: float = PRICE_REUSE_S):
+    """직전 조회(prev_ts, monotonic)가 max_age초 이내면 그대로, 아니면 재조회. 반환: (price, ts)"""
+    if time.monotonic() - prev_ts < max_age:
+        return prev_px, prev_ts
+    return Decimal(str(get_price(symbol))), time.monotonic()
+
+# OCO 사전검증용 조회(심볼정보/잔고/현재가)를 동시에 보내는 소형 풀
+_EXEC = ThreadPoolExecutor(max_workers=4, thread_name_prefix="order-io")
+
+def _oco_snapshot(symbol: str):
+    """
+    OCO 사전검증 스냅샷: 세 REST 조회를 병렬로 → 벽시계 시간 = 합이 아니라 최대 지연
+    반환: (_syminfo 튜플, balances, last(Decimal), last 조회 시각(monotonic))
+    """
+    f_sx = _EXEC.submit(_syminfo, symbol)
+    f_bal = _EXEC.submit(_balances_cached)
+    f_px = _EXEC.submit(get_price, symbol)
+    last = Decimal(str(f_px.result()))
+    t_last = time.monotonic()
+    return f_sx.result(), f_bal.result(), last, t_last
 
 def _max_required_quote_for_buy(q_dec: Decimal, prices: list[Decimal]) -> Decimal:
     """
@@ -100,30 +481,83 @@ def _max_required_quote_for_buy(q_dec: Decimal, prices: list[Decimal]) -> Decima
     - OCO(BUY)의 두 다리 중 어떤 게 체결될지 모르므로 최악(가장 큰 notional)을 잡는다.
     """
     if not prices:
-        return Decimal("0")
+        return ZERO
     return q_dec * max(prices)
 
 def _ceil_qty_for_notional(min_notional: Decimal, price: Decimal, step_qty: Decimal) -> Decimal:
     """
     역할: 주어진 price에서 MIN_NOTIONAL 만족을 위한 '최소 수량'을 step 단위로 올림
-    - OCO의 두 다리 각각에 대해 검사할 때 사용
+    - OCO에서는 두 다리 중 낮은 가격으로 1회 호출(= 두 다리 요구치의 최대)
+    - step 개수는 filters.ceil_steps_for_notional(정수 ceil 1회)
     """
     if price <= 0:
-        return Decimal("0")
-    need = (min_notional / price)
-    q = (need / step_qty).to_integral_value(rounding=ROUND_UP) * step_qty
-    return q
+        return ZERO
+    return step_qty * max(1, ceil_steps_for_notional(min_notional, price, step_qty))
 
-# (현재 미사용) 응답 기반 재시도 판단 훅. core.request 확장 시 연결할 것.
-def _should_retry(resp: Dict[str, Any] | None, status: int | None) -> bool:
-    if status and status in RETRYABLE_HTTP: return True
-    if isinstance(resp, dict) and "code" in resp and resp["code"] in RETRYABLE_CODE: return True
-    return False
+
+
+def _send_simple(symbol: str, side: str, otype: str, cid_prefix: str, out: Dict[str, str],
+                 params: Dict[str, str], *, dry_run: bool, allow_mainnet: bool) -> OrderResult:
+    """
+    단일 주문 전송 + 표준 결과 dict
+    - out: 결과에 그대로 싣는 문자열 필드(price/qty/quote 등), params: 전송 파라미터
+    """
+    cid = _new_client_id(cid_prefix)
+    fn, extra = _order_target(symbol, dry_run, cid, allow_mainnet)
+    ok, res = _retry_call(fn, symbol, side, otype, **params, **extra)
+    if ok:
+        return {"ok": True, "resp": res, **out, "clientOrderId": cid}
+    return {"ok": False, "error": str(res), "code": getattr(res, "code", None), **out, "clientOrderId": cid}
+
+def _submit_simple(symbol: str, side: str, otype: str, *, qty: float, price: float | None = None,
+                   tif: str | None = None, dry_run: bool, allow_mainnet: bool, cid_prefix: str) -> OrderResult:
+    """
+    지정가(LIMIT)/수량 시장가(MARKET) 공용 파이프라인: 정규화 → (LIMIT) MIN_NOTIONAL 보정 → 검사 → 전송
+    - LIMIT: price/qty 문자열 반환, MARKET: qty 문자열만
+    """
+    sx, ff, tick, step, _, _ = _syminfo(symbol)
+    fp, fq = ff["fmt_price"], ff["fmt_qty"]
+    q_dec = normalize_qty(qty, ff)
+
+    if otype == "LIMIT":
+        p_adj, q_dec, ok = ensure_min_notional(normalize_price(price, ff), q_dec, ff)
+        out = {"price": fp(p_adj), "qty": fq(q_dec)}
+        if (q_dec <= 0) or (not ok):
+            return {"ok": False, "reason": "MIN_NOTIONAL_NOT_SATISFIED", **out}
+        params = {"quantity": out["qty"], "price": out["price"], "timeInForce": tif}
+    else:
+        out = {"qty": fq(q_dec)}
+        if q_dec <= 0:
+            return {"ok": False, "reason": "MIN_QTY_NOT_SATISFIED", **out}
+        params = {"quantity": out["qty"]}
+
+    return _send_simple(symbol, side, otype, cid_prefix, out, params,
+                        dry_run=dry_run, allow_mainnet=allow_mainnet)
+
+
+def _send_oco(payload: Dict[str, str], id_prefix: str, allow_mainnet: bool) -> OrderResult:
+    """
+    검증/포맷이 끝난 OCO payload 전송 — 재시도는 이 payload를 그대로 재사용
+    (필터/관계식 재계산 없음, 시도마다 바뀌는 건 core.request의 timestamp/서명뿐)
+    """
+    ids = _new_list_ids(id_prefix)
+    ok, res = _retry_call(
+        place_oco_order, **payload, **ids,
+        allow_mainnet=allow_mainnet,
+        probe=functools.partial(get_order_list, listClientOrderId=ids["listClientOrderId"]),
+        wal={"kind": "oco", "symbol": payload["symbol"], "cid": ids["listClientOrderId"]},
+    )
+    if ok: return {"ok": True, "resp": res, **ids}
+    msg, code = str(res), getattr(res, "code", None)
+    if "insufficient balance" in msg.lower() or "-2010" in msg:
+        return {"ok": False, "error": "INSUFFICIENT_BALANCE", "detail": msg, "code": code, **ids}
+    return {"ok": False, "error": msg, "code": code, **ids}
 
 
 # =========================
 # 1) 시장가 매수 (quote 기준)
 # =========================
+@_dec_ctx
 def market_buy_by_quote(
     symbol: str,
     quote_usdt: float,
@@ -131,7 +565,7 @@ def market_buy_by_quote(
     dry_run: bool = True,
     allow_mainnet: bool = False,
     use_quote_order_qty: bool = False,  # True면 quoteOrderQty로 전송(정밀도 걱정↓)
-) -> Dict[str, Any]:
+) -> OrderResult:
     """
     역할
     ----
@@ -152,10 +586,8 @@ def market_buy_by_quote(
     {"ok":bool, "resp":dict|{}, "price":str, "qty":str, "quote":str, "clientOrderId":str, "error"?:str}
     - price/qty/quote 모두 문자열
     """
-    sx = get_symbol_info(symbol)
-    ff = extract_filters(sx)
-    tick = ff.get("tickSize")
-    step = ff.get("stepQty")
+    sx, ff, tick, step, _, _ = _syminfo(symbol)
+    fp, fq = ff["fmt_price"], ff["fmt_qty"]
 
     # 현재가 및 예산 → 수량 산출
     px_dec = Decimal(str(get_price(symbol)))
@@ -167,45 +599,22 @@ def market_buy_by_quote(
     qty_dec = q2 if ok else q1
 
     # 문자열 포맷 (전송/리턴 일치)
-    price_str = to_api_str(px_adj, tick)
-    qty_str   = to_api_str(qty_dec, step)
+    price_str = fp(px_adj)
+    qty_str   = fq(qty_dec)
     quote_str = to_api_str(Decimal(str(quote_usdt)))
 
-    cid = _new_client_id("mbuy")
-
-    # 두 경로를 함수로 분리
-    def _call_quantity():
-        if dry_run:
-            return place_test_order(symbol, "BUY", "MARKET", quantity=qty_str)
-        return place_order(symbol, "BUY", "MARKET",
-                           quantity=qty_str, newClientOrderId=cid, allow_mainnet=allow_mainnet)
-
-    def _call_quote():
-        # NOTE: 일부 환경에서 /order/test가 quoteOrderQty를 미지원할 가능성 있음 → testnet에서 실검증 권장
-        if dry_run:
-            return place_test_order(symbol, "BUY", "MARKET", quoteOrderQty=quote_str)
-        return place_order(symbol, "BUY", "MARKET",
-                           quoteOrderQty=quote_str, newClientOrderId=cid, allow_mainnet=allow_mainnet)
-
-    call = _call_quote if use_quote_order_qty else _call_quantity
-
-    last_err = None
-    for i in range(MAX_RETRY + 1):
-        try:
-            res = call()
-            # 두 경로 모두 qty/quote를 함께 리턴 → 로깅 일관성
-            return {"ok": True, "resp": res, "price": price_str, "qty": qty_str, "quote": quote_str, "clientOrderId": cid}
-        except Exception as e:
-            last_err = e
-            if i < MAX_RETRY:
-                time.sleep(BACKOFF_S[i]); continue
-            break
-    return {"ok": False, "error": str(last_err), "price": price_str, "qty": qty_str, "quote": quote_str, "clientOrderId": cid}
+    # 두 경로: quoteOrderQty 직접 전송 또는 quantity (결과에는 두 경로 모두 qty/quote를 함께 → 로깅 일관성)
+    # NOTE: 일부 환경에서 /order/test가 quoteOrderQty를 미지원할 가능성 있음 → testnet에서 실검증 권장
+    size = {"quoteOrderQty": quote_str} if use_quote_order_qty else {"quantity": qty_str}
+    return _send_simple(symbol, "BUY", "MARKET", "mbuy",
+                        {"price": price_str, "qty": qty_str, "quote": quote_str}, size,
+                        dry_run=dry_run, allow_mainnet=allow_mainnet)
 
 
 # =========================
 # 2) 지정가 매수
 # =========================
+@_dec_ctx
 def limit_buy(
     symbol: str,
     price: float,
@@ -214,94 +623,38 @@ def limit_buy(
     *,
     dry_run: bool = True,
     allow_mainnet: bool = False
-) -> Dict[str, Any]:
+) -> OrderResult:
     """
     역할: 지정가 매수(LIMIT). PRICE/LOT/MIN_NOTIONAL 보정 후 전송.
     리턴: price/qty 문자열.
     """
-    sx = get_symbol_info(symbol)
-    ff = extract_filters(sx)
-    tick = ff.get("tickSize")
-    step = ff.get("stepQty")
-
-    p_dec = normalize_price(price, ff)
-    q_dec = normalize_qty(qty, ff)
-    p_adj, q_adj, ok = ensure_min_notional(p_dec, q_dec, ff)
-
-    price_str = to_api_str(p_adj, tick)
-    qty_str   = to_api_str(q_adj, step)
-
-    if (q_adj <= 0) or (not ok):
-        return {"ok": False, "reason": "MIN_NOTIONAL_NOT_SATISFIED", "price": price_str, "qty": qty_str}
-
-    cid = _new_client_id("lbuy")
-
-    def _call():
-        if dry_run:
-            return place_test_order(symbol, "BUY", "LIMIT", quantity=qty_str, price=price_str, timeInForce=tif)
-        return place_order(symbol, "BUY", "LIMIT",
-                           quantity=qty_str, price=price_str, timeInForce=tif,
-                           newClientOrderId=cid, allow_mainnet=allow_mainnet)
-
-    last_err = None
-    for i in range(MAX_RETRY + 1):
-        try:
-            res = _call()
-            return {"ok": True, "resp": res, "price": price_str, "qty": qty_str, "clientOrderId": cid}
-        except Exception as e:
-            last_err = e
-            if i < MAX_RETRY: time.sleep(BACKOFF_S[i]); continue
-            break
-    return {"ok": False, "error": str(last_err), "price": price_str, "qty": qty_str, "clientOrderId": cid}
+    return _submit_simple(symbol, "BUY", "LIMIT", qty=qty, price=price, tif=tif,
+                          dry_run=dry_run, allow_mainnet=allow_mainnet, cid_prefix="lbuy")
 
 
 # =========================
 # 3) 시장가 매도
 # =========================
+@_dec_ctx
 def market_sell_qty(
     symbol: str,
     qty: float,
     *,
     dry_run: bool = True,
     allow_mainnet: bool = False
-) -> Dict[str, Any]:
+) -> OrderResult:
     """
     역할: 수량 기준 시장가 매도(MARKET). LOT_SIZE(step)만 맞추면 됨.
     리턴: qty 문자열.
     """
-    sx = get_symbol_info(symbol)
-    ff = extract_filters(sx)
-    step = ff.get("stepQty")
-
-    q_dec = normalize_qty(qty, ff)
-    qty_str = to_api_str(q_dec, step)
-
-    if q_dec <= 0:
-        return {"ok": False, "reason": "MIN_QTY_NOT_SATISFIED", "qty": qty_str}
-
-    cid = _new_client_id("msell")
-
-    def _call():
-        if dry_run:
-            return place_test_order(symbol, "SELL", "MARKET", quantity=qty_str)
-        return place_order(symbol, "SELL", "MARKET",
-                           quantity=qty_str, newClientOrderId=cid, allow_mainnet=allow_mainnet)
-
-    last_err = None
-    for i in range(MAX_RETRY + 1):
-        try:
-            res = _call()
-            return {"ok": True, "resp": res, "qty": qty_str, "clientOrderId": cid}
-        except Exception as e:
-            last_err = e
-            if i < MAX_RETRY: time.sleep(BACKOFF_S[i]); continue
-            break
-    return {"ok": False, "error": str(last_err), "qty": qty_str, "clientOrderId": cid}
+    return _submit_simple(symbol, "SELL", "MARKET", qty=qty,
+                          dry_run=dry_run, allow_mainnet=allow_mainnet, cid_prefix="msell")
 
 
 # =========================
 # 4) 지정가 매도
 # =========================
+@_dec_ctx
 def limit_sell(
     symbol: str,
     price: float,
@@ -310,50 +663,19 @@ def limit_sell(
     *,
     dry_run: bool = True,
     allow_mainnet: bool = False
-) -> Dict[str, Any]:
+) -> OrderResult:
     """
     역할: 지정가 매도(LIMIT). PRICE/LOT/MIN_NOTIONAL 보정 후 전송.
     리턴: price/qty 문자열.
     """
-    sx = get_symbol_info(symbol)
-    ff = extract_filters(sx)
-    tick = ff.get("tickSize")
-    step = ff.get("stepQty")
-
-    p_dec = normalize_price(price, ff)
-    q_dec = normalize_qty(qty, ff)
-    p_adj, q_adj, ok = ensure_min_notional(p_dec, q_dec, ff)
-
-    price_str = to_api_str(p_adj, tick)
-    qty_str   = to_api_str(q_adj, step)
-
-    if (q_adj <= 0) or (not ok):
-        return {"ok": False, "reason": "MIN_NOTIONAL_NOT_SATISFIED", "price": price_str, "qty": qty_str}
-
-    cid = _new_client_id("lsell")
-
-    def _call():
-        if dry_run:
-            return place_test_order(symbol, "SELL", "LIMIT", quantity=qty_str, price=price_str, timeInForce=tif)
-        return place_order(symbol, "SELL", "LIMIT",
-                           quantity=qty_str, price=price_str, timeInForce=tif,
-                           newClientOrderId=cid, allow_mainnet=allow_mainnet)
-
-    last_err = None
-    for i in range(MAX_RETRY + 1):
-        try:
-            res = _call()
-            return {"ok": True, "resp": res, "price": price_str, "qty": qty_str, "clientOrderId": cid}
-        except Exception as e:
-            last_err = e
-            if i < MAX_RETRY: time.sleep(BACKOFF_S[i]); continue
-            break
-    return {"ok": False, "error": str(last_err), "price": price_str, "qty": qty_str, "clientOrderId": cid}
+    return _submit_simple(symbol, "SELL", "LIMIT", qty=qty, price=price, tif=tif,
+                          dry_run=dry_run, allow_mainnet=allow_mainnet, cid_prefix="lsell")
 
 
 # =========================
 # 5) OCO: SELL (TP/SL)
 # =========================
+@_dec_ctx
 def oco_sell_tp_sl(
     symbol: str,
     qty: float,
@@ -365,7 +687,7 @@ def oco_sell_tp_sl(
     dry_run: bool = True,
     allow_mainnet: bool = False,
     auto_adjust: bool = False,       # True면 전송 직전 메이커 보정(조건 깨지면 tick 단위 자동 조정)
-) -> Dict[str, Any]:
+) -> OrderResult:
     """
     역할
     ----
@@ -382,112 +704,99 @@ def oco_sell_tp_sl(
     -> {"ok":bool, "resp"?:dict, "dry_run"?:True, "price_relation"?:str, "payload"?:dict,
         "listClientOrderId"?:str, "aboveClientOrderId"?:str, "belowClientOrderId"?:str, "error"?:str}
     """
-    sx = get_symbol_info(symbol)
-    ff = extract_filters(sx)
-    tick = ff.get("tickSize")
-    step = ff.get("stepQty")
-    base, quote = get_symbol_assets(sx)
+    # (0) 입력만으로 판단 가능한 실패는 REST 호출 전에 반환
+    if not qty > 0:
+        return {"ok": False, "reason": "QTY_NONPOSITIVE", "given_qty": str(qty)}
+    if not tp_price > sl_stop:
+        return {"ok": False, "reason": "PRICE_RELATION_INVALID(SELL)",
+                "explain": f"tp({tp_price}) > stop({sl_stop}) 필요"}
 
-    # 현재가 및 가격 정규화
-    last = Decimal(str(get_price(symbol)))
+    # 심볼정보/잔고/현재가 병렬 조회
+    (sx, ff, tick, step, base, quote), balances, last, t_last = _oco_snapshot(symbol)
+    fp, fq = ff["fmt_price"], ff["fmt_qty"]
+
+    # 가격 정규화
     p_tp  = normalize_price(tp_price, ff)
     p_stp = normalize_price(sl_stop,  ff)
     if sl_limit is None:
         # 보수적: stop - 1tick
-        sl_limit = float(Decimal(p_stp) - (tick))
+        sl_limit = p_stp - tick
     p_slm = normalize_price(sl_limit, ff)
 
-    # 수량 정규화
+    # 수량 정규화(qty 문자열은 이후 변하지 않으므로 1회 포맷해 모든 리턴/전송에 재사용)
     q_dec = normalize_qty(qty, ff)
+    qty_str = fq(q_dec)
 
     # (1) 잔고 사전검증: 베이스 자산이 충분한가
-    balances = get_balances_map()
-    base_free = balances.get(base, Decimal("0"))
+    base_free = balances.get(base, ZERO)
     if q_dec > base_free:
         return {"ok": False, "reason": "INSUFFICIENT_BASE_BALANCE",
-                "required_qty": to_api_str(q_dec, step),
-                "base_free": to_api_str(base_free, step), "asset": base}
+                "required_qty": qty_str,
+                "base_free": fq(base_free), "asset": base}
 
     # (2) 가격 관계식 1차 검증: tp > last > stop
-    if not (Decimal(p_tp) > last > Decimal(p_stp)):
+    if not (p_tp > last > p_stp):
         return {"ok": False, "reason": "PRICE_RELATION_INVALID(SELL)",
-                "explain": f"tp({p_tp}) > last({to_api_str(last, tick)}) > stop({p_stp})"}
+                "explain": f"tp({p_tp}) > last({fp(last)}) > stop({p_stp})"}
     # SL limit은 stop 이하 권장
-    if not (Decimal(p_slm) <= Decimal(p_stp)):
+    if not (p_slm <= p_stp):
         return {"ok": False, "reason": "STOP_LIMIT_RELATION_INVALID",
                 "explain": f"stopLimitPrice({p_slm}) <= stopPrice({p_stp}) 권장"}
 
-    # (3) 전송 직전(last 재조회) + 자동 보정(옵션)
-    last2 = Decimal(str(get_price(symbol)))
+    # (3) 전송 직전(last 재조회, PRICE_REUSE_S 이내면 재사용) + 자동 보정(옵션)
+    last2, _ = _fresh_price(symbol, t_last, last)
     if auto_adjust:
         # SELL LIMIT_MAKER: 지정가가 반드시 last2보다 커야 메이커 보장
-        if Decimal(p_tp) <= last2:
-            p_tp = normalize_price(float(last2 + tick), ff)
+        if p_tp <= last2:
+            p_tp = normalize_price(last2 + tick, ff)
         # STOP_LIMIT의 limit(price)는 stop 이하로(즉시체결 방지)
-        if Decimal(p_slm) > Decimal(p_stp):
-            p_slm = normalize_price(float(Decimal(p_stp) - tick), ff)
+        if p_slm > p_stp:
+            p_slm = normalize_price(p_stp - tick, ff)
 
     # 보정 후에도 관계식 깨지면 실패
-    if not (Decimal(p_tp) > last2 > Decimal(p_stp)):
+    if not (p_tp > last2 > p_stp):
         return {"ok": False, "reason": "PRICE_RELATION_CHANGED",
-                "prev": to_api_str(last, tick), "now": to_api_str(last2, tick),
+                "prev": fp(last), "now": fp(last2),
                 "hint": "auto_adjust=False이거나 보정 한계 초과"}
 
     # (4) MIN_NOTIONAL: TP/SL 두 다리 대비(더 큰 요구치 기준)
     min_notional = ff.get("minNotional")
-    if min_notional:
-        q_need_tp  = _ceil_qty_for_notional(min_notional, Decimal(p_tp),  step)
-        q_need_slm = _ceil_qty_for_notional(min_notional, Decimal(p_slm), step)
-        q_need = max(q_need_tp, q_need_slm)
+    # 낮은 쪽 가격으로도 충족하면(일반적 경우) 올림 계산 생략 — q_dec는 이미 step 격자 위
+    if min_notional and q_dec * min(p_tp, p_slm) < min_notional:
+        # 필요 수량은 가격에 대해 비증가 → 낮은 쪽 다리 가격 하나로 계산하면 두 다리 중 최대치
+        q_need = _ceil_qty_for_notional(min_notional, min(p_tp, p_slm), step)
         if q_dec < q_need:
             return {"ok": False, "reason": "MIN_NOTIONAL_NOT_SATISFIED",
-                    "required_qty": to_api_str(q_need, step),
-                    "given_qty": to_api_str(q_dec, step),
+                    "required_qty": fq(q_need),
+                    "given_qty": qty_str,
                     "hint": "수량을 늘리거나 가격 조정 필요"}
 
     # (5) 문자열 포맷(전송/리턴 일치)
-    qty_str   = to_api_str(q_dec, step)
-    tp_str    = to_api_str(Decimal(p_tp),  tick)
-    stop_str  = to_api_str(Decimal(p_stp), tick)
-    slm_str   = to_api_str(Decimal(p_slm), tick)
-    last_str  = to_api_str(last2,          tick)
+    tp_str    = fp(p_tp)
+    stop_str  = fp(p_stp)
+    slm_str   = fp(p_slm)
+    last_str  = fp(last2)
+
+    payload = {"symbol": symbol, "side": "SELL", "quantity": qty_str,
+               "aboveType": "LIMIT_MAKER", "abovePrice": tp_str,
+               "belowType": "STOP_LOSS_LIMIT", "belowStopPrice": stop_str,
+               "belowPrice": slm_str, "belowTimeInForce": tif,
+               "newOrderRespType": "RESULT"}
 
     # (6) dry_run: 실제 호출 없이 payload 미리보기
     if dry_run:
         return {"ok": True, "dry_run": True,
                 "price_relation": f"{tp_str} > last({last_str}) > {stop_str}",
-                "payload": {"symbol": symbol, "side": "SELL", "quantity": qty_str,
-                            "aboveType": "LIMIT_MAKER", "abovePrice": tp_str,
-                            "belowType": "STOP_LOSS_LIMIT", "belowStopPrice": stop_str,
-                            "belowPrice": slm_str, "belowTimeInForce": tif,
-                            "newOrderRespType": "RESULT"}}
-
-    # (7) 실주문: 아이템포턴시 ID 고정 + 간단 재시도
-    ids = _new_list_ids("oco-sell")
-    def _call():
-        return place_oco_order(
-            symbol, "SELL",
-            quantity=qty_str,
-            aboveType="LIMIT_MAKER", abovePrice=tp_str,
-            belowType="STOP_LOSS_LIMIT", belowStopPrice=stop_str, belowPrice=slm_str,
-            belowTimeInForce=tif,
-            listClientOrderId=ids["listClientOrderId"],
-            aboveClientOrderId=ids["aboveClientOrderId"],
-            belowClientOrderId=ids["belowClientOrderId"],
-            newOrderRespType="RESULT",
-            allow_mainnet=allow_mainnet,
-        )
-    ok, res = _retry_oco(_call)
-    if ok: return {"ok": True, "resp": res, **ids}
-    msg = str(res)
-    if "insufficient balance" in msg.lower() or "-2010" in msg:
-        return {"ok": False, "error": "INSUFFICIENT_BALANCE", "detail": msg, **ids}
-    return {"ok": False, "error": msg, **ids}
+                "payload": payload}
+
+    # (7) 실주문: 같은 payload 그대로 전송(아이템포턴시 ID 고정 + 재시도)
+    return _send_oco(payload, "oco-sell", allow_mainnet)
 
 
 # =========================
 # 6) OCO: BUY (돌파 + 대안)
 # =========================
+@_dec_ctx
 def oco_buy_breakout(
     symbol: str,
     qty: float,
@@ -499,7 +808,7 @@ def oco_buy_breakout(
     dry_run: bool = True,
     allow_mainnet: bool = False,
     auto_adjust: bool = False,         # True면 전송 직전 메이커 보정
-) -> Dict[str, Any]:
+) -> OrderResult:
     """
     역할
     ----
@@ -515,105 +824,92 @@ def oco_buy_breakout(
     {"ok":bool, "resp"?:dict, "dry_run"?:True, "price_relation"?:str, "payload"?:dict,
      "listClientOrderId"?:str, "aboveClientOrderId"?:str, "belowClientOrderId"?:str, "error"?:str}
     """
-    sx = get_symbol_info(symbol)
-    ff = extract_filters(sx)
-    tick = ff.get("tickSize")
-    step = ff.get("stepQty")
-    base, quote = get_symbol_assets(sx)
+    # (0) 입력만으로 판단 가능한 실패는 REST 호출 전에 반환
+    if not qty > 0:
+        return {"ok": False, "reason": "QTY_NONPOSITIVE", "given_qty": str(qty)}
+    if not fallback_limit < entry_stop:
+        return {"ok": False, "reason": "PRICE_RELATION_INVALID(BUY)",
+                "explain": f"limit({fallback_limit}) < stop({entry_stop}) 필요"}
 
-    # 현재가 및 가격 정규화
-    last = Decimal(str(get_price(symbol)))
+    # 심볼정보/잔고/현재가 병렬 조회
+    (sx, ff, tick, step, base, quote), balances, last, t_last = _oco_snapshot(symbol)
+    fp, fq = ff["fmt_price"], ff["fmt_qty"]
+
+    # 가격 정규화
     p_stp = normalize_price(entry_stop,  ff)     # 위 다리 stopPrice
     if entry_limit is None:
         # 보수적: stop + 1tick
-        entry_limit = float(Decimal(p_stp) + tick)
+        entry_limit = p_stp + tick
     p_slm = normalize_price(entry_limit, ff)     # 위 다리 limit(price)
     p_lim = normalize_price(fallback_limit, ff)  # 아래 다리 limit maker
 
-    # 수량 정규화
+    # 수량 정규화(qty 문자열은 이후 변하지 않으므로 1회 포맷해 모든 리턴/전송에 재사용)
     q_dec = normalize_qty(qty, ff)
+    qty_str = fq(q_dec)
 
     # (1) 잔고 사전검증: 필요한 quote(USDT) 추정(두 후보 가격 중 최대 notional 기준)
-    cand_prices = [Decimal(p_slm), Decimal(p_lim)]
+    cand_prices = [p_slm, p_lim]
     need_quote = _max_required_quote_for_buy(q_dec, cand_prices)
-    balances = get_balances_map()
-    quote_free = balances.get(quote, Decimal("0"))
+    quote_free = balances.get(quote, ZERO)
     if need_quote > quote_free:
         return {"ok": False, "reason": "INSUFFICIENT_QUOTE_BALANCE",
-                "required_quote": to_api_str(need_quote, tick),
-                "quote_free": to_api_str(quote_free, tick), "asset": quote}
+                "required_quote": fp(need_quote),
+                "quote_free": fp(quote_free), "asset": quote}
 
     # (2) 가격 관계식 1차 검증: limit < last < stop
-    if not (Decimal(p_lim) < last < Decimal(p_stp)):
+    if not (p_lim < last < p_stp):
         return {"ok": False, "reason": "PRICE_RELATION_INVALID(BUY)",
-                "explain": f"limit({p_lim}) < last({to_api_str(last, tick)}) < stop({p_stp})"}
+                "explain": f"limit({p_lim}) < last({fp(last)}) < stop({p_stp})"}
     # BUY에서 stopLimitPrice는 stopPrice 이상 권장(즉시체결 방지)
-    if not (Decimal(p_slm) >= Decimal(p_stp)):
+    if not (p_slm >= p_stp):
         return {"ok": False, "reason": "STOP_LIMIT_RELATION_INVALID",
                 "explain": f"stopLimitPrice({p_slm}) >= stopPrice({p_stp}) 권장"}
 
-    # (3) 전송 직전(last 재조회) + 자동 보정(옵션)
-    last2 = Decimal(str(get_price(symbol)))
+    # (3) 전송 직전(last 재조회, PRICE_REUSE_S 이내면 재사용) + 자동 보정(옵션)
+    last2, _ = _fresh_price(symbol, t_last, last)
     if auto_adjust:
         # BUY LIMIT_MAKER: 지정가가 반드시 last2보다 작아야 메이커 보장
-        if Decimal(p_lim) >= last2:
-            p_lim = normalize_price(float(last2 - tick), ff)
+        if p_lim >= last2:
+            p_lim = normalize_price(last2 - tick, ff)
         # STOP_LIMIT의 limit(price)는 stop 이상
-        if Decimal(p_slm) < Decimal(p_stp):
-            p_slm = normalize_price(float(Decimal(p_stp) + tick), ff)
+        if p_slm < p_stp:
+            p_slm = normalize_price(p_stp + tick, ff)
 
     # 보정 후에도 관계식 깨지면 실패
-    if not (Decimal(p_lim) < last2 < Decimal(p_stp)):
+    if not (p_lim < last2 < p_stp):
         return {"ok": False, "reason": "PRICE_RELATION_CHANGED",
-                "prev": to_api_str(last, tick), "now": to_api_str(last2, tick),
+                "prev": fp(last), "now": fp(last2),
                 "hint": "auto_adjust=False이거나 보정 한계 초과"}
 
     # (4) MIN_NOTIONAL: 위/아래 다리 대비(더 큰 요구치 기준)
     min_notional = ff.get("minNotional")
-    if min_notional:
-        q_need_up  = _ceil_qty_for_notional(min_notional, Decimal(p_slm), step)
-        q_need_low = _ceil_qty_for_notional(min_notional, Decimal(p_lim), step)
-        q_need = max(q_need_up, q_need_low)
+    # 낮은 쪽 가격으로도 충족하면(일반적 경우) 올림 계산 생략 — q_dec는 이미 step 격자 위
+    if min_notional and q_dec * min(p_slm, p_lim) < min_notional:
+        # 필요 수량은 가격에 대해 비증가 → 낮은 쪽 다리 가격 하나로 계산하면 두 다리 중 최대치
+        q_need = _ceil_qty_for_notional(min_notional, min(p_slm, p_lim), step)
         if q_dec < q_need:
             return {"ok": False, "reason": "MIN_NOTIONAL_NOT_SATISFIED",
-                    "required_qty": to_api_str(q_need, step),
-                    "given_qty": to_api_str(q_dec, step),
+                    "required_qty": fq(q_need),
+                    "given_qty": qty_str,
                     "hint": "수량을 늘리거나 가격 조정 필요"}
 
     # (5) 문자열 포맷(전송/리턴 일치)
-    qty_str  = to_api_str(q_dec, step)
-    lim_str  = to_api_str(Decimal(p_lim), tick)
-    stop_str = to_api_str(Decimal(p_stp), tick)
-    slm_str  = to_api_str(Decimal(p_slm), tick)
-    last_str = to_api_str(last2,          tick)
+    lim_str  = fp(p_lim)
+    stop_str = fp(p_stp)
+    slm_str  = fp(p_slm)
+    last_str = fp(last2)
+
+    payload = {"symbol": symbol, "side": "BUY", "quantity": qty_str,
+               "aboveType": "STOP_LOSS_LIMIT", "aboveStopPrice": stop_str,
+               "abovePrice": slm_str, "aboveTimeInForce": tif,
+               "belowType": "LIMIT_MAKER", "belowPrice": lim_str,
+               "newOrderRespType": "RESULT"}
 
     # (6) dry_run: 실제 호출 없이 payload 미리보기
     if dry_run:
         return {"ok": True, "dry_run": True,
                 "price_relation": f"{lim_str} < last({last_str}) < {stop_str}",
-                "payload": {"symbol": symbol, "side": "BUY", "quantity": qty_str,
-                            "aboveType": "STOP_LOSS_LIMIT", "aboveStopPrice": stop_str,
-                            "abovePrice": slm_str, "aboveTimeInForce": tif,
-                            "belowType": "LIMIT_MAKER", "belowPrice": lim_str,
-                            "newOrderRespType": "RESULT"}}
-
-    # (7) 실주문: 아이템포턴시 ID 고정 + 간단 재시도
-    ids = _new_list_ids("oco-buy")
-    def _call():
-        return place_oco_order(
-            symbol, "BUY",
-            quantity=qty_str,
-            aboveType="STOP_LOSS_LIMIT", aboveStopPrice=stop_str, abovePrice=slm_str, aboveTimeInForce=tif,
-            belowType="LIMIT_MAKER",    belowPrice=lim_str,
-            listClientOrderId=ids["listClientOrderId"],
-            aboveClientOrderId=ids["aboveClientOrderId"],
-            belowClientOrderId=ids["belowClientOrderId"],
-            newOrderRespType="RESULT",
-            allow_mainnet=allow_mainnet,
-        )
-    ok, res = _retry_oco(_call)
-    if ok: return {"ok": True, "resp": res, **ids}
-    msg = str(res)
-    if "insufficient balance" in msg.lower() or "-2010" in msg:
-        return {"ok": False, "error": "INSUFFICIENT_BALANCE", "detail": msg, **ids}
-    return {"ok": False, "error": msg, **ids}
+                "payload": payload}
+
+    # (7) 실주문: 같은 payload 그대로 전송(아이템포턴시 ID 고정 + 재시도)
+    return _send_oco(payload, "oco-buy", allow_mainnet)
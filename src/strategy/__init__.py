@@ -0,0 +1 @@
+# 전략 패키지 — 개별 전략 모듈은 registry.create_strategy가 첫 사용 시 import(여기서 일괄 로드하지 않음)
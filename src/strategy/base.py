@@ -1,11 +1,17 @@
 from abc import ABC, abstractmethod
+import numpy as np
 import pandas as pd
 from typing import Any, Dict, Optional, List
 
+__all__ = ["Strategy"]
+
 class Strategy(ABC):
     """모든 전략이 따라야 하는 인터페이스"""
     def __init__(self, **params):
         self.params = params
+        # update_last용 증분 상태(마지막 마감 캔들 기준) + 그 캔들 식별키
+        self._inc = None
+        self._inc_key = None
 
     @abstractmethod
     def name(self) -> str:
@@ -18,7 +24,10 @@ class Strategy(ABC):
 
     @abstractmethod
     def compute_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
-        """필요 지표 컬럼을 df에 추가해서 반환"""
+        """
+        필요 지표 컬럼을 df에 제자리로 추가해서 반환(OHLCV 전체 복사 없음)
+        - 원본을 보존해야 하면 호출자가 copy()를 넘길 것
+        """
         ...
 
     @abstractmethod
@@ -26,6 +35,39 @@ class Strategy(ABC):
         """'BUY'|'SELL'|None 반환"""
         ...
 
+    def update_last(self, df: pd.DataFrame, row: Dict[str, float]) -> Optional[Dict[str, float]]:
+        """
+        (선택) O(1) 증분 갱신 훅.
+        - df: 직전 틱까지 지표가 계산된 DF(마지막 행 = 진행중 캔들)
+        - row: 이번 틱의 마지막 행 OHLCV
+        - 반환: {지표컬럼: 값} (마지막 행에 쓸 값) / None이면 미지원 → 호출자가 재계산
+        - 1바 롤오버 시에도 호출됨(df[:-1]로 방금 마감된 행, 이어서 df로 새 진행 행)
+          → 상태를 마감 종가로 push해 O(1) 전진하도록 구현하면 롤오버도 전체 재계산 없이 처리
+        """
+        return None
+
+    def vectorized_signals(self, df: pd.DataFrame) -> Optional[np.ndarray]:
+        """
+        (선택) 백테스트용 전 구간 신호 1패스 계산.
+        - df: compute_indicators 결과(전체 기간)
+        - 반환: 길이 len(df) int8 배열, i번째 = df.iloc[:i+1]에 generate_signal 한 결과(+1 BUY / -1 SELL / 0)
+        - None이면 미지원 → 호출자는 바마다 generate_signal
+        """
+        return None
+
+    def signal_breakpoints(self, df: pd.DataFrame) -> Optional[List[float]]:
+        """
+        (선택) 진행중 캔들 종가가 이 가격들을 지나지 않는 한 generate_signal 결과가 바뀌지 않는 경계값.
+        - df: update_last 직후의 지표 DF(증분 상태가 df의 마지막 마감 캔들 기준일 때만 유효)
+        - 반환 None이면 스킵 불가 → 호출자는 매 틱 재계산
+        """
+        return None
+
+    @staticmethod
+    def _last_closed_key(df: pd.DataFrame, i: int = -2):
+        """증분 상태가 어느 마감 캔들 기준인지 식별(롤오버/정정 감지용). i=-3이면 직전 바 기준 키."""
+        return df["open_time"].iat[i], float(df["close"].iat[i])
+
     def __repr__(self):
         return f"{self.__class__.__name__}({self.params})"
 
@@ -49,15 +91,13 @@ class Strategy(ABC):
         if not indicator_cols:
             return df
 
-        out = df.copy()
-
         if mode == "any":
-            return out.dropna(subset=indicator_cols).reset_index(drop=True)
+            return df.dropna(subset=indicator_cols).reset_index(drop=True)
 
-        # mode == "leading": 첫 "모든 지표가 유효"한 인덱스를 찾아 앞부분 절단
-        valid_mask = out[indicator_cols].notna().all(axis=1)
-        if not valid_mask.any():
+        # mode == "leading": 첫 "모든 지표가 유효"한 행을 찾아 앞부분 절단
+        # 지표 블록을 ndarray로 1회 꺼내 행별 NaN 여부 → argmin(첫 False) 1패스
+        bad = pd.isna(df[indicator_cols].to_numpy()).any(axis=1)
+        if bad.all():
             # 전부 NaN이면 빈 DF 반환
-            return out.iloc[0:0].reset_index(drop=True)
-        first_valid_idx = valid_mask.idxmax()  # 첫 True의 인덱스
-        return out.loc[first_valid_idx:].reset_index(drop=True)
\ No newline at end of file
+            return df.iloc[0:0].reset_index(drop=True)
+        return df.iloc[int(bad.argmin()):].reset_index(drop=True)
\ No newline at end of file
@@ -1,31 +1,80 @@
+import numpy as np
 import pandas as pd
 from .base import Strategy
 from .registry import register
 
 from src.indicators import add_bbands
+from src.indicators.incremental import RollingStatsState
+
+__all__ = ["BollingerBreakout"]
 
 @register("bb_breakout")
 class BollingerBreakout(Strategy):
+    def __init__(self, **params):
+        super().__init__(**params)
+        # 파라미터는 생성 시 1회 해석(틱마다 dict 조회/형변환 없음)
+        self.period = int(params.get("period", 20))
+        self.k = float(params.get("k", 2.0))
+        self.min_hist = self.period + 2
+
     def name(self) -> str:
         return "bb_breakout"
 
     def min_history(self) -> int:
-        period = int(self.params.get("period", 20))
-        return period + 2
+        return self.min_hist
 
     def compute_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
-        return add_bbands(df, int(self.params.get("period", 20)), float(self.params.get("k", 2.0)))
+        return add_bbands(df, self.period, self.k, copy=False)
+
+    def update_last(self, df: pd.DataFrame, row):
+        period = self.period
+        if len(df) < period:
+            return None
+        key = self._last_closed_key(df)
+        if self._inc_key != key and self._inc is not None and len(df) >= 3 \
+                and self._inc_key == self._last_closed_key(df, -3):
+            # 1바 전진(롤오버): 새로 마감된 종가로 창을 O(1) 전진
+            self._inc.push(float(df["close"].iat[-2]))
+            self._inc_key = key
+        if self._inc_key != key:
+            self._inc = RollingStatsState(period, df["close"].to_numpy(dtype="float64")[:-1])
+            self._inc_key = key
+        k = self.k
+        mid, sd = self._inc.peek(float(row["close"]))
+        return {"bb_mid": mid, "bb_up": mid + k * sd, "bb_dn": mid - k * sd}
+
+    def signal_breakpoints(self, df: pd.DataFrame):
+        # 종가가 상/하단선과 만나는 가격 — 사이 구간에선 돌파 여부(=신호) 불변
+        if self._inc is None or self._inc_key != self._last_closed_key(df):
+            return None
+        return self._inc.band_cross_prices(self.k)
 
+    def vectorized_signals(self, df: pd.DataFrame) -> np.ndarray:
+        # generate_signal과 같은 규칙을 전 구간에 벡터로: 바 i는 (i-1, i) 두 행으로 판단
+        c = df["close"].to_numpy(dtype=np.float64)
+        up = df["bb_up"].to_numpy(dtype=np.float64)
+        dn = df["bb_dn"].to_numpy(dtype=np.float64)
+        out = np.zeros(len(df), dtype=np.int8)
+        if len(df) < 2:
+            return out
+        with np.errstate(invalid="ignore"):
+            buy = (c[:-1] <= up[:-1]) & (c[1:] > up[1:])
+            sell = (c[:-1] >= dn[:-1]) & (c[1:] < dn[1:])
+        out[1:] = np.where(buy, 1, np.where(sell, -1, 0))
+        out[:self.min_hist - 1] = 0      # generate_signal의 최소 히스토리 조건
+        return out
 
     def generate_signal(self, df: pd.DataFrame):
-        if len(df) < self.min_history():
+        if len(df) < self.min_hist:
             return None
-        latest = df.iloc[-1]
-        prev = df.iloc[-2]
+        # 마지막 두 행만 ndarray로 직접 읽기(iloc 행 Series 생성 없음). NaN 밴드는 비교가 False → 신호 없음
+        c = df["close"].to_numpy()[-2:]
+        up = df["bb_up"].to_numpy()[-2:]
+        dn = df["bb_dn"].to_numpy()[-2:]
 
         # 상단선 돌파 → 매수, 하단선 이탈 → 매도 (단순 예시)
-        if prev["close"] <= prev["bb_up"] and latest["close"] > latest["bb_up"]:
+        if c[0] <= up[0] and c[1] > up[1]:
             return "BUY"
-        if prev["close"] >= prev["bb_dn"] and latest["close"] < latest["bb_dn"]:
+        if c[0] >= dn[0] and c[1] < dn[1]:
             return "SELL"
         return None
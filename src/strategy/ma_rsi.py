@@ -1,40 +1,107 @@
 # src/strategy/ma_rsi.py
+import math
+import numpy as np
 import pandas as pd
 from .base import Strategy
 from .registry import register
 
 from src.indicators import add_ema, add_rsi
+from src.indicators.incremental import EmaState, WilderRsiState
+
+__all__ = ["MaRsiStrategy"]
 
 @register("ma_rsi")
 class MaRsiStrategy(Strategy):
+    def __init__(self, **params):
+        super().__init__(**params)
+        # 파라미터는 생성 시 1회 해석(틱마다 dict 조회/형변환 없음)
+        self.sw = int(params.get("short_window", 7))
+        self.lw = int(params.get("long_window", 25))
+        self.rsi_n = int(params.get("rsi_period", 14))
+        self.rsi_buy = float(params.get("rsi_buy", 30))
+        self.rsi_sell = float(params.get("rsi_sell", 70))
+        self.min_hist = max(self.sw, self.lw, self.rsi_n) + 2  # 직전 캔들 비교 여유분
+
     def name(self) -> str:
         return "ma_rsi"
 
     def min_history(self) -> int:
-        sw = int(self.params.get("short_window", 7))
-        lw = int(self.params.get("long_window", 25))
-        rsi = int(self.params.get("rsi_period", 14))
-        return max(sw, lw, rsi) + 2  # 직전 캔들 비교 여유분
+        return self.min_hist
 
     def compute_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
-        out = add_ema(df, int(self.params.get("short_window", 7)), "ma_short")
-        out = add_ema(out, int(self.params.get("long_window", 25)), "ma_long")
-        out = add_rsi(out, int(self.params.get("rsi_period", 14)), "rsi")
+        add_ema(df, self.sw, "ma_short", copy=False)
+        add_ema(df, self.lw, "ma_long", copy=False)
+        add_rsi(df, self.rsi_n, "rsi", copy=False)
+        return df
+
+    def update_last(self, df: pd.DataFrame, row):
+        if len(df) < 2:
+            return None
+        key = self._last_closed_key(df)
+        if self._inc_key != key and self._inc is not None and len(df) >= 3 \
+                and self._inc_key == self._last_closed_key(df, -3):
+            # 1바 전진(롤오버): 새로 마감된 종가로 상태를 O(1) 확정
+            x_closed = float(df["close"].iat[-2])
+            for st in self._inc:
+                st.push(x_closed)
+            self._inc_key = key
+        if self._inc_key != key:
+            ms, ml = df["ma_short"].iat[-2], df["ma_long"].iat[-2]
+            if pd.isna(ms) or pd.isna(ml) or pd.isna(df["rsi"].iat[-2]):
+                return None
+            closes = df["close"].to_numpy(dtype="float64")[:-1]
+            self._inc = (
+                EmaState(self.sw, ms),
+                EmaState(self.lw, ml),
+                WilderRsiState.from_closes(closes, self.rsi_n),
+            )
+            self._inc_key = key
+        es, el, rs = self._inc
+        x = float(row["close"])
+        return {"ma_short": es.peek(x), "ma_long": el.peek(x), "rsi": rs.peek(x)}
+
+    def signal_breakpoints(self, df: pd.DataFrame):
+        # 교차(ma_short == ma_long), RSI 매수/매도 임계, 직전 종가(RSI 분기점) — 사이 구간에선 신호 불변
+        if self._inc is None or self._inc_key != self._last_closed_key(df):
+            return None
+        es, el, rs = self._inc
+        pts = [
+            EmaState.cross_price(es, el),
+            rs.price_for(self.rsi_buy),
+            rs.price_for(self.rsi_sell),
+            rs.last_close,
+        ]
+        return [p for p in pts if p is not None]
+
+    def vectorized_signals(self, df: pd.DataFrame) -> np.ndarray:
+        # generate_signal과 같은 규칙을 전 구간에 벡터로: 바 i는 (i-1, i) 두 행으로 판단
+        ms = df["ma_short"].to_numpy(dtype=np.float64)
+        ml = df["ma_long"].to_numpy(dtype=np.float64)
+        rsi = df["rsi"].to_numpy(dtype=np.float64)[1:]
+        out = np.zeros(len(df), dtype=np.int8)
+        if len(df) < 2:
+            return out
+        with np.errstate(invalid="ignore"):
+            buy = (ms[:-1] <= ml[:-1]) & (ms[1:] > ml[1:]) & (rsi < self.rsi_buy)
+            sell = (ms[:-1] >= ml[:-1]) & (ms[1:] < ml[1:]) & (rsi > self.rsi_sell)
+        out[1:] = np.where(buy, 1, np.where(sell, -1, 0))
+        out[:self.min_hist - 1] = 0      # generate_signal의 최소 히스토리 조건
         return out
 
     def generate_signal(self, df: pd.DataFrame):
-        if len(df) < self.min_history(): 
+        if len(df) < self.min_hist:
             return None
-        rsi_buy = float(self.params.get("rsi_buy", 30))
-        rsi_sell = float(self.params.get("rsi_sell", 70))
-        latest, prev = df.iloc[-1], df.iloc[-2]
+        # 마지막 두 행만 ndarray로 직접 읽기(iloc 행 Series 생성/dtype 추론 없음)
+        ms = df["ma_short"].to_numpy()[-2:]
+        ml = df["ma_long"].to_numpy()[-2:]
+        rsi = df["rsi"].to_numpy()[-1]
 
-        if any(pd.isna(prev[["ma_short","ma_long"]])) or pd.isna(latest["rsi"]):
+        if math.isnan(ms[0]) or math.isnan(ml[0]) or math.isnan(rsi):
             return None
 
-        if prev["ma_short"] <= prev["ma_long"] and latest["ma_short"] > latest["ma_long"] and latest["rsi"] < rsi_buy:
+        if ms[0] <= ml[0] and ms[1] > ml[1] and rsi < self.rsi_buy:
             return "BUY"
 
-        if prev["ma_short"] >= prev["ma_long"] and latest["ma_short"] < latest["ma_long"] and latest["rsi"] > rsi_sell:
+        if ms[0] >= ml[0] and ms[1] < ml[1] and rsi > self.rsi_sell:
             return "SELL"
         return None
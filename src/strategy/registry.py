@@ -1,8 +1,15 @@
+import importlib
 from typing import Dict, Type
 from .base import Strategy
 
 REGISTRY: Dict[str, Type[Strategy]] = {}
 
+# 전략명 → 정의 모듈. create_strategy가 첫 사용 시에만 import(설정에 없는 전략은 로드하지 않음)
+STRATEGY_MODULES: Dict[str, str] = {
+    "ma_rsi": "src.strategy.ma_rsi",
+    "bb_breakout": "src.strategy.bbands_breakout",
+}
+
 def register(name: str):
     """데코레이터: 전략을 이름으로 등록"""
     def deco(cls: Type[Strategy]):
@@ -13,6 +20,8 @@ def register(name: str):
     return deco
 
 def create_strategy(name: str, **params) -> Strategy:
+    if name not in REGISTRY and name in STRATEGY_MODULES:
+        importlib.import_module(STRATEGY_MODULES[name])   # import 시 @register로 등록됨
     if name not in REGISTRY:
-        raise ValueError(f"미등록 전략: {name}. 등록된 전략: {list(REGISTRY.keys())}")
+        raise ValueError(f"미등록 전략: {name}. 등록된 전략: {sorted(set(REGISTRY) | set(STRATEGY_MODULES))}")
     return REGISTRY[name](**params)
@@ -1,12 +1,10 @@
 import json
 from pathlib import Path
 from typing import Dict, Any, List
+import numpy as np
 import pandas as pd
 
-from src.strategy.registry import create_strategy  # noqa
-# 전략 모듈 import 해서 레지스트리에 등록(사이드 이펙트)
-from src.strategy import ma_rsi as _m1  # noqa
-from src.strategy import bbands_breakout as _m2  # noqa
+from src.strategy.registry import create_strategy  # 전략 모듈은 설정에 쓰인 것만 첫 생성 시 import
 
 class StrategyRunner:
     def __init__(self, cfg):
@@ -22,6 +20,21 @@ class StrategyRunner:
 
     def compute(self, symbol: str, df: pd.DataFrame):
         st = self.strategies[symbol]
-        df2 = st.compute_indicators(df)
+        df2 = st.compute_indicators(df.copy())   # 호출자 df 보존(지표는 제자리 추가)
         signal = st.generate_signal(df2)
         return df2, signal
+
+    def signal_events(self, symbol: str, df: pd.DataFrame):
+        """
+        백테스트용: 전체 기간 신호를 1패스로 계산해 이벤트 바만 반환 → (행 위치 배열, 신호 배열 +1/-1)
+        - 전략이 vectorized_signals를 지원하지 않으면 바마다 generate_signal(O(N) 호출)로 폴백
+        """
+        st = self.strategies[symbol]
+        df2 = st.compute_indicators(df.copy())
+        sig = st.vectorized_signals(df2)
+        if sig is None:
+            m = {"BUY": 1, "SELL": -1}
+            sig = np.fromiter((m.get(st.generate_signal(df2.iloc[:i + 1]), 0) for i in range(len(df2))),
+                              dtype=np.int8, count=len(df2))
+        idx = np.flatnonzero(sig)
+        return idx, sig[idx]
@@ -10,8 +10,14 @@ OrderManager: 주문/주문리스트(OCO) 상태를 파일(JSON)로 관리하는
 입출력/연결
 -----------
 - 입력(기록): market/limit 체결 응답(dict), OCO 생성 응답(dict)
-- 동기화: src.exchange.orders.get_order(), get_order_list(), cancel_order_list()
+- 동기화: src.exchange.account.get_open_orders(), src.exchange.orders.get_order(), get_order_list(), cancel_order_list()
 - 출력: state JSON 파일(data/orders_state.json 기본) + in-memory 상태
+- 저장: persist()는 변경된 항목만 append-only 저널(<state>.jsonl)에 1줄씩 추가(O(Δ))
+        스냅샷 전체 재작성은 checkpoint()(compaction 주기/종료 시)에서만
+        시작 시 스냅샷 로드 → 저널 replay
+- state_path가 .db/.sqlite/.sqlite3면 SQLite(WAL) 저장소 사용: persist()가 변경 행만 트랜잭션 1회로 반영
+  (다중 프로세스 동시 읽기/단일 writer, 저널/스냅샷 파일 없음)
+  DB가 비어 있고 같은 이름의 .json 스냅샷이 있으면 최초 1회 이관
 
 데이터 구조(JSON)
 ------------------
@@ -56,21 +62,22 @@ OrderManager: 주문/주문리스트(OCO) 상태를 파일(JSON)로 관리하는
 """
 
 from __future__ import annotations
-import os, json, time
+import os, time, copy, hashlib, atexit, threading, mmap
 from typing import Dict, Any, Optional, Tuple, List
+from concurrent.futures import ThreadPoolExecutor
 
 from src.exchange.orders import (
     get_order, get_order_list, cancel_order_list
 )
+from src.exchange.account import get_open_orders
+from src.data.journal import Journal
+from src.data.sqlite_store import SqliteStore, SQLITE_SUFFIXES
+from src.data import jsonio
+from src.data.atomic import StaleStateError, atomic_write_json
 
 def _now_ms() -> int:
     return int(time.time() * 1000)
 
-def _ensure_dir(p: str) -> None:
-    d = os.path.dirname(p)
-    if d and not os.path.exists(d):
-        os.makedirs(d, exist_ok=True)
-
 DEFAULT_STATE = {
     "version": 1,
     "entries": {},
@@ -78,6 +85,15 @@ DEFAULT_STATE = {
     "active_by_symbol": {},
     "saved_at": 0
 }
+_SECTIONS = ("entries", "ocolists", "active_by_symbol")   # 저널 op 이름 = 섹션 이름
+# OCO 동기화 조회 동시 실행 풀 — 리스트 K개의 REST 지연(K·RTT)을 겹쳐 ≈ RTT로
+SYNC_WORKERS = 8
+_SYNC_EXEC = ThreadPoolExecutor(max_workers=SYNC_WORKERS, thread_name_prefix="om-sync")
+
+_TERMINAL = frozenset({"FILLED", "CANCELED", "EXPIRED", "REJECTED"})   # 더 이상 바뀌지 않는 주문 상태
+# sync_open_entries가 갱신하는 (엔트리 필드, 응답 필드)
+_ENTRY_SYNC_FIELDS = (("status", "status"), ("executedQty", "executedQty"),
+                      ("cummulativeQuoteQty", "cummulativeQuoteQty"), ("price", "price"), ("ts", "updateTime"))
 
 class OrderManager:
     """
@@ -89,60 +105,274 @@ class OrderManager:
     - record_oco_attached(resp, group_id): OCO 생성 결과 기록(+심볼 활성 OCO 업데이트)
     - sync_open_entries(): entries 상태 최신화(NEW/PARTIALLY_FILLED → FILLED 등)
     - sync_open_ocolists(): OCO 상태 최신화(실행/완료/취소 감지)
-    - persist(): JSON 저장, reset(): 초기화
+    - persist(force): 변경분 저널 기록(persist_debounce_s 내 호출은 합침), checkpoint(): 스냅샷 저장, reset(): 초기화
     - get_active_oco_ids(symbol): 활성 OCO 리스트 id 배열
+    - has_active_oco(symbol): 활성 OCO 존재 여부(bool)
+    - compact_every / compact_interval_s: 저널 → 스냅샷 compaction 주기
+    - pretty=True: 스냅샷을 사람이 읽기 쉬운 indent=2로 저장(디버그용), 기본 compact
+    - read_only=True: 스냅샷+저널을 메모리에서만 재구성(checkpoint/저널 비움/atexit 등록/손상 파일 이동 없음),
+      persist/checkpoint 호출은 RuntimeError
     """
 
-    def __init__(self, state_path: str = "data/orders_state.json") -> None:
+    def __init__(self, state_path: str = "data/orders_state.json", *,
+                 compact_every: int = 500, compact_interval_s: float = 600.0,
+                 paranoid: bool = False, persist_debounce_s: float = 0.2, pretty: bool = False,
+                 read_only: bool = False) -> None:
         self.state_path = state_path
+        self.read_only = read_only
+        self.pretty = pretty              # True면 스냅샷을 indent=2로(디버그용), 기본 compact
+        self.paranoid = paranoid          # True면 스냅샷 rename 전 read-back 해시 검증
+        self.persist_debounce_s = persist_debounce_s   # 이 간격 내 persist()는 합쳐서 다음 호출에 기록
+        self._last_persist = 0.0
+        self.compact_every = compact_every
+        self.compact_interval_s = compact_interval_s
+        self._journal = Journal(state_path + ".jsonl")
+        self._db = SqliteStore(state_path, _SECTIONS) if state_path.endswith(SQLITE_SUFFIXES) else None
+        self._dirty: Dict[str, set] = {s: set() for s in _SECTIONS}
+        self._last_compact = time.monotonic()
+        self._prev_sha: Optional[str] = None   # 마지막으로 로드/저장한 스냅샷 바이트 해시(None=파일 없음)
         self.state: Dict[str, Any] = self._load_or_init(state_path)
+        if self._replay_journal() and not read_only:
+            self.checkpoint()
+        self._reindex()
+        if not read_only:
+            atexit.register(self._flush_at_exit)   # close() 없이 종료돼도 미기록 변경분 저널에 남김
 
     # ------------------
     # 저장/로드/초기화
     # ------------------
     def _load_or_init(self, path: str) -> Dict[str, Any]:
+        if self._db is not None:
+            return self._load_db(path)
         if os.path.exists(path):
             try:
-                with open(path, "r", encoding="utf-8") as f:
-                    obj = json.load(f)
+                # mmap으로 페이지캐시를 직접 파싱/해시(파일 크기만큼의 bytes 복사 없음), 빈 파일은 ValueError → 손상 처리
+                with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as raw:
+                        obj = jsonio.loads(raw)
+                        self._prev_sha = hashlib.sha256(raw).hexdigest()
                 # 필수 키 보정
                 for k, v in DEFAULT_STATE.items():
                     if k not in obj:
                         obj[k] = v if k != "saved_at" else 0
                 return obj
             except Exception:
-                # 손상 시 백업 후 초기화
-                try:
-                    os.rename(path, path + f".corrupt.{_now_ms()}")
-                except Exception:
-                    pass
-        return DEFAULT_STATE.copy()
+                # 손상 시 백업 후 초기화(읽기 전용이면 파일은 그대로 두고 빈 상태로)
+                if not self.read_only:
+                    try:
+                        os.rename(path, path + f".corrupt.{_now_ms()}")
+                    except Exception:
+                        pass
+        return copy.deepcopy(DEFAULT_STATE)
+
+    def _load_db(self, path: str) -> Dict[str, Any]:
+        obj = self._db.load()
+        if obj is None:
+            src = os.path.splitext(path)[0] + ".json"
+            if os.path.exists(src):
+                # 기존 JSON 스냅샷(+저널) 1회 이관 — close()가 저널을 스냅샷에 합친 뒤 그 상태를 복사
+                # (읽기 전용이면 이관 없이 JSON 상태만 메모리로)
+                old = OrderManager(src, read_only=self.read_only)
+                old.close()
+                obj = old.state
+                if not self.read_only:
+                    self._db.replace_all(obj)
+            else:
+                obj = copy.deepcopy(DEFAULT_STATE)
+        for k, v in DEFAULT_STATE.items():
+            if k not in obj:
+                obj[k] = v if k != "saved_at" else 0
+        return obj
+
+    def _replay_journal(self) -> int:
+        """저널 레코드(섹션 단위 upsert/delete, 멱등)를 스냅샷 위에 재적용. 반환: 적용 건수"""
+        n = 0
+        for rec in self._journal.replay():
+            sec, d = rec.get("op"), rec.get("data") or {}
+            if sec not in _SECTIONS or "k" not in d:
+                continue
+            if d.get("v") is None:
+                self.state[sec].pop(d["k"], None)
+            else:
+                self.state[sec][d["k"]] = d["v"]
+            n += 1
+        return n
 
-    def persist(self) -> None:
+    def _touch(self, section: str, key: str) -> None:
+        """변경 표시 — 다음 persist()에서 해당 항목만 저널에 기록"""
+        self._dirty[section].add(key)
+
+    def _reindex(self) -> None:
+        """
+        state에서 메모리 색인 재구성(로드/replay/reset/교체 후)
+        - _open_cids: 종결 상태가 아닌 엔트리 cid 집합 — sync_open_entries가 이것만 순회
+        - _active: 심볼별 활성 OCO id 순서 보존 집합(dict[id, None]) — 추가/제거 O(1), 파일에는 list로 기록
+        - _active_symbols: 활성 OCO가 1개 이상인 심볼 집합 — 진입 가드(has_active_oco)용
+        """
+        self._open_cids = {cid for cid, e in self.state["entries"].items() if e.get("status") not in _TERMINAL}
+        self._active = {sym: dict.fromkeys(rec.get("active_oco_ids", []))
+                        for sym, rec in self.state["active_by_symbol"].items()}
+        self._active_symbols = {sym for sym, d in self._active.items() if d}
+
+    def persist(self, force: bool = False) -> None:
+        """
+        변경된 항목만 저널에 1줄씩 추가(O(Δ)).
+        - 직전 기록 후 persist_debounce_s 이내 호출은 건너뜀(변경분은 _dirty에 남아 다음 호출에 합쳐짐)
+        - force=True: 디바운스 무시 + 저널 fsync(OCO 부착 직후 등 반드시 영속화할 때)
+        compact_every 건 또는 compact_interval_s 경과 시 checkpoint()로 compaction.
+        """
+        if self.read_only:
+            raise RuntimeError(f"read-only OrderManager: {self.state_path}")
+        now = time.monotonic()
+        if not force and now - self._last_persist < self.persist_debounce_s:
+            return
+        self._last_persist = now
+        records = self._drain_dirty()
+        if self._db is not None:
+            self._db.write(records)       # 커밋 = 영속화(compaction 불필요)
+            return
+        cnt = self._journal.extend(records)
+        if cnt >= self.compact_every or now - self._last_compact >= self.compact_interval_s:
+            try:
+                self.checkpoint()
+            except StaleStateError as e:
+                # 변경분은 이미 저널에 있음 → 스냅샷만 다음 주기로 미루고 저널 기록은 계속
+                print(f"[warn] persist: checkpoint deferred, journaling continues: {e}")
+                self._last_compact = now
+                self._journal.flush()
+        elif force:
+            self._journal.flush()
+
+    def _drain_dirty(self) -> List[tuple]:
+        """_dirty를 비우고 (섹션, {"k", "v"}) 레코드 목록으로 반환(v=None이면 삭제)"""
+        records = []
+        for sec in _SECTIONS:
+            keys, self._dirty[sec] = self._dirty[sec], set()
+            for k in keys:
+                records.append((sec, {"k": k, "v": self.state[sec].get(k)}))
+        return records
+
+    def _rebase(self) -> None:
+        """
+        다른 writer가 바꾼 디스크 스냅샷을 다시 읽고 내 저널을 그 위에 재적용(키 단위로 내 변경이 우선)
+        - 미기록 변경분은 먼저 저널에 넣어 재적용 대상에 포함
+        """
+        self._journal.extend(self._drain_dirty())
+        self._journal.flush()
+        self._prev_sha = None
+        self.state = self._load_or_init(self.state_path)
+        self._replay_journal()
+        self._reindex()
+
+    def _flush_at_exit(self) -> None:
+        try:
+            self.persist(force=True)
+            self._journal.close()
+            if self._db is not None:
+                self._db.close()
+        except Exception as e:
+            print(f"[warn] order state flush at exit failed: {e}")
+
+    def checkpoint(self, *, rebase: bool = True) -> None:
+        """
+        스냅샷 전체 원자적 저장(fsync + os.replace) 후 저널 비움 — 종료 시/주기적으로만
+        - 저널 첫 줄에 {"op": "checkpoint", path, sha256, bytes} 기록(복구 시 마지막 정상 스냅샷 감사용, replay는 무시)
+        - 디스크 스냅샷이 마지막 로드/저장 이후 바뀌었으면(다른 프로세스가 씀) 덮어쓰지 않음
+          rebase=True면 _rebase() 후 1회 재시도, 그래도(또는 rebase=False면) StaleStateError
+          (저널/미기록 변경분은 그대로 남음)
+        - rebase=False: 상태를 통째 교체하는 호출(reset/save_state)용 — 디스크 내용과 합치지 않음
+        """
+        if self.read_only:
+            raise RuntimeError(f"read-only OrderManager: {self.state_path}")
         self.state["saved_at"] = _now_ms()
-        _ensure_dir(self.state_path)
-        tmp = self.state_path + ".tmp"
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(self.state, f, ensure_ascii=False, indent=2)
-        os.replace(tmp, self.state_path)
+        if self._db is not None:
+            # SQLite: 전체 상태로 테이블 교체(트랜잭션 1회) — reset/save_state 등 통째 교체용
+            self._db.replace_all(self.state)
+            for sec in _SECTIONS:
+                self._dirty[sec].clear()
+            self._last_compact = time.monotonic()
+            return
+        try:
+            sha, nbytes = atomic_write_json(self.state_path, self.state, pretty=self.pretty, paranoid=self.paranoid,
+                                             check_prev=True, expected_prev_sha=self._prev_sha)
+        except StaleStateError as e:
+            if not rebase:
+                print(f"[warn] checkpoint aborted: {e}")
+                raise
+            print(f"[warn] checkpoint stale, rebasing on disk snapshot: {e}")
+            self._rebase()
+            self.state["saved_at"] = _now_ms()
+            sha, nbytes = atomic_write_json(self.state_path, self.state, pretty=self.pretty, paranoid=self.paranoid,
+                                             check_prev=True, expected_prev_sha=self._prev_sha)
+        self._prev_sha = sha
+        for sec in _SECTIONS:
+            self._dirty[sec].clear()
+        self._journal.truncate()
+        self._journal.append("checkpoint", {"path": self.state_path, "sha256": sha, "bytes": nbytes})
+        self._last_compact = time.monotonic()
+
+    def _release(self) -> None:
+        """쓰기 없이 자원만 반납(atexit 해제, 저널/DB 핸들 닫기)"""
+        atexit.unregister(self._flush_at_exit)
+        self._journal.close()
+        if self._db is not None:
+            self._db.close()
+
+    def close(self) -> None:
+        """종료 시 호출: 남은 변경분 포함 스냅샷 저장(스냅샷 충돌 시 변경분은 저널에 남기고 예외 없이 종료)"""
+        if self.read_only:
+            self._release()
+            return
+        atexit.unregister(self._flush_at_exit)
+        if self._db is not None:
+            self.persist(force=True)      # 변경 행만 반영(전체 재작성 불필요)
+            self._db.write((), meta={"saved_at": _now_ms()})
+            self._db.close()
+            return
+        try:
+            self.checkpoint()
+        except StaleStateError as e:
+            print(f"[warn] close: snapshot not written, changes kept in journal: {e}")
+            self._journal.extend(self._drain_dirty())
+        self._journal.close()
 
     def reset(self) -> None:
         """모든 상태 초기화(테스트 리셋용)."""
-        self.state = DEFAULT_STATE.copy()
-        self.persist()
+        self.state = copy.deepcopy(DEFAULT_STATE)
+        self._reindex()
+        self.checkpoint(rebase=False)
 
     # ------------------
     # 조회/헬퍼
     # ------------------
     def get_active_oco_ids(self, symbol: str) -> List[str]:
-        rec = self.state["active_by_symbol"].get(symbol, {})
-        return list(rec.get("active_oco_ids", []))
+        return list(self._active.get(symbol, ()))
+
+    def has_active_oco(self, symbol: str) -> bool:
+        """활성 OCO 존재 여부만 — 목록 복사 없음(신호마다 호출되는 진입 가드용)"""
+        return symbol in self._active_symbols
+
+    def _add_active_oco(self, symbol: str, olid: str, now: Optional[int] = None) -> None:
+        d = self._active.setdefault(symbol, {})
+        d[olid] = None
+        self._active_symbols.add(symbol)
+        self._write_active(symbol, now)
+
+    def _drop_active_oco(self, symbol: str, olid: str, now: Optional[int] = None) -> None:
+        """활성 목록에 있을 때만 제거/기록(없으면 no-op)"""
+        d = self._active.get(symbol)
+        if d is not None and d.pop(olid, 0) is None:
+            if not d:
+                self._active_symbols.discard(symbol)
+            self._write_active(symbol, now)
 
-    def _set_active_oco(self, symbol: str, ids: List[str]) -> None:
+    def _write_active(self, symbol: str, now: Optional[int]) -> None:
+        """색인 → state(JSON 스키마는 기존대로 list). now: 호출측 작업 시각(ms), None이면 현재 시각"""
         self.state["active_by_symbol"][symbol] = {
-            "active_oco_ids": ids,
-            "updated": _now_ms()
+            "active_oco_ids": list(self._active[symbol]),
+            "updated": _now_ms() if now is None else now
         }
+        self._touch("active_by_symbol", symbol)
 
     # ------------------
     # 기록(엔트리/ OCO)
@@ -174,6 +404,11 @@ class OrderManager:
             "ts": r.get("transactTime") or _now_ms(),
             "group_id": group_id or cid
         }
+        self._touch("entries", cid)
+        if r.get("status") in _TERMINAL:
+            self._open_cids.discard(cid)
+        else:
+            self._open_cids.add(cid)
         return cid
 
     def record_oco_attached(self, oco_resp: Dict[str, Any], group_id: Optional[str] = None) -> str:
@@ -184,40 +419,33 @@ class OrderManager:
         r = oco_resp
         olid = str(r["orderListId"])
         sym = r["symbol"]
+        now = _now_ms()
+        rep_map = {rep.get("orderId"): rep for rep in r.get("orderReports", [])}   # 1회 색인(sync_open_ocolists와 동일)
         self.state["ocolists"][olid] = {
             "symbol": sym,
             "orderListId": r["orderListId"],
             "listClientOrderId": r.get("listClientOrderId"),
             "listStatusType": r.get("listStatusType"),
             "listOrderStatus": r.get("listOrderStatus"),
-            "status_ts": r.get("transactionTime") or _now_ms(),
+            "status_ts": r.get("transactionTime") or now,
             "group_id": group_id or r.get("listClientOrderId"),
-            "legs": [
-                {
-                    "orderId": o.get("orderId"),
-                    "clientOrderId": o.get("clientOrderId"),
-                    "type": orp.get("type") if (orp := self._find_order_report(r, o.get("orderId"))) else None,
-                    "price": orp.get("price") if orp else None,
-                    "stopPrice": orp.get("stopPrice") if orp else "",
-                    "status": orp.get("status") if orp else "NEW",
-                    "timeInForce": orp.get("timeInForce") if orp else None,
-                }
-                for o in r.get("orders", [])
-            ],
+            "legs": [self._new_leg(o, rep_map.get(o.get("orderId"))) for o in r.get("orders", [])],
         }
+        self._touch("ocolists", olid)
         # 심볼 활성 OCO 업데이트
-        ids = self.get_active_oco_ids(sym)
-        if olid not in ids:
-            ids.append(olid)
-        self._set_active_oco(sym, ids)
+        self._add_active_oco(sym, olid, now)
         return olid
 
     @staticmethod
-    def _find_order_report(oco_resp: Dict[str, Any], order_id: int | None) -> Optional[Dict[str, Any]]:
-        for rep in oco_resp.get("orderReports", []):
-            if rep.get("orderId") == order_id:
-                return rep
-        return None
+    def _new_leg(o: Dict[str, Any], rep: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """OCO 응답의 orders 항목 + 대응 orderReport(없으면 None) → leg 레코드"""
+        leg = {"orderId": o.get("orderId"), "clientOrderId": o.get("clientOrderId")}
+        if rep is None:
+            leg.update(type=None, price=None, stopPrice="", status="NEW", timeInForce=None)
+        else:
+            leg.update(type=rep.get("type"), price=rep.get("price"), stopPrice=rep.get("stopPrice"),
+                       status=rep.get("status"), timeInForce=rep.get("timeInForce"))
+        return leg
 
     # ------------------
     # 동기화
@@ -225,25 +453,43 @@ class OrderManager:
     def sync_open_entries(self) -> Dict[str, int]:
         """
         역할: entries 중 아직 열려 있을 수 있는 주문의 상태를 최신화.
-        - FILLED/EXPIRED/REJECTED/CANCELED는 그대로 기록만 갱신(삭제는 하지 않음; 감사용)
+        - FILLED/EXPIRED/REJECTED/CANCELED로 확정된 주문은 조회하지 않음(기록은 감사용으로 유지)
+        - 심볼별 openOrders 1회 조회로 열린 주문을 일괄 갱신(요청 수 N → 심볼 수)
+          목록에 없는 주문(체결/취소 등으로 닫힘)만 get_order 개별 조회
         - 반환: {"checked": N}
         """
         entries = self.state["entries"]
+        by_sym: Dict[str, List[str]] = {}
+        for cid in list(self._open_cids):
+            e = entries.get(cid)
+            if e is None or e.get("status") in _TERMINAL:
+                self._open_cids.discard(cid)
+                continue
+            by_sym.setdefault(e.get("symbol"), []).append(cid)
         n = 0
-        for cid, e in list(entries.items()):
-            symbol = e.get("symbol")
-            order_id = e.get("orderId")
-            try:
-                r = get_order(symbol, orderId=order_id, origClientOrderId=cid)
-                e["status"] = r.get("status", e.get("status"))
-                e["executedQty"] = r.get("executedQty", e.get("executedQty"))
-                e["cummulativeQuoteQty"] = r.get("cummulativeQuoteQty", e.get("cummulativeQuoteQty"))
-                e["price"] = r.get("price", e.get("price"))
-                e["ts"] = r.get("updateTime", e.get("ts"))
+        for symbol, cids in by_sym.items():
+            by_cid: Dict[str, Any] = {}
+            if len(cids) > 1:             # 1건뿐이면 개별 조회가 더 쌈(openOrders weight 6 > order 4)
+                try:
+                    by_cid = {r.get("clientOrderId"): r for r in get_open_orders(symbol)}
+                except Exception:
+                    pass                  # 일괄 조회 실패 → 전부 개별 조회로 폴백
+            for cid in cids:
+                e = entries[cid]
+                r = by_cid.get(cid)
+                if r is None:
+                    try:
+                        r = get_order(symbol, orderId=e.get("orderId"), origClientOrderId=cid)
+                    except Exception:
+                        # 조회 실패는 무시(일시 오류/삭제된 주문 등)
+                        continue
+                upd = {k: r.get(rk, e.get(k)) for k, rk in _ENTRY_SYNC_FIELDS}
+                if any(e.get(k) != v for k, v in upd.items()):
+                    e.update(upd)
+                    self._touch("entries", cid)   # 실제 바뀐 엔트리만 저널에 기록(무변화 조회는 0바이트)
+                if e["status"] in _TERMINAL:
+                    self._open_cids.discard(cid)
                 n += 1
-            except Exception:
-                # 조회 실패는 무시(일시 오류/삭제된 주문 등)
-                pass
         return {"checked": n}
 
     def sync_open_ocolists(self) -> Dict[str, int]:
@@ -251,17 +497,27 @@ class OrderManager:
         역할: OCO 상태 최신화 및 비활성 정리.
         - listStatusType/listOrderStatus 갱신
         - 모든 leg가 종료되면 active_by_symbol에서 제거
+        - 조회는 풀에서 동시에(총 지연 ≈ 가장 느린 1건, 빈도는 core RAW_LIMITER가 제한), 상태 반영은 순차
         """
         ocols = self.state["ocolists"]
+        now = _now_ms()                   # 이번 동기화의 active_by_symbol 갱신 시각(공통)
+        todo = []
+        for olid, o in ocols.items():
+            if self._is_list_inactive(o):
+                # 이미 종결된 리스트는 조회 생략(활성 목록에 남아 있으면 정리만)
+                self._drop_active_oco(o["symbol"], olid, now)
+            else:
+                todo.append((olid, o, _SYNC_EXEC.submit(get_order_list, orderListId=int(olid))))
         n = 0
-        for olid, o in list(ocols.items()):
+        for olid, o, fut in todo:
             sym = o["symbol"]
             try:
-                r = get_order_list(orderListId=int(olid))
+                r = fut.result()
             except Exception:
                 # 못 가져오면 일단 스킵
                 continue
 
+            before = self._list_sig(o)
             o["listStatusType"] = r.get("listStatusType", o.get("listStatusType"))
             o["listOrderStatus"] = r.get("listOrderStatus", o.get("listOrderStatus"))
             o["status_ts"] = r.get("transactionTime", o.get("status_ts"))
@@ -281,26 +537,31 @@ class OrderManager:
                     })
                 new_legs.append(leg)
             o["legs"] = new_legs
+            if self._list_sig(o) != before:
+                self._touch("ocolists", olid)     # 바뀐 리스트만 저널에 기록
             n += 1
 
             # 비활성 판단: legs 가 모두 종결 상태면 active 목록에서 제거
             if self._is_list_inactive(o):
-                ids = self.get_active_oco_ids(sym)
-                ids = [x for x in ids if x != str(olid)]
-                self._set_active_oco(sym, ids)
+                self._drop_active_oco(sym, olid, now)
 
         return {"checked": n}
 
+    @staticmethod
+    def _list_sig(ol: Dict[str, Any]) -> tuple:
+        """OCO 레코드의 동기화 대상 필드 서명(변경 감지용)"""
+        return (ol.get("listStatusType"), ol.get("listOrderStatus"), ol.get("status_ts"),
+                tuple(tuple(leg.items()) for leg in ol.get("legs", [])))
+
     @staticmethod
     def _is_list_inactive(ol: Dict[str, Any]) -> bool:
         """
         종료 판정: 모든 leg가 FILLED/CANCELED/EXPIRED/REJECTED 이면 비활성
         """
-        terminal = {"FILLED", "CANCELED", "EXPIRED", "REJECTED"}
         legs = ol.get("legs", [])
         if not legs:
             return False
-        return all((leg.get("status") in terminal) for leg in legs)
+        return all((leg.get("status") in _TERMINAL) for leg in legs)
 
     # ------------------
     # 유지보수/청소
@@ -310,28 +571,67 @@ class OrderManager:
         오래된 엔트리/리스트 메타를 정리(감사용). 기본 7일 유지.
         """
         cutoff = _now_ms() - keep_ms
-        e_del = 0
-        for cid, e in list(self.state["entries"].items()):
-            if (e.get("ts") or 0) < cutoff:
-                del self.state["entries"][cid]
-                e_del += 1
-        l_del = 0
-        for lid, o in list(self.state["ocolists"].items()):
-            if (o.get("status_ts") or 0) < cutoff:
-                del self.state["ocolists"][lid]
-                l_del += 1
-        return {"entries": e_del, "ocolists": l_del}
+        # 삭제 대상 키만 모은 뒤 pop(전체 items 복사 없음)
+        entries = self.state["entries"]
+        e_drop = [cid for cid, e in entries.items() if (e.get("ts") or 0) < cutoff]
+        for cid in e_drop:
+            entries.pop(cid, None)
+            self._touch("entries", cid)
+            self._open_cids.discard(cid)
+        ocols = self.state["ocolists"]
+        l_drop = [lid for lid, o in ocols.items() if (o.get("status_ts") or 0) < cutoff]
+        for lid in l_drop:
+            ocols.pop(lid, None)
+            self._touch("ocolists", lid)
+        return {"entries": len(e_drop), "ocolists": len(l_drop)}
 
 # ------------------
 # 모듈 레벨 헬퍼(선택)
 # ------------------
+# (경로, 읽기 전용)별 OrderManager 재사용 — 파일(스냅샷/저널)이 그대로면 재로드/재파싱 없음
+_MGR_POOL: Dict[Tuple[str, bool], Tuple[tuple, OrderManager]] = {}
+_MGR_LOCK = threading.Lock()
+
+def _file_stamp(path: str) -> tuple:
+    """(스냅샷, 저널, SQLite WAL)의 (mtime_ns, size) — 다른 쓰기 감지용"""
+    out = []
+    for p in (path, path + ".jsonl", path + "-wal"):
+        try:
+            st = os.stat(p)
+            out.append((st.st_mtime_ns, st.st_size))
+        except FileNotFoundError:
+            out.append(None)
+    return tuple(out)
+
+def _get_mgr(path: str, *, read_only: bool = False) -> OrderManager:
+    key = (path, read_only)
+    with _MGR_LOCK:
+        hit = _MGR_POOL.get(key)
+        if hit is not None:
+            if hit[0] == _file_stamp(path):
+                return hit[1]
+            # 다른 쓰기로 파일이 바뀜 → 옛 인스턴스는 디스크에 쓰지 않고 자원만 반납(save_state가 매번 스냅샷 저장)
+            hit[1]._release()
+        mgr = OrderManager(path, read_only=read_only)
+        _MGR_POOL[key] = (_file_stamp(path), mgr)
+        return mgr
+
 def load_state(path: str = "data/orders_state.json") -> Dict[str, Any]:
-    mgr = OrderManager(path)
-    return mgr.state
-
-def save_state(state: Dict[str, Any], path: str = "data/orders_state.json") -> None:
-    _ensure_dir(path)
-    tmp = path + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(state, f, ensure_ascii=False, indent=2)
-    os.replace(tmp, path)
+    """
+    읽기 전용 로드 — 저널은 메모리에서만 재적용(checkpoint/저널 비움/atexit 등록 없음)
+    - 풀에 캐시된 상태의 사본을 반환(호출자 수정이 다음 load_state에 새지 않음)
+    """
+    mgr = _get_mgr(path, read_only=True)
+    with _MGR_LOCK:
+        return copy.deepcopy(mgr.state)
+
+def save_state(state: Dict[str, Any], path: str = "data/orders_state.json", *, pretty: bool = False) -> None:
+    """state 스냅샷(사본)을 저장 — 이후 호출자가 state를 고쳐도 풀의 writer 상태는 그대로"""
+    state = copy.deepcopy(state)
+    mgr = _get_mgr(path)
+    with _MGR_LOCK:
+        mgr.pretty = pretty
+        mgr.state = state
+        mgr._reindex()
+        mgr.checkpoint(rebase=False)      # 상태 통째 교체 → 저널 delta가 아닌 스냅샷으로 기록(디스크와 합치지 않음)
+        _MGR_POOL[(path, False)] = (_file_stamp(path), mgr)
@@ -1,13 +1,14 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
-from typing import Optional, Dict, Any
+import functools
+from typing import Callable, Optional, Dict, Any, Tuple
 from decimal import Decimal
 
-from src.exchange.account import get_balances_map, get_symbol_assets
-from src.exchange.market import get_price, get_symbol_info
-from src.exchange.filters import extract_filters, normalize_qty, to_api_str
+from src.exchange.account import get_balances_map
+from src.exchange.market import get_price
+from src.exchange.filters import normalize_qty, to_api_str
 from src.order_executor import (
-    market_buy_by_quote, market_sell_qty, limit_sell
+    market_buy_by_quote, market_sell_qty, limit_sell, get_syminfo
 )
 from src.exchange.auto_oco import market_buy_then_attach_oco
 from src.trade.order_manager import OrderManager
@@ -21,6 +22,26 @@ DEFAULTS = {
     "auto_adjust": True,
 }
 
+# 알림 extra용 dict 재사용 풀 — fmt_order_msg가 즉시 문자열로 포맷하므로(참조 보관 없음) 반환 직후 재사용 안전
+# list.pop/append는 GIL 하에서 원자적 → 워커 스레드에서 호출돼도 같은 dict를 동시에 쓰지 않음
+_EXTRA_POOL: list[dict] = []
+
+def _get_extra(**kv) -> dict:
+    d = _EXTRA_POOL.pop() if _EXTRA_POOL else {}
+    d.update(kv)
+    return d
+
+def _release_extra(d: dict) -> None:
+    d.clear()
+    _EXTRA_POOL.append(d)
+
+def _notify_order(title: str, symbol: str, side: str, price, qty, extra: dict) -> None:
+    """주문 알림 1건 전송 후 extra를 풀에 반환"""
+    try:
+        notify(fmt_order_msg(title=title, symbol=symbol, side=side, price=price, qty=qty, extra=extra))
+    finally:
+        _release_extra(extra)
+
 class SignalRouter:
     """
     역할: 전략 신호('BUY'/'SELL')를 받아 주문 실행 + OCO 부착 + 알림 전송을 담당.
@@ -31,13 +52,43 @@ class SignalRouter:
         self.om = order_manager
         self.dry_run = dry_run
         self.allow_mainnet = allow_mainnet
+        # 심볼별 고정 BUY 호출(partial) + 알림용 (tp, sl) — register_strategy로 등록
+        self._buy_fn_by_symbol: Dict[str, Tuple[Callable[[], Dict[str, Any]], float, float]] = {}
+
+    def register_strategy(
+        self,
+        symbol: str,
+        *,
+        buy_quote_usdt: Optional[float] = None,
+        tp_pct: Optional[float] = None,
+        sl_pct: Optional[float] = None,
+        tif: Optional[str] = None,
+        auto_adjust: Optional[bool] = None,
+    ) -> None:
+        """
+        역할: 심볼의 BUY 파라미터(루프 불변)를 부팅 시 1회 머지/캐스팅해 partial로 고정
+        - 이후 handle_signal이 오버라이드 없이 호출되면 파라미터 머지/float 변환/kwargs 구성 없이 바로 호출
+        - dry_run/allow_mainnet도 등록 시점 값으로 고정(바꾸면 다시 등록)
+        """
+        _tp = float(tp_pct if tp_pct is not None else DEFAULTS["tp_pct"])
+        _sl = float(sl_pct if sl_pct is not None else DEFAULTS["sl_pct"])
+        fn = functools.partial(
+            market_buy_then_attach_oco, symbol,
+            quote_usdt=float(buy_quote_usdt if buy_quote_usdt is not None else DEFAULTS["buy_quote_usdt"]),
+            use_quote_order_qty=True,
+            tp_pct=_tp, sl_pct=_sl,
+            tif=tif if tif is not None else DEFAULTS["tif"],
+            auto_adjust=auto_adjust if auto_adjust is not None else DEFAULTS["auto_adjust"],
+            dry_run=self.dry_run, allow_mainnet=self.allow_mainnet,
+            wait_timeout_s=15.0, poll_s=0.5,
+        )
+        self._buy_fn_by_symbol[symbol] = (fn, _tp, _sl)
 
     # ----------------------------
     # 내부 헬퍼: 보유 베이스 수량 계산
     # ----------------------------
     def _free_base_qty(self, symbol: str) -> Decimal:
-        sx = get_symbol_info(symbol)
-        base, _ = get_symbol_assets(sx)
+        base = get_syminfo(symbol).base
         bmap = get_balances_map()
         return bmap.get(base, Decimal("0"))
 
@@ -45,12 +96,7 @@ class SignalRouter:
         """
         역할: 활성 OCO가 있거나 최근 엔트리가 살아있으면 신규 진입 차단
         """
-        active = self.om.state.active_by_symbol.get(symbol)
-        if not active:
-            return True
-        # 활성 OCO가 있으면 False
-        ocols = active.get("active_oco_ids", [])
-        return len(ocols) == 0
+        return not self.om.has_active_oco(symbol)
 
     # ----------------------------
     # 공개 API: BUY/SELL 라우팅
@@ -74,53 +120,49 @@ class SignalRouter:
         if not signal:
             return {"ok": True, "action": "NOOP"}
 
-        # 파라미터 머지
-        pq = buy_quote_usdt if buy_quote_usdt is not None else DEFAULTS["buy_quote_usdt"]
-        _tp = tp_pct if tp_pct is not None else DEFAULTS["tp_pct"]
-        _sl = sl_pct if sl_pct is not None else DEFAULTS["sl_pct"]
-        _tif = tif if tif is not None else DEFAULTS["tif"]
-        _adj = auto_adjust if auto_adjust is not None else DEFAULTS["auto_adjust"]
-
         if signal == "BUY":
             if not self.can_open_new_position(symbol):
                 notify(fmt_order_msg(title="SKIP BUY (active OCO exists)", symbol=symbol, side="BUY",
                                      price=None, qty=None, extra=meta))
                 return {"ok": False, "action": "SKIP_BUY_ACTIVE_OCO"}
 
-            # 시장가 진입 + OCO 자동 부착
-            res = market_buy_then_attach_oco(
-                symbol,
-                quote_usdt=float(pq),
-                use_quote_order_qty=True,     # 정밀도/잔돈 처리 안전
-                tp_pct=float(_tp),
-                sl_pct=float(_sl),
-                tif=_tif,
-                auto_adjust=_adj,
-                dry_run=self.dry_run,
-                allow_mainnet=self.allow_mainnet,
-                wait_timeout_s=15.0, poll_s=0.5,
-            )
+            # 시장가 진입 + OCO 자동 부착 — 등록된 심볼이고 오버라이드가 없으면 고정 partial 호출
+            spec = self._buy_fn_by_symbol.get(symbol)
+            if spec is not None and buy_quote_usdt is None and tp_pct is None and sl_pct is None \
+                    and tif is None and auto_adjust is None:
+                fn, _tp, _sl = spec
+                res = fn()
+            else:
+                # 파라미터 머지
+                pq = buy_quote_usdt if buy_quote_usdt is not None else DEFAULTS["buy_quote_usdt"]
+                _tp = tp_pct if tp_pct is not None else DEFAULTS["tp_pct"]
+                _sl = sl_pct if sl_pct is not None else DEFAULTS["sl_pct"]
+                res = market_buy_then_attach_oco(
+                    symbol,
+                    quote_usdt=float(pq),
+                    use_quote_order_qty=True,     # 정밀도/잔돈 처리 안전
+                    tp_pct=float(_tp),
+                    sl_pct=float(_sl),
+                    tif=tif if tif is not None else DEFAULTS["tif"],
+                    auto_adjust=auto_adjust if auto_adjust is not None else DEFAULTS["auto_adjust"],
+                    dry_run=self.dry_run,
+                    allow_mainnet=self.allow_mainnet,
+                    wait_timeout_s=15.0, poll_s=0.5,
+                )
             if res.get("ok"):
-                notify(fmt_order_msg(
-                    title="BUY+OCO OK",
-                    symbol=symbol, side="BUY",
-                    price=res.get("avg_fill_price"), qty=res.get("filled_qty"),
-                    extra={"tp_pct": _tp, "sl_pct": _sl, "dry_run": self.dry_run}
-                ))
-                return {"ok": True, "action": "BUY_OCO", **res}
+                _notify_order("BUY+OCO OK", symbol, "BUY", res.get("avg_fill_price"), res.get("filled_qty"),
+                              _get_extra(tp_pct=_tp, sl_pct=_sl, dry_run=self.dry_run))
+                res.update(ok=True, action="BUY_OCO")     # 결과 dict 재사용(복사 없이 필드만 덮어씀)
+                return res
             else:
-                notify(fmt_order_msg(
-                    title="BUY+OCO FAIL",
-                    symbol=symbol, side="BUY",
-                    price=None, qty=None,
-                    extra={"err": res.get("error"), "entry": res.get("entry")}
-                ))
-                return {"ok": False, "action": "BUY_OCO_FAIL", **res}
+                _notify_order("BUY+OCO FAIL", symbol, "BUY", None, None,
+                              _get_extra(err=res.get("error"), entry=res.get("entry")))
+                res.update(ok=False, action="BUY_OCO_FAIL")
+                return res
 
         elif signal == "SELL":
             # 보유 수량 전부(또는 일부) 시장가 청산 예시
-            sx = get_symbol_info(symbol)
-            ff = extract_filters(sx)
+            ff = get_syminfo(symbol).filters
             free_qty = self._free_base_qty(symbol)
             sell_qty = normalize_qty(free_qty, ff)
             qty_str = to_api_str(sell_qty, ff.get("stepQty"))
@@ -135,20 +177,10 @@ class SignalRouter:
                 dry_run=self.dry_run, allow_mainnet=self.allow_mainnet
             )
             if r.get("ok"):
-                notify(fmt_order_msg(
-                    title="SELL OK",
-                    symbol=symbol, side="SELL",
-                    price=None, qty=r.get("qty"),
-                    extra={"dry_run": self.dry_run}
-                ))
+                _notify_order("SELL OK", symbol, "SELL", None, r.get("qty"), _get_extra(dry_run=self.dry_run))
                 return {"ok": True, "action": "SELL", "sell": r}
             else:
-                notify(fmt_order_msg(
-                    title="SELL FAIL",
-                    symbol=symbol, side="SELL",
-                    price=None, qty=r.get("qty"),
-                    extra={"err": r.get("error")}
-                ))
+                _notify_order("SELL FAIL", symbol, "SELL", None, r.get("qty"), _get_extra(err=r.get("error")))
                 return {"ok": False, "action": "SELL_FAIL", "sell": r}
 
         else: